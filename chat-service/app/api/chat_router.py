@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Form, Depends
+import logging
 from app.domain.controller.chat_controller import ChatController
 from app.domain.model.chat_schema import ChatRequest, ChatResponse
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 controller = ChatController()
 
@@ -14,7 +17,7 @@ async def chat(
     
     - **message**: 사용자의 채팅 메시지
     """
-    print(f"🩷1 라우터 진입 - 메시지: {message}")
+    logger.debug("채팅 라우터 진입")
     return await controller.chat(message)
 
 
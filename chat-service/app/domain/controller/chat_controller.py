@@ -9,12 +9,11 @@ class ChatController:
         self.chat_service = ChatService()
 
     async def chat(self, message: str):
-        print(f"🩷2 컨트롤러 진입 - 메시지: {message}")
         try:
-            logger.info(f"❤️채팅 요청 수신: {message}")
+            logger.debug(f"채팅 요청 수신: {message}")
             response = await self.chat_service.chat(message)
-            logger.info(f"❤️채팅 응답 생성: {response}")
+            logger.debug(f"채팅 응답 생성: {response}")
             return response
         except Exception as e:
-            logger.error(f"⚠️채팅 처리 중 오류 발생: {str(e)}")
+            logger.error(f"채팅 처리 중 오류 발생: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
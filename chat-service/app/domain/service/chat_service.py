@@ -8,7 +8,6 @@ import logging
 logger = logging.getLogger(__name__)
 
 class ChatService:
-    print(f"🩷3 서비스 진입")
     def __init__(self):
         # 환경 변수 로드
         load_dotenv()
@@ -34,7 +33,7 @@ class ChatService:
         try:
             # 입력 메시지 전처리
             input_text = f"User: {message}\nAssistant:"
-            logger.info(f"입력 텍스트: {input_text}")
+            logger.debug(f"입력 텍스트: {input_text}")
             
             # 입력 메시지 토크나이징
             inputs = self.tokenizer.encode(
@@ -62,7 +61,7 @@ class ChatService:
             
             # 응답 디코딩
             response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-            logger.info(f"전체 응답: {response}")
+            logger.debug(f"전체 응답: {response}")
             
             # Assistant: 이후의 텍스트만 추출
             if "Assistant:" in response:
@@ -70,7 +69,7 @@ class ChatService:
             else:
                 response = response.replace(input_text, "").strip()
             
-            logger.info(f"최종 응답: {response}")
+            logger.debug(f"최종 응답: {response}")
             
             if not response:
                 response = "죄송합니다. 응답을 생성하지 못했습니다. 다시 시도해주세요."
@@ -0,0 +1,6 @@
+"""
+기반 계층
+- 공통 기능
+- 인프라스트럭처
+- 유틸리티
+""" 
\ No newline at end of file
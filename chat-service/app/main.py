@@ -1,15 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
-import sys
+from dotenv import load_dotenv
 from app.api.chat_router import router as chat_router
+from app.foundation.core.structured_logging import configure_logging
+from app.foundation.core.tracing import configure_tracing
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
+# 환경변수 로드 (.env 의 LOG_LEVEL/LOG_FORMAT 이 로깅 설정에 반영되도록 먼저 실행)
+load_dotenv()
+
+# 로깅 설정 (JSON, 큐 핸들러 + 백그라운드 출력 스레드)
+configure_logging("chat-service")
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
@@ -27,6 +28,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 트레이스 전파, Server-Timing, 게이트웨이 요청 마감(X-Request-Timeout-Ms) 적용
+configure_tracing(app, "chat-service")
+
 # 라우터 등록
 app.include_router(chat_router, prefix="/chat", tags=["chat"])
-print(f"🩷0 메인 진입")
\ No newline at end of file
+logger.info("Chat Service 라우터 등록 완료")
\ No newline at end of file
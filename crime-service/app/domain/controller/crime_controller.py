@@ -1,9 +1,13 @@
+import logging
+
 from app.domain.service.crime_preprocessor import CrimePreprocessor
 from app.domain.service.crime_visualizer import CrimeVisualizer
 from app.domain.model.crime_schema import CrimeSchema
 from app.domain.service.internal.crime_correlation import analyze_correlation, analyze_crime_correlation, get_interpretation_text, load_and_analyze
 from app.domain.service.internal.crime_map_create import CrimeMapCreator
 
+logger = logging.getLogger("crime_controller")
+
 class CrimeController:
     def __init__(self):
         self.dataset = CrimeSchema()
@@ -15,9 +19,9 @@ class CrimeController:
         self.preprocessor.preprocess(*args)
 
     def correlation(self): #상관계수 분석
-        print("Controller: Calling load_and_analyze for correlation analysis...")
+        logger.debug("Calling load_and_analyze for correlation analysis...")
         results = load_and_analyze(self)
-        print("Controller: Correlation analysis completed")
+        logger.debug("Correlation analysis completed")
         return results
     
     def get_correlation_results(self):
@@ -32,13 +36,13 @@ class CrimeController:
                 "result": result_map,
                 "message": "Crime map created successfully using visualizer"
             }
-            print(f"Controller: Crime map created successfully using visualizer")
+            logger.debug("Crime map created successfully using visualizer")
         except Exception as e:
             result = {
                 "status": "error",
                 "message": str(e)
             }
-            print(f"Controller: Failed to create crime map - {str(e)}")
+            logger.error(f"Failed to create crime map - {str(e)}")
         return result
 
     def draw_crime_circle_marker_map(self):
@@ -52,12 +56,12 @@ class CrimeController:
                 "result": result_map,
                 "message": "Crime Circle Marker map created successfully using visualizer"
             }
-            print(f"Controller: Crime Circle Marker map created successfully using visualizer")
+            logger.debug("Crime Circle Marker map created successfully using visualizer")
         except Exception as e:
             result = {
                 "status": "error",
                 "message": str(e)
             }
-            print(f"Controller: Failed to create Circle Marker map - {str(e)}")
+            logger.error(f"Failed to create Circle Marker map - {str(e)}")
         return result
         
@@ -5,6 +5,7 @@ from app.domain.model.reader_schema import ReaderSchema
 from sklearn import preprocessing
 from app.domain.model.google_map_schema import GoogleMapSchema
 import logging
+from app.foundation.core.tracing import traced
 
 logger = logging.getLogger("crime_service")
 
@@ -21,15 +22,16 @@ class CrimePreprocessor:
         self.police = None
         self.pop = None
     
+    @traced("crime_preprocess")
     def preprocess(self, *args) -> None:
-        print(f"------------모델 전처리 시작-----------")
+        logger.debug("------------모델 전처리 시작-----------")
         for i in list(args):
             self.save_object_to_csv(i)
         
       
     
     def create_matrix(self, fname) -> pd.DataFrame:
-        print(f"😎🥇🐰파일명 : {fname}")
+        logger.debug(f"😎🥇🐰파일명 : {fname}")
         self.reader.fname = fname
         if fname.endswith('csv'):
             return self.reader.csv_to_dframe()
@@ -37,8 +39,9 @@ class CrimePreprocessor:
             return self.reader.xls_to_dframe(header=2, usecols='B,D,G,J,N')
         return None
     
+    @traced()
     def save_object_to_csv(self, fname) -> None:
-        print(f"🌱save_csv 실행 : {fname}")
+        logger.debug(f"🌱save_csv 실행 : {fname}")
         full_name = os.path.join(self.stored_data, fname)
 
         if not os.path.exists(full_name) and fname == "cctv_in_seoul.csv":
@@ -55,23 +58,23 @@ class CrimePreprocessor:
             self.update_pop()
 
         else:
-            print(f"파일이 이미 존재합니다. {fname}")
+            logger.debug(f"파일이 이미 존재합니다. {fname}")
     
     def update_cctv(self) -> None:
-        print(f"------------ update_cctv 실행 ------------")
+        logger.debug("------------ update_cctv 실행 ------------")
         if self.cctv is not None:
             self.cctv = self.cctv.drop(['2013년도 이전', '2014년', '2015년', '2016년'], axis=1)
-            print(f"CCTV 데이터 헤드: {self.cctv.head()}")
+            logger.debug("CCTV 데이터 헤드: %s", self.cctv.head())
             self.cctv = self.cctv.rename(columns={'기관명': '자치구'})
             self.cctv.to_csv(os.path.join(self.stored_data, 'cctv_in_seoul.csv'), index=False)
     
     def update_crime(self) -> None:
-        print(f"------------ update_crime 실행 ------------")
+        logger.debug("------------ update_crime 실행 ------------")
         if self.crime is not None:
             station_names = []  # 경찰서 관서명 리스트
             for name in self.crime['관서명']:
                 station_names.append('서울' + str(name[:-1]) + '경찰서')
-            print(f"🔥💧경찰서 관서명 리스트: {station_names}")
+            logger.debug(f"🔥💧경찰서 관서명 리스트: {station_names}")
             
             station_addrs = []
             station_lats = []
@@ -80,19 +83,19 @@ class CrimePreprocessor:
             
             for name in station_names:
                 tmp = gmaps.geocode(name, language='ko')
-                print(f"""{name}의 검색 결과: {tmp[0].get("formatted_address")}""")
+                logger.debug(f"""{name}의 검색 결과: {tmp[0].get("formatted_address")}""")
                 station_addrs.append(tmp[0].get("formatted_address"))
                 tmp_loc = tmp[0].get("geometry")
                 station_lats.append(tmp_loc['location']['lat'])
                 station_lngs.append(tmp_loc['location']['lng'])
                 
-            print(f"🔥💧자치구 리스트: {station_addrs}")
+            logger.debug(f"🔥💧자치구 리스트: {station_addrs}")
             gu_names = []
             for addr in station_addrs:
                 tmp = addr.split()
                 tmp_gu = [gu for gu in tmp if gu[-1] == '구'][0]
                 gu_names.append(tmp_gu)
-            print(f"🔥💧자치구 리스트 2: {gu_names}")
+            logger.debug(f"🔥💧자치구 리스트 2: {gu_names}")
             self.crime['자치구'] = gu_names
 
             # 구 와 경찰서의 위치가 다른 경우 수작업
@@ -106,7 +109,7 @@ class CrimePreprocessor:
             self.crime.to_csv(os.path.join(self.stored_data, 'crime_in_seoul.csv'), index=False)
     
     def update_police(self) -> None:
-        print(f"------------ update_police 실행 ------------")
+        logger.debug("------------ update_police 실행 ------------")
         if self.crime is not None:
             crime = self.crime.groupby("자치구").sum().reset_index()
             crime = crime.drop(columns=["관서명"])
@@ -148,7 +151,7 @@ class CrimePreprocessor:
             self.police = police
     
     def update_pop(self) -> None:
-        print(f"------------ update_pop 실행 ------------")
+        logger.debug("------------ update_pop 실행 ------------")
         if self.pop is not None:
             self.pop = self.pop.rename(columns={
                 self.pop.columns[0]: '자치구',
@@ -169,10 +172,10 @@ class CrimePreprocessor:
                 cctv_pop = pd.merge(self.cctv, self.pop, on='자치구')
                 cor1 = np.corrcoef(cctv_pop['고령자비율'], cctv_pop['소계'])
                 cor2 = np.corrcoef(cctv_pop['외국인비율'], cctv_pop['소계'])
-                print(f'고령자비율과 CCTV의 상관계수 {str(cor1)} \n'
-                      f'외국인비율과 CCTV의 상관계수 {str(cor2)} ')
+                logger.debug(f'고령자비율과 CCTV의 상관계수 {str(cor1)} \n'
+                             f'외국인비율과 CCTV의 상관계수 {str(cor2)} ')
 
-            print(f"🔥💧pop: {self.pop.head()}")
+            logger.debug("🔥💧pop: %s", self.pop.head())
 
  
         
@@ -2,7 +2,11 @@ import pandas as pd
 import numpy as np
 import os
 import traceback
-        
+import logging
+
+logger = logging.getLogger(__name__)
+
+
 def analyze_correlation(self, cctv_data, pop_data):
     """CCTV와 인구 데이터의 상관관계를 분석하는 함수"""
     try:
@@ -15,18 +19,18 @@ def analyze_correlation(self, cctv_data, pop_data):
             # 컬럼명이 일치하지 않는 경우 - 첫 번째 컬럼을 기준으로 rename
             first_col_cctv = cctv_data.columns[0]
             first_col_pop = pop_data.columns[0]
-            print(f"컬럼명이 일치하지 않아 첫 번째 컬럼을 기준으로 병합합니다.")
-            print(f"CCTV 첫 번째 컬럼: {first_col_cctv}, 인구 첫 번째 컬럼: {first_col_pop}")
+            logger.debug("컬럼명이 일치하지 않아 첫 번째 컬럼을 기준으로 병합합니다.")
+            logger.debug(f"CCTV 첫 번째 컬럼: {first_col_cctv}, 인구 첫 번째 컬럼: {first_col_pop}")
             
             # 첫 번째 컬럼을 '자치구'로 통일
             cctv_data = cctv_data.rename(columns={first_col_cctv: '자치구'})
             pop_data = pop_data.rename(columns={first_col_pop: '자치구'})
             merge_col = '자치구'
             
-            print(f"컬럼명 변경 후 CCTV 컬럼: {cctv_data.columns.tolist()}")
-            print(f"컬럼명 변경 후 인구 컬럼: {pop_data.columns.tolist()}")
+            logger.debug(f"컬럼명 변경 후 CCTV 컬럼: {cctv_data.columns.tolist()}")
+            logger.debug(f"컬럼명 변경 후 인구 컬럼: {pop_data.columns.tolist()}")
         
-        print(f"데이터 병합에 사용할 컬럼: {merge_col}")
+        logger.debug(f"데이터 병합에 사용할 컬럼: {merge_col}")
         
         # 인구 데이터 처리
         pop_data = pop_data.rename(columns={
@@ -45,8 +49,8 @@ def analyze_correlation(self, cctv_data, pop_data):
         
         # 병합
         cctv_pop = pd.merge(cctv_data, pop_data, on=merge_col)
-        print(f"병합된 데이터 형태: {cctv_pop.shape}")
-        print(f"병합된 데이터 컬럼: {cctv_pop.columns.tolist()}")
+        logger.debug(f"병합된 데이터 형태: {cctv_pop.shape}")
+        logger.debug(f"병합된 데이터 컬럼: {cctv_pop.columns.tolist()}")
         
         # CCTV 개수 컬럼 확인 (소계 또는 다른 이름)
         if '소계' in cctv_pop.columns:
@@ -54,7 +58,7 @@ def analyze_correlation(self, cctv_data, pop_data):
         else:
             # 두 번째 컬럼을 CCTV 개수로 간주
             cctv_col = cctv_data.columns[1]
-            print(f"'소계' 컬럼이 없어 {cctv_col}을 CCTV 개수로 사용합니다.")
+            logger.debug(f"'소계' 컬럼이 없어 {cctv_col}을 CCTV 개수로 사용합니다.")
             # cctv_col 이름 변경
             cctv_pop = cctv_pop.rename(columns={cctv_col: 'CCTV개수'})
             cctv_col = 'CCTV개수'
@@ -63,18 +67,18 @@ def analyze_correlation(self, cctv_data, pop_data):
         cor1 = np.corrcoef(cctv_pop['고령자비율'], cctv_pop[cctv_col])
         cor2 = np.corrcoef(cctv_pop['외국인비율'], cctv_pop[cctv_col])
         
-        print(f'고령자비율과 CCTV의 상관계수: {cor1[0,1]:.4f}')
-        print(f'외국인비율과 CCTV의 상관계수: {cor2[0,1]:.4f}')
+        logger.debug(f'고령자비율과 CCTV의 상관계수: {cor1[0,1]:.4f}')
+        logger.debug(f'외국인비율과 CCTV의 상관계수: {cor2[0,1]:.4f}')
         
         # 상관계수 해석
         elderly_interpretation = self.get_interpretation_text(cor1[0,1], "고령자비율", "CCTV")
         foreigner_interpretation = self.get_interpretation_text(cor2[0,1], "외국인비율", "CCTV")
         
-        print(f"\n{elderly_interpretation}")
-        print(f"\n{foreigner_interpretation}")
+        logger.debug(elderly_interpretation)
+        logger.debug(foreigner_interpretation)
         
         # 새로운 방식: CCTV와 다른 모든 숫자형 변수들 간의 상관관계만 계산
-        print("\n===== CCTV와 다른 변수들 간의 상관관계 =====")
+        logger.debug("===== CCTV와 다른 변수들 간의 상관관계 =====")
         
         # 데이터프레임에서 숫자형 컬럼만 선택 (CCTV 컬럼 제외)
         numeric_columns = cctv_pop.select_dtypes(include=['int', 'float']).columns.tolist()
@@ -92,8 +96,8 @@ def analyze_correlation(self, cctv_data, pop_data):
             # 해석 생성
             interpretation = self.get_interpretation_text(corr_value, col, cctv_col)
             
-            print(f"{col} - {cctv_col}: {corr_value:.4f}")
-            print(f"  {interpretation}")
+            logger.debug(f"{col} - {cctv_col}: {corr_value:.4f}")
+            logger.debug(f"  {interpretation}")
             
             cctv_correlations.append({
                 'variable': str(col),
@@ -132,14 +136,14 @@ def analyze_correlation(self, cctv_data, pop_data):
         return result
         
     except Exception as e:
-        print(f"상관계수 계산 중 오류 발생: {str(e)}")
-        print(traceback.format_exc())
+        logger.error(f"상관계수 계산 중 오류 발생: {str(e)}")
+        logger.error(traceback.format_exc())
         raise
 
 def analyze_crime_correlation(self, cctv_data, crime_data, police_norm_data):
     """CCTV와 범죄 데이터의 상관관계를 분석하는 함수"""
     try:
-        print("\n===== CCTV와 범죄 데이터 상관관계 분석 시작 =====\n")
+        logger.debug("===== CCTV와 범죄 데이터 상관관계 분석 시작 =====")
         
         # CCTV 데이터 전처리
         if '자치구' not in cctv_data.columns and cctv_data.columns[0] != '자치구':
@@ -170,22 +174,22 @@ def analyze_crime_correlation(self, cctv_data, crime_data, police_norm_data):
         # (실제로는 데이터 정합성 검증이 필요하나 현재 데이터의 순서가 같다고 가정)
         police_norm_data['자치구'] = cctv_data['자치구'].values[:len(police_norm_data)]
         
-        print(f"CCTV 데이터 행 수: {len(cctv_data)}")
-        print(f"crime_by_district 행 수: {len(crime_by_district)}")
-        print(f"police_norm_data 행 수: {len(police_norm_data)}")
+        logger.debug(f"CCTV 데이터 행 수: {len(cctv_data)}")
+        logger.debug(f"crime_by_district 행 수: {len(crime_by_district)}")
+        logger.debug(f"police_norm_data 행 수: {len(police_norm_data)}")
         
         # 데이터 병합
         # 1. CCTV와 집계된 범죄 데이터 병합
         merged_data = pd.merge(cctv_data, crime_by_district, on='자치구', how='inner')
-        print(f"CCTV + 범죄 데이터 병합 후 행 수: {len(merged_data)}")
+        logger.debug(f"CCTV + 범죄 데이터 병합 후 행 수: {len(merged_data)}")
         
         # 2. police_norm_data 병합
         merged_data = pd.merge(merged_data, police_norm_data, on='자치구', how='inner')
-        print(f"최종 병합 후 행 수: {len(merged_data)}")
-        print(f"최종 데이터 컬럼: {merged_data.columns.tolist()}")
+        logger.debug(f"최종 병합 후 행 수: {len(merged_data)}")
+        logger.debug(f"최종 데이터 컬럼: {merged_data.columns.tolist()}")
         
         # CCTV와 각 범죄 유형별 상관관계 분석
-        print("\n===== CCTV와 범죄 유형별 상관관계 =====")
+        logger.debug("===== CCTV와 범죄 유형별 상관관계 =====")
         crime_vars = ['살인', '강도', '강간', '절도', '폭력', '범죄', 
                         '살인검거율', '강도검거율', '강간검거율', '절도검거율', '폭력검거율', '검거']
         
@@ -200,8 +204,8 @@ def analyze_crime_correlation(self, cctv_data, crime_data, police_norm_data):
             # 해석 생성
             interpretation = self.get_interpretation_text(corr_value, col, "CCTV")
             
-            print(f"{col} - CCTV: {corr_value:.4f}")
-            print(f"  {interpretation}")
+            logger.debug(f"{col} - CCTV: {corr_value:.4f}")
+            logger.debug(f"  {interpretation}")
             
             crime_correlations.append({
                 'variable': str(col),
@@ -219,8 +223,8 @@ def analyze_crime_correlation(self, cctv_data, crime_data, police_norm_data):
             # 해석 생성
             interpretation = self.get_interpretation_text(corr_value, col, "CCTV")
             
-            print(f"{col} - CCTV: {corr_value:.4f}")
-            print(f"  {interpretation}")
+            logger.debug(f"{col} - CCTV: {corr_value:.4f}")
+            logger.debug(f"  {interpretation}")
             
             crime_correlations.append({
                 'variable': str(col),
@@ -231,7 +235,7 @@ def analyze_crime_correlation(self, cctv_data, crime_data, police_norm_data):
         # 상관계수의 절대값 기준으로 정렬
         crime_correlations.sort(key=lambda x: abs(x['correlation']), reverse=True)
         
-        print("\n===== CCTV와 범죄 데이터 상관관계 분석 완료 =====\n")
+        logger.debug("===== CCTV와 범죄 데이터 상관관계 분석 완료 =====")
         
         # 결과 반환
         result = {
@@ -255,8 +259,8 @@ def analyze_crime_correlation(self, cctv_data, crime_data, police_norm_data):
         return result
         
     except Exception as e:
-        print(f"범죄 상관계수 계산 중 오류 발생: {str(e)}")
-        print(traceback.format_exc())
+        logger.error(f"범죄 상관계수 계산 중 오류 발생: {str(e)}")
+        logger.error(traceback.format_exc())
         raise
 
 def get_interpretation_text(self, corr, var1, var2):
@@ -279,19 +283,19 @@ def get_interpretation_text(self, corr, var1, var2):
 def load_and_analyze(self, data_dir='app/updated_data'):
     """데이터를 로드하고 상관관계를 분석하는 함수"""
     try:
-        print("\n===== 상관계수 분석 시작 =====\n")
+        logger.debug("===== 상관계수 분석 시작 =====")
         
         # CCTV 데이터 로드
         cctv_file = os.path.join(data_dir, 'cctv_in_seoul.csv')
         cctv_data = pd.read_csv(cctv_file)
-        print(f"CCTV 데이터 로드 완료 - 형태: {cctv_data.shape}")
-        print(f"CCTV 데이터 컬럼: {cctv_data.columns.tolist()}")
+        logger.debug(f"CCTV 데이터 로드 완료 - 형태: {cctv_data.shape}")
+        logger.debug(f"CCTV 데이터 컬럼: {cctv_data.columns.tolist()}")
         
         # 인구 데이터 로드
         pop_file = os.path.join(data_dir, 'pop_in_seoul.csv')
         pop_data = pd.read_csv(pop_file)
-        print(f"인구 데이터 로드 완료 - 형태: {pop_data.shape}")
-        print(f"인구 데이터 컬럼: {pop_data.columns.tolist()}")
+        logger.debug(f"인구 데이터 로드 완료 - 형태: {pop_data.shape}")
+        logger.debug(f"인구 데이터 컬럼: {pop_data.columns.tolist()}")
         
         # 범죄 데이터 로드
         crime_file = os.path.join(data_dir, 'crime_in_seoul.csv')
@@ -300,13 +304,13 @@ def load_and_analyze(self, data_dir='app/updated_data'):
         try:
             crime_data = pd.read_csv(crime_file)
             police_norm_data = pd.read_csv(police_norm_file)
-            print(f"범죄 데이터 로드 완료 - 형태: {crime_data.shape}")
-            print(f"경찰서 정규화 데이터 로드 완료 - 형태: {police_norm_data.shape}")
+            logger.debug(f"범죄 데이터 로드 완료 - 형태: {crime_data.shape}")
+            logger.debug(f"경찰서 정규화 데이터 로드 완료 - 형태: {police_norm_data.shape}")
             
             # 범죄 데이터 상관관계 분석
             crime_correlation_results = self.analyze_crime_correlation(cctv_data, crime_data, police_norm_data)
         except Exception as e:
-            print(f"범죄 데이터 분석 중 오류 발생: {str(e)}")
+            logger.error(f"범죄 데이터 분석 중 오류 발생: {str(e)}")
             crime_correlation_results = {"error": str(e)}
         
         # 인구 데이터 상관관계 분석
@@ -318,13 +322,13 @@ def load_and_analyze(self, data_dir='app/updated_data'):
             'crime_analysis': crime_correlation_results
         }
         
-        print("\n===== 상관계수 분석 완료 =====\n")
+        logger.debug("===== 상관계수 분석 완료 =====")
         
         return results
         
     except Exception as e:
-        print(f"상관계수 분석 중 오류 발생: {str(e)}")
-        print(traceback.format_exc())
+        logger.error(f"상관계수 분석 중 오류 발생: {str(e)}")
+        logger.error(traceback.format_exc())
         # 오류 발생 시 기본 결과 반환
         return {
             'error': str(e),
@@ -2,9 +2,11 @@ import os
 import pandas as pd
 import numpy as np
 import logging
+from app.foundation.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+@traced()
 def build_merged_dataset_and_indicators(stored_data_dir='stored_data', output_dir='app/up_data'):
     """
     세 개의 데이터셋을 병합하고 범죄 관련 지표를 생성하는 함수
@@ -6,9 +6,11 @@ import json
 import logging
 from fastapi import HTTPException
 import traceback
+from app.foundation.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+@traced()
 def create_crime_circle_marker_map(merged_data_dir='app/up_data', 
                                   geo_json_dir='stored_data', 
                                   output_dir='app/stored_map'):
@@ -5,6 +5,7 @@ import folium
 from fastapi import HTTPException
 import logging
 import traceback
+from app.foundation.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,7 @@ class CrimeMapCreator:
         logger.info(f"지도 출력 디렉토리 확인: {self.output_dir}")
         logger.info(f"로컬 지도 출력 디렉토리 확인: {self.local_output_dir}")
 
+    @traced("create_crime_map")
     def create_map(self) -> dict:
         """범죄 지도를 생성하고 저장된 파일 경로를 반환합니다."""
         try:
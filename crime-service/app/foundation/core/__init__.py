@@ -0,0 +1,6 @@
+"""
+핵심 기반 기능
+- 공통 인터페이스
+- 핵심 추상화
+- 기본 구현체
+""" 
\ No newline at end of file
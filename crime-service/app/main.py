@@ -6,24 +6,21 @@ from typing import Dict, Any
 import os
 from dotenv import load_dotenv
 import logging
-import sys
 from contextlib import asynccontextmanager
 import json
 from pydantic import BaseModel
 
 from app.api.crime_router import router as crime_api_router
+from app.foundation.core.structured_logging import configure_logging
+from app.foundation.core.tracing import configure_tracing
 
-# ✅ 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
-logger = logging.getLogger("crime_api")
-
-# ✅ 환경변수 로드
+# ✅ 환경변수 로드 (.env 의 LOG_LEVEL/LOG_FORMAT 이 로깅 설정에 반영되도록 먼저 실행)
 load_dotenv()
 
+# ✅ 로깅 설정 (JSON, 큐 핸들러 + 백그라운드 출력 스레드)
+configure_logging("crime-service")
+logger = logging.getLogger("crime_api")
+
 # ✅ 요청 모델 정의
 class CrimeRequest(BaseModel):
     data: Dict[str, Any]
@@ -31,9 +28,9 @@ class CrimeRequest(BaseModel):
 # ✅ 라이프스팬 설정
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("🚀🚀🚀 Crime Service가 시작됩니다.")
+    logger.info("Crime Service가 시작됩니다.")
     yield
-    print("🛑 Crime Service가 종료됩니다.")
+    logger.info("Crime Service가 종료됩니다.")
 
 # ✅ FastAPI 설정
 app = FastAPI(
@@ -52,6 +49,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 트레이스 전파, Server-Timing, 게이트웨이 요청 마감(X-Request-Timeout-Ms) 적용
+configure_tracing(app, "crime-service")
+
 # ✅ 서브 라우터 생성
 crime_router = APIRouter(prefix="/crime", tags=["Finance API"])
 
@@ -0,0 +1,144 @@
+from typing import Any, Dict, Optional
+import hmac
+import logging
+import os
+
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request, status
+
+from app.domain.model.route_policy import route_path
+from app.domain.model.routing_table import RoutingTable, current_routing_table
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.bulkhead import service_bulkheads
+from app.foundation.core.circuit_breaker import service_breakers
+from app.foundation.core.load_balancer import upstream_balancers
+from app.foundation.core.retry_policy import service_retry_policies
+from app.foundation.core.singleflight import request_coalescer
+from app.foundation.core.timeout_policy import upstream_timeouts
+from app.foundation.infrastructure.idempotency_store import idempotency_store
+from app.foundation.infrastructure.response_cache import response_cache
+from app.foundation.infrastructure.routing_manager import routing_manager
+from app.platform.adapters.multipart_spool import upload_budget
+
+logger = logging.getLogger("admin_router")
+
+# 관리자 토큰이 설정되면 모든 관리 API 에서 X-Admin-Token 헤더를 검사
+ADMIN_TOKEN = os.getenv("GATEWAY_ADMIN_TOKEN")
+# 토큰이 없으면 조회(GET)만 허용하고, 변경 API 는 GATEWAY_ADMIN_INSECURE=1 로 명시한 경우에만 허용 (로컬 개발용)
+ADMIN_INSECURE = os.getenv("GATEWAY_ADMIN_INSECURE", "0").lower() in ("1", "true", "yes")
+READ_ONLY_METHODS = {"GET", "HEAD"}
+
+
+async def verify_admin_token(request: Request, x_admin_token: Optional[str] = Header(None)):
+    if ADMIN_TOKEN:
+        # 응답 시간으로 토큰을 추측하지 못하도록 상수 시간 비교
+        if not hmac.compare_digest((x_admin_token or "").encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 토큰이 올바르지 않습니다.")
+    elif request.method not in READ_ONLY_METHODS and not ADMIN_INSECURE:
+        # 라우팅 교체, 캐시 삭제 등은 토큰 없이 열어 두지 않음
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="GATEWAY_ADMIN_TOKEN 이 설정되지 않아 변경 API 를 사용할 수 없습니다."
+        )
+
+
+router = APIRouter(prefix="/admin", tags=["Gateway Admin"], dependencies=[Depends(verify_admin_token)])
+
+
+@router.delete("/cache", summary="응답 캐시 삭제")
+async def purge_cache(service: Optional[str] = None, path: Optional[str] = None):
+    """
+    게이트웨이 응답 캐시를 삭제합니다.
+
+    - **service**: 지정하면 해당 서비스의 항목만 삭제
+    - **path**: service 와 함께 지정하면 해당 경로 접두사의 항목만 삭제 (예: "map" 또는 "crime/map")
+    """
+    prefix = ""
+    if service:
+        try:
+            service_type = ServiceType(service)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"알 수 없는 서비스입니다: {service}")
+        # 캐시 키와 같은 방식으로 경로를 정규화, 서비스만 지정하면 "crime/" 로 끝나게 해서 다른 서비스 이름과 겹치지 않게 함
+        prefix = f"{service_type.value}/{route_path(service_type, path) if path else ''}"
+    purged = await response_cache.purge(prefix)
+    return {"message": "캐시가 삭제되었습니다.", "prefix": prefix, "purged": purged}
+
+
+@router.get("/coalescing", summary="요청 병합 통계")
+async def coalescing_stats():
+    """
+    동시에 들어온 동일 GET 요청 병합(singleflight) 통계를 반환합니다.
+    """
+    return request_coalescer.stats()
+
+
+@router.get("/idempotency", summary="Idempotency-Key 통계")
+async def idempotency_stats():
+    """
+    Idempotency-Key POST 의 저장/재사용 횟수와 진행 중인 키 수를 반환합니다.
+    """
+    return idempotency_store.stats()
+
+
+@router.get("/uploads", summary="업로드 스풀링 통계")
+async def upload_stats():
+    """
+    업로드 파일 파트의 메모리 예약량, 임시 파일 기록 수, 크기 제한 거부 수를 반환합니다.
+    """
+    return upload_budget.stats()
+
+
+@router.get("/upstreams", summary="업스트림 상태 (서킷 브레이커/레플리카)")
+async def upstream_status():
+    """
+    서비스별 서킷 브레이커, 벌크헤드(동시 실행/대기열), 재시도/헤지 통계, 라우트별 타임아웃과 레플리카별 진행 중 요청 수, 격리(ejected) 여부를 반환합니다.
+    """
+    return {
+        service_type.value: {
+            "breaker": service_breakers[service_type].snapshot(),
+            "bulkhead": service_bulkheads[service_type].stats(),
+            "retry": service_retry_policies[service_type].stats(),
+            "timeouts": upstream_timeouts.stats(service_type.value),
+            "replicas": [
+                {**replica, "ejected": replica["breaker"]["state"] == "open"}
+                for replica in upstream_balancers[service_type].stats()
+            ],
+        }
+        for service_type in ServiceType
+    }
+
+
+@router.get("/routing", summary="현재 라우팅 테이블")
+async def routing_table():
+    """
+    현재 적용된 라우팅 테이블(서비스별 레플리카, 라우트 정책)과 버전, 파일 감시 상태를 반환합니다.
+    """
+    return {**current_routing_table().describe(), "manager": routing_manager.stats()}
+
+
+@router.put("/routing", summary="라우팅 테이블 교체")
+async def replace_routing_table(config: Dict[str, Any] = Body(...)):
+    """
+    라우팅 테이블을 재시작 없이 교체합니다. (이 워커에만 반영)
+
+    - **services**: 서비스별 레플리카 목록 (없는 서비스는 환경변수 값 유지)
+    - **routes**: 기본 정책 위에 병합할 라우트 정책
+
+    빠진 레플리카는 진행 중인 요청이 끝날 때까지 draining 상태로 유지됩니다.
+    """
+    try:
+        table = RoutingTable.from_config(config, source="admin")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return routing_manager.apply(table)
+
+
+@router.post("/routing/reload", summary="라우팅 파일 다시 읽기")
+async def reload_routing_table():
+    """
+    GATEWAY_ROUTING_FILE 을 즉시 다시 읽어 바뀐 내용을 반영합니다.
+    """
+    try:
+        return await routing_manager.reload()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
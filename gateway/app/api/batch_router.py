@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Request
+
+from app.domain.model.batch_schema import BatchRequest, BatchResponse
+from app.foundation.core.rate_limiter import client_identity
+from app.platform.integration.batch_executor import execute_batch
+
+# 하위 요청마다 다시 정해지는 헤더는 전달하지 않음
+BATCH_EXCLUDED_HEADERS = {"content-type", "content-length", "host", "traceparent"}
+
+router = APIRouter(prefix="/ai/v1", tags=["Gateway API"])
+
+
+@router.post("/batch", summary="배치 프록시 (여러 서비스 동시 호출)", response_model=BatchResponse)
+async def batch(batch_request: BatchRequest, request: Request):
+    """
+    여러 하위 요청을 한 번에 받아 동시에 실행하고 입력 순서대로 결과를 반환합니다.
+
+    - 항목마다 상태 코드와 본문(또는 오류)을 담으며, 일부가 실패해도 전체 응답은 200 입니다.
+    - **timeout** 안에 끝나지 않은 항목은 504 로 표시됩니다.
+    """
+    headers = {k: v for k, v in request.headers.items() if k.lower() not in BATCH_EXCLUDED_HEADERS}
+    client_id = client_identity(dict(request.headers), request.client.host if request.client else None)
+    return await execute_batch(batch_request, headers, client_id)
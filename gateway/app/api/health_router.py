@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.foundation.infrastructure.health_checker import health_checker, required_services
+
+router = APIRouter(prefix="/health", tags=["Gateway Health"])
+
+
+@router.get("/live", summary="게이트웨이 생존 확인")
+async def live():
+    """
+    게이트웨이 프로세스가 요청을 처리할 수 있는지 확인합니다.
+    """
+    return {"status": "alive"}
+
+
+@router.get("/ready", summary="게이트웨이 준비 상태 확인")
+async def ready():
+    """
+    필수 업스트림 서비스마다 정상 레플리카가 있는지 집계합니다. 준비되지 않았으면 503 을 반환합니다.
+    """
+    result = health_checker.readiness(required_services())
+    return JSONResponse(content=result, status_code=200 if result["ready"] else 503)
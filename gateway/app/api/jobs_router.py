@@ -0,0 +1,135 @@
+from typing import AsyncIterator
+import json
+import math
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from app.domain.model.job_schema import Job, JobRequest
+from app.domain.model.response_snapshot import ResponseSnapshot
+from app.domain.model.service_proxy_factory import get_proxy_factory
+from app.domain.model.service_type import SERVICE_RESPONSE_MODES, ServiceType
+from app.foundation.core.priority import BATCH
+from app.foundation.core.rate_limiter import client_identity, rate_limiter
+from app.platform.adapters.response_relay import snapshot_response
+from app.platform.messaging.job_manager import job_manager
+
+# SSE 연결 유지용 주석 전송 간격(초)
+HEARTBEAT_SECONDS = 15.0
+
+router = APIRouter(prefix="/ai/v1/jobs", tags=["Gateway Jobs"])
+
+
+def job_accepted_response(job: Job) -> JSONResponse:
+    """작업 접수 응답 (202 + 상태 조회 위치)"""
+    info = job.public()
+    return JSONResponse(
+        content=info,
+        status_code=202,
+        headers={"Location": info["status_url"], "Preference-Applied": "respond-async"},
+    )
+
+
+def _not_found(job_id: str) -> JSONResponse:
+    return JSONResponse(content={"error": f"작업을 찾을 수 없습니다 (만료되었을 수 있음): {job_id}"}, status_code=404)
+
+
+@router.post("", summary="비동기 작업 제출")
+async def submit_job(job_request: JobRequest, request: Request):
+    """
+    업스트림 호출을 백그라운드 작업으로 제출하고 202 와 작업 ID 를 반환합니다.
+
+    `/ai/v1/{service}/{path}` 요청에 `Prefer: respond-async` 헤더를 붙여도 같은 방식으로 처리됩니다.
+    """
+    client_id = client_identity(dict(request.headers), request.client.host if request.client else None)
+    allowed, retry_after, _, _ = await rate_limiter.check(client_id, job_request.service)
+    if not allowed:
+        return JSONResponse(
+            content={"error": f"요청 한도를 초과했습니다: {job_request.service.value}"},
+            status_code=429, headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    factory = get_proxy_factory(job_request.service)
+    path = job_request.path.lstrip("/")
+    # 단건 프록시와 같은 경로 규칙 (POST 만 서비스 접두사를 붙임)
+    upstream_path = f"{job_request.service.value}/{path}" if job_request.method == "POST" else path
+    headers = dict(job_request.headers)
+    content = None
+    if job_request.body is not None:
+        content = json.dumps(job_request.body, ensure_ascii=False).encode("utf-8")
+        headers["content-type"] = "application/json"
+
+    async def send(timeout: float):
+        return await factory.request(job_request.method, upstream_path, headers=headers, content=content, timeout=timeout, priority=BATCH)
+
+    job = await job_manager.submit(job_request.service, job_request.method, path, send)
+    return job_accepted_response(job)
+
+
+@router.get("/{job_id}", summary="작업 상태 조회")
+async def job_status(job_id: str):
+    """
+    작업 상태(pending, running, succeeded, failed, cancelled)를 반환합니다. 완료되면 result_url 이 포함됩니다.
+    """
+    job = await job_manager.get(job_id)
+    if job is None:
+        return _not_found(job_id)
+    return job.public()
+
+
+@router.get("/{job_id}/result", summary="작업 결과 조회")
+async def job_result(job_id: str, request: Request):
+    """
+    완료된 작업의 업스트림 응답을 원래 요청과 같은 방식(서비스 응답 모드)으로 반환합니다.
+    아직 끝나지 않았으면 202, 응답 없이 실패했으면 오류를 반환합니다.
+    """
+    job = await job_manager.get(job_id)
+    if job is None:
+        return _not_found(job_id)
+    if not job.status.finished:
+        return JSONResponse(content=job.public(), status_code=202, headers={"Retry-After": "1"})
+    if job.result is None:
+        return JSONResponse(content={"error": job.error}, status_code=job.status_code or 502)
+    snapshot = ResponseSnapshot.loads(job.result.encode("utf-8"))
+    return snapshot_response(snapshot, SERVICE_RESPONSE_MODES[ServiceType(job.service)], request.headers.get("if-none-match"))
+
+
+@router.get("/{job_id}/events", summary="작업 상태 구독 (SSE)")
+async def job_events(job_id: str):
+    """
+    작업 상태가 바뀔 때마다 `event: status` 를 보내고, 완료되면 스트림을 닫습니다. (text/event-stream)
+    """
+    if await job_manager.get(job_id) is None:
+        return _not_found(job_id)
+
+    async def events() -> AsyncIterator[str]:
+        version = -1
+        while True:
+            job = await job_manager.store.wait_change(job_id, version, HEARTBEAT_SECONDS)
+            if job is None:
+                yield "event: expired\ndata: {}\n\n"
+                return
+            if job.version <= version:
+                yield ": keep-alive\n\n"
+                continue
+            version = job.version
+            yield f"event: status\ndata: {json.dumps(job.public(), ensure_ascii=False)}\n\n"
+            if job.status.finished:
+                return
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@router.delete("/{job_id}", summary="작업 취소")
+async def cancel_job(job_id: str):
+    """
+    이 게이트웨이 워커에서 실행 중인 작업을 취소합니다.
+    """
+    job = await job_manager.get(job_id)
+    if job is None:
+        return _not_found(job_id)
+    if job.status.finished:
+        return JSONResponse(content={"error": "이미 끝난 작업입니다.", **job.public()}, status_code=409)
+    if not await job_manager.cancel(job_id):
+        return JSONResponse(content={"error": "다른 게이트웨이 워커에서 실행 중인 작업입니다."}, status_code=409)
+    return Response(status_code=204)
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+router = APIRouter(tags=["Gateway Metrics"])
+
+
+@router.get("/metrics", summary="Prometheus 메트릭")
+async def metrics():
+    """
+    게이트웨이 요청/업스트림 지연 시간, 본문 크기, 커넥션 풀 등의 메트릭을 Prometheus 텍스트 형식으로 반환합니다.
+    """
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, WebSocket
+
+from app.domain.model.service_type import ServiceType
+from app.platform.adapters.websocket_proxy import proxy_websocket
+
+router = APIRouter(prefix="/ai/v1", tags=["Gateway API"])
+
+
+@router.websocket("/{service}/{path:path}")
+async def websocket_proxy(websocket: WebSocket, service: ServiceType, path: str):
+    """
+    서비스 레플리카의 같은 경로(ws://{service}/{path})와 WebSocket 메시지를 양방향으로 중계합니다.
+    """
+    await proxy_websocket(websocket, service, path)
@@ -0,0 +1,51 @@
+from typing import Any, Dict, List, Literal, Optional
+import os
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.domain.model.service_type import ServiceType
+
+# ✅ 배치 한도 (요청 수, 전체 마감 시간)
+BATCH_MAX_ITEMS = int(os.getenv("GATEWAY_BATCH_MAX_ITEMS", "20"))
+BATCH_MAX_TIMEOUT = float(os.getenv("GATEWAY_BATCH_TIMEOUT", "30"))
+
+
+class BatchItem(BaseModel):
+    id: Optional[str] = None
+    service: ServiceType
+    method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"] = "GET"
+    path: str
+    body: Optional[Any] = None
+    headers: Dict[str, str] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem] = Field(..., min_length=1, max_length=BATCH_MAX_ITEMS)
+    timeout: Optional[float] = Field(None, gt=0, description="배치 전체 마감 시간(초). GATEWAY_BATCH_TIMEOUT 을 넘을 수 없음")
+
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "requests": [
+                {"id": "passengers", "service": "titanic", "path": "titanic/passengers"},
+                {"id": "map", "service": "crime", "path": "crime/map"},
+                {"id": "wordcloud", "service": "nlp", "path": "nlp/generate-wordcloud"}
+            ],
+            "timeout": 10
+        }
+    })
+
+
+class BatchItemResult(BaseModel):
+    id: Optional[str] = None
+    service: ServiceType
+    status: int
+    body: Optional[Any] = None
+    error: Optional[str] = None
+    elapsed_ms: float
+
+
+class BatchResponse(BaseModel):
+    results: List[BatchItemResult]
+    succeeded: int
+    failed: int
+    elapsed_ms: float
@@ -0,0 +1,78 @@
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any, Dict, Literal, Optional
+import json
+import secrets
+import time
+
+from pydantic import BaseModel, Field
+
+from app.domain.model.service_type import ServiceType
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class Job:
+    """비동기로 실행되는 업스트림 호출 하나의 상태
+
+    result 는 완료된 업스트림 응답의 ResponseSnapshot 직렬화 값 (base64 본문 포함 JSON 문자열)
+    """
+    service: str
+    method: str
+    path: str
+    id: str = field(default_factory=lambda: secrets.token_urlsafe(12))
+    status: JobStatus = JobStatus.PENDING
+    version: int = 0
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    result: Optional[str] = None
+
+    def public(self, base_url: str = "/ai/v1/jobs") -> Dict[str, Any]:
+        """클라이언트에 보여줄 상태 (결과 본문 제외)"""
+        info = {
+            "job_id": self.id,
+            "service": self.service,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "status_url": f"{base_url}/{self.id}",
+            "events_url": f"{base_url}/{self.id}/events",
+        }
+        if self.status.finished:
+            info.update(status_code=self.status_code, error=self.error)
+        if self.result is not None:
+            info["result_url"] = f"{base_url}/{self.id}/result"
+        return info
+
+    def dumps(self) -> str:
+        return json.dumps({**asdict(self), "status": self.status.value}, ensure_ascii=False)
+
+    @classmethod
+    def loads(cls, raw) -> "Job":
+        data = json.loads(raw)
+        data["status"] = JobStatus(data["status"])
+        return cls(**data)
+
+
+class JobRequest(BaseModel):
+    """POST /ai/v1/jobs 로 제출하는 업스트림 호출"""
+    service: ServiceType
+    method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"] = "GET"
+    path: str
+    body: Optional[Any] = None
+    headers: Dict[str, str] = Field(default_factory=dict)
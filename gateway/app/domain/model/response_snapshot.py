@@ -0,0 +1,84 @@
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Tuple
+import base64
+import hashlib
+import json
+import time
+
+import httpx
+
+# 스냅샷에는 디코딩된 본문을 저장하므로 전송/인코딩 관련 헤더는 보관하지 않음
+_UNSTORED_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailer",
+    "trailers", "transfer-encoding", "upgrade", "content-encoding", "content-length", "set-cookie",
+}
+
+
+@dataclass(frozen=True)
+class ResponseSnapshot:
+    """본문까지 모두 읽은 업스트림 응답의 불변 스냅샷 (캐시/공유 응답용)
+
+    request_fingerprint 는 멱등 응답처럼 특정 요청 본문에 묶인 스냅샷에서 원래 요청의 지문을 보관한다.
+    """
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    etag: str
+    upstream_etag: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+    expires_at: float = 0.0
+    request_fingerprint: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, ttl: float = 0.0) -> "ResponseSnapshot":
+        """읽기가 끝난 httpx 응답으로 스냅샷 생성
+
+        Args:
+            response (httpx.Response): 본문을 모두 읽은 업스트림 응답
+            ttl (float, optional): 신선도 유지 시간(초). 기본값은 0.
+
+        Returns:
+            ResponseSnapshot: 생성된 스냅샷
+        """
+        body = response.content
+        upstream_etag = response.headers.get("etag")
+        now = time.time()
+        return cls(
+            status_code=response.status_code,
+            headers=[(k, v) for k, v in response.headers.multi_items() if k.lower() not in _UNSTORED_HEADERS],
+            body=body,
+            etag=upstream_etag or f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            upstream_etag=upstream_etag,
+            stored_at=now,
+            expires_at=now + ttl,
+        )
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+    def refreshed(self, ttl: float) -> "ResponseSnapshot":
+        """재검증(304) 성공 시 신선도만 갱신한 스냅샷"""
+        now = time.time()
+        return replace(self, stored_at=now, expires_at=now + ttl)
+
+    def to_httpx(self) -> httpx.Response:
+        return httpx.Response(self.status_code, headers=self.headers, content=self.body)
+
+    def dumps(self) -> bytes:
+        return json.dumps({
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "etag": self.etag,
+            "upstream_etag": self.upstream_etag,
+            "stored_at": self.stored_at,
+            "expires_at": self.expires_at,
+            "request_fingerprint": self.request_fingerprint,
+        }).encode("utf-8")
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "ResponseSnapshot":
+        data = json.loads(raw)
+        data["headers"] = [tuple(item) for item in data["headers"]]
+        data["body"] = base64.b64decode(data["body"])
+        return cls(**data)
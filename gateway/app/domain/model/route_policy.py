@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+import json
+import os
+
+from app.domain.model.service_type import ServiceType
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    """서비스/경로 접두사 단위의 게이트웨이 정책
+
+    Attributes:
+        route (str): 매칭된 경로 템플릿 (예: "crime/map"). 매칭되지 않으면 "{service}/*"
+        cache_ttl (float): 응답 캐시 유지 시간(초). 0 이면 캐시하지 않음
+        coalesce (bool): 동시에 들어온 동일 GET 요청을 하나의 업스트림 호출로 병합할지 여부
+        timeout (float, optional): 업스트림 타임아웃(초). None 이면 서비스 기본값({SERVICE}_UPSTREAM_TIMEOUT)
+        adaptive_timeout (bool, optional): 최근 지연 분위수로 타임아웃을 줄일지 여부. None 이면 GATEWAY_ADAPTIVE_TIMEOUT
+        priority (str, optional): 벌크헤드 우선순위 클래스 (interactive | default | batch). None 이면 서비스 기본값
+    """
+    route: str
+    cache_ttl: float = 0.0
+    coalesce: bool = False
+    timeout: Optional[float] = None
+    adaptive_timeout: Optional[bool] = None
+    priority: Optional[str] = None
+
+
+# ✅ 기본 라우트 정책 - 수 분씩 걸리는 파이프라인 GET 엔드포인트(배치 클래스)와 빠르게 끝나야 하는 조회 엔드포인트
+DEFAULT_ROUTE_POLICIES = {
+    "crime/preprocess": {"cache_ttl": 600, "coalesce": True, "timeout": 300, "priority": "batch"},
+    "crime/map": {"cache_ttl": 300, "coalesce": True, "timeout": 120, "priority": "batch"},
+    "nlp/generate-wordcloud": {"cache_ttl": 600, "coalesce": True, "timeout": 300, "priority": "batch"},
+    "titanic/passengers": {"timeout": 5, "adaptive_timeout": True},
+}
+
+
+# 환경변수로 지정한 정책 (라우팅 테이블을 다시 불러올 때도 기본 정책 위에 먼저 병합)
+ENV_ROUTE_POLICIES: Dict[str, Dict[str, Any]] = json.loads(os.getenv("GATEWAY_ROUTE_POLICIES") or "{}")
+
+
+def build_route_policies(*layers: Mapping[str, Mapping[str, Any]]) -> Dict[str, RoutePolicy]:
+    """기본 정책 위에 설정 계층을 순서대로 병합 (같은 라우트는 옵션 단위로 덮어씀)
+
+    예: GATEWAY_ROUTE_POLICIES='{"crime/map": {"cache_ttl": 60}, "titanic/passengers": {"cache_ttl": 5, "timeout": 2}}'
+
+    Raises:
+        TypeError: RoutePolicy 에 없는 옵션이 있는 경우
+    """
+    config = {route: dict(options) for route, options in DEFAULT_ROUTE_POLICIES.items()}
+    for layer in layers:
+        for route, options in layer.items():
+            config.setdefault(route.strip("/"), {}).update(options)
+    return {route.strip("/"): RoutePolicy(route=route.strip("/"), **options) for route, options in config.items()}
+
+
+class _RouteNode:
+    __slots__ = ("policy", "children")
+
+    def __init__(self):
+        self.policy: Optional[RoutePolicy] = None
+        self.children: Dict[str, "_RouteNode"] = {}
+
+
+class RouteMatcher:
+    """라우트 정책을 경로 세그먼트 트리로 미리 컴파일해 둔 매처 (생성 후 변경하지 않음)
+
+    요청마다 접두사 문자열을 잘라 가며 dict 를 찾는 대신 세그먼트 수만큼만 트리를 내려간다.
+    """
+
+    def __init__(self, policies: Mapping[str, RoutePolicy]):
+        self.policies: Dict[str, RoutePolicy] = dict(policies)
+        self._root = _RouteNode()
+        for route, policy in self.policies.items():
+            node = self._root
+            for segment in route.split("/"):
+                node = node.children.setdefault(segment, _RouteNode())
+            node.policy = policy
+        self._fallbacks = {service: RoutePolicy(route=f"{service.value}/*") for service in ServiceType}
+
+    def match(self, service: ServiceType, path: str) -> RoutePolicy:
+        node = self._root.children.get(service.value)
+        matched = node.policy if node is not None else None
+        if node is not None and node.children:
+            for segment in path.strip("/").split("/"):
+                node = node.children.get(segment)
+                if node is None:
+                    break
+                if node.policy is not None:
+                    matched = node.policy
+        return matched or self._fallbacks[service]
+
+    def with_policies(self, *policies: RoutePolicy) -> "RouteMatcher":
+        """일부 정책을 바꾼 새 매처"""
+        return RouteMatcher({**self.policies, **{policy.route: policy for policy in policies}})
+
+
+_matcher = RouteMatcher(build_route_policies(ENV_ROUTE_POLICIES))
+
+
+def route_matcher() -> RouteMatcher:
+    return _matcher
+
+
+def install_route_matcher(matcher: RouteMatcher) -> RouteMatcher:
+    """현재 매처를 통째로 교체하고 이전 매처를 반환 (진행 중인 요청은 이미 고른 정책을 계속 사용)"""
+    global _matcher
+    previous, _matcher = _matcher, matcher
+    return previous
+
+
+def route_path(service: ServiceType, path: str) -> str:
+    """라우트 정책 매칭용 서비스 이하 경로
+
+    백엔드 라우터가 서비스 이름으로 시작하므로 실제 요청 경로는 "{service}/..." 형태다.
+    (예: /ai/v1/crime/crime/map -> "crime/map" -> "map") 절대 URL 은 경로 부분만 사용한다.
+    """
+    if path.startswith("http"):
+        path = urlsplit(path).path
+    path = path.strip("/")
+    prefix = f"{service.value}/"
+    return path[len(prefix):] if path.startswith(prefix) else path
+
+
+def match_route_policy(service: ServiceType, path: str) -> RoutePolicy:
+    """요청 경로에 가장 길게 일치하는 라우트 정책을 반환
+
+    Args:
+        service (ServiceType): 서비스 타입
+        path (str): 게이트웨이 서비스 이하 요청 경로 (예: "crime/map/circle-marker", "{service}/" 접두사는 있어도 없어도 됨)
+
+    Returns:
+        RoutePolicy: 일치하는 정책, 없으면 캐시하지 않는 기본 정책
+    """
+    return _matcher.match(service, route_path(service, path))
@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Tuple
+import hashlib
+import json
+import logging
+import math
+import os
+
+from app.domain.model.route_policy import ENV_ROUTE_POLICIES, RouteMatcher, RoutePolicy, build_route_policies, install_route_matcher
+from app.domain.model.service_type import SERVICE_REPLICAS, ServiceType, parse_replicas
+from app.foundation.core.priority import PRIORITY_CLASSES
+
+logger = logging.getLogger("routing_table")
+
+# 실행 중에 다시 읽을 라우팅 파일 (JSON)
+ROUTING_FILE = os.getenv("GATEWAY_ROUTING_FILE")
+
+
+@dataclass(frozen=True)
+class RoutingTable:
+    """서비스별 레플리카 목록과 라우트 정책을 묶은 불변 라우팅 테이블
+
+    설정 형식 (파일 또는 PUT /admin/routing 본문):
+        {
+          "services": {"nlp": "http://nlp-1:9004;weight=2,http://nlp-2:9004", "tf": ["http://tf:9005"]},
+          "routes": {"crime/map": {"cache_ttl": 60, "priority": "batch"}}
+        }
+
+    - services 에 없는 서비스는 {SERVICE}_SERVICE_URL 환경변수 값을 그대로 쓴다. (빈 목록이면 레플리카 없음)
+    - routes 는 기본 정책과 GATEWAY_ROUTE_POLICIES 위에 병합한다.
+    - 서비스 종류는 ServiceType 으로 고정이며 레플리카와 라우트 정책만 바꿀 수 있다.
+    """
+    services: Dict[ServiceType, Tuple[Tuple[str, float], ...]]
+    routes: RouteMatcher
+    version: str
+    source: str
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], source: str) -> "RoutingTable":
+        """설정 dict 로 라우팅 테이블 생성
+
+        Raises:
+            ValueError: 알 수 없는 서비스, 잘못된 URL/옵션이 있는 경우
+        """
+        if not isinstance(config, Mapping):
+            raise ValueError("라우팅 설정은 JSON 객체여야 합니다.")
+        unknown = set(config) - {"services", "routes"}
+        if unknown:
+            raise ValueError(f"알 수 없는 라우팅 설정 키: {sorted(unknown)}")
+
+        services = {service_type: tuple(replicas) for service_type, replicas in SERVICE_REPLICAS.items()}
+        for name, spec in (config.get("services") or {}).items():
+            try:
+                service_type = ServiceType(name)
+            except ValueError:
+                raise ValueError(f"알 수 없는 서비스: {name}")
+            raw = ",".join(spec) if isinstance(spec, (list, tuple)) else spec
+            if not isinstance(raw, str):
+                raise ValueError(f"{name} 레플리카는 문자열 또는 문자열 목록이어야 합니다.")
+            replicas = parse_replicas(raw)
+            for url, _ in replicas:
+                if not url.startswith(("http://", "https://", "unix://", "h2c://")):
+                    raise ValueError(f"지원하지 않는 레플리카 URL: {url}")
+            services[service_type] = tuple(replicas)
+        for service_type, replicas in services.items():
+            for url, weight in replicas:
+                # 가중치 0 이하는 부하 분산 점수 계산(outstanding / weight)을 깨뜨림
+                if not math.isfinite(weight) or weight <= 0:
+                    raise ValueError(f"{service_type.value} 레플리카 가중치는 0보다 커야 합니다: {url} (weight={weight})")
+
+        try:
+            policies = build_route_policies(ENV_ROUTE_POLICIES, config.get("routes") or {})
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"잘못된 라우트 정책: {e}")
+        for policy in policies.values():
+            _validate_policy(policy)
+
+        canonical = json.dumps(
+            {
+                "services": {k.value: v for k, v in services.items()},
+                "routes": {k: vars(v) for k, v in sorted(policies.items())},
+            },
+            sort_keys=True,
+        )
+        version = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+        return cls(services=services, routes=RouteMatcher(policies), version=version, source=source)
+
+    @classmethod
+    def from_file(cls, path: str) -> "RoutingTable":
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                config = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"라우팅 파일을 읽을 수 없습니다 ({path}): {e}")
+        return cls.from_config(config, source=path)
+
+    @classmethod
+    def from_env(cls) -> "RoutingTable":
+        """환경변수 (GATEWAY_ROUTING_FILE 이 있으면 파일까지) 로 초기 라우팅 테이블 생성
+
+        파일을 읽지 못하면 오류를 남기고 환경변수만으로 시작한다.
+        """
+        if ROUTING_FILE and os.path.exists(ROUTING_FILE):
+            try:
+                return cls.from_file(ROUTING_FILE)
+            except (OSError, ValueError) as e:
+                logger.error(f"라우팅 파일을 무시하고 환경변수로 시작합니다: {e}")
+        return cls.from_config({}, source="env")
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "services": {
+                service_type.value: [{"url": url, "weight": weight} for url, weight in replicas]
+                for service_type, replicas in self.services.items()
+            },
+            "routes": {route: vars(policy) for route, policy in sorted(self.routes.policies.items())},
+        }
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _validate_policy(policy: RoutePolicy):
+    """요청 처리 중에 터지지 않도록 라우트 정책 값의 타입과 범위를 미리 검사
+
+    Raises:
+        ValueError: 값이 올바르지 않은 경우
+    """
+    errors = []
+    if not _is_number(policy.cache_ttl) or policy.cache_ttl < 0:
+        errors.append(f"cache_ttl 은 0 이상의 숫자여야 합니다 ({policy.cache_ttl!r})")
+    if not isinstance(policy.coalesce, bool):
+        errors.append(f"coalesce 는 true/false 여야 합니다 ({policy.coalesce!r})")
+    if policy.timeout is not None and (not _is_number(policy.timeout) or policy.timeout <= 0):
+        errors.append(f"timeout 은 0보다 큰 숫자여야 합니다 ({policy.timeout!r})")
+    if policy.adaptive_timeout is not None and not isinstance(policy.adaptive_timeout, bool):
+        errors.append(f"adaptive_timeout 은 true/false 여야 합니다 ({policy.adaptive_timeout!r})")
+    if policy.priority is not None and policy.priority not in PRIORITY_CLASSES:
+        errors.append(f"priority 는 {'/'.join(PRIORITY_CLASSES)} 중 하나여야 합니다 ({policy.priority!r})")
+    if errors:
+        raise ValueError(f"잘못된 라우트 정책 {policy.route}: " + ", ".join(errors))
+
+
+_current = RoutingTable.from_env()
+install_route_matcher(_current.routes)
+
+
+def current_routing_table() -> RoutingTable:
+    return _current
+
+
+def install_routing_table(table: RoutingTable) -> RoutingTable:
+    """라우팅 테이블과 라우트 매처를 교체하고 이전 테이블을 반환 (레플리카 반영은 호출자가 담당)"""
+    global _current
+    previous, _current = _current, table
+    install_route_matcher(table.routes)
+    return previous
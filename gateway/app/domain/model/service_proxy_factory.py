@@ -1,16 +1,36 @@
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Set, Tuple, Iterable, Mapping, Union, AsyncIterable
 from fastapi import HTTPException, status
 import httpx
 import logging
 import traceback
 import os
 import json
-from app.domain.model.service_type import SERVICE_URLS, ServiceType
+import time
+import asyncio
+from app.domain.model.route_policy import RoutePolicy, match_route_policy
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.bulkhead import BulkheadRejected, service_bulkheads
+from app.foundation.core.circuit_breaker import service_breakers
+from app.foundation.core.load_balancer import upstream_balancers
+from app.foundation.core.priority import PRIORITY_HEADER, classify
+from app.foundation.core.rate_limiter import client_identity, current_client_id
+from app.foundation.core.retry_policy import IDEMPOTENT_METHODS, RetryPolicy, service_retry_policies
+from app.foundation.core.timeout_policy import DEADLINE_HEADER, Deadline, client_budget, upstream_timeouts
+from app.foundation.core.tracing import add_upstream_timing, tracer
+from app.foundation.infrastructure.http_client_pool import PoolSettings, upstream_pool
+from app.foundation.infrastructure.metrics import record_upstream
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("service_proxy")
 
+SUPPORTED_METHODS = {"GET", "POST", "PUT", "DELETE", "PATCH"}
+FORM_METHODS = {"POST", "PUT", "PATCH"}
+# 연결마다 달라지는 헤더는 업스트림으로 전달하지 않음
+EXCLUDED_HEADERS = {"host", "connection", "keep-alive", "content-length", "transfer-encoding"}
+
+
+class UpstreamRequestError(HTTPException):
+    """업스트림 연결/전송 오류 (재시도 대상). 응답은 일반 503 (타임아웃이면 504) 과 같다."""
+
 class ServiceProxyFactory:
     def __init__(self, service_type: ServiceType):
         """서비스 프록시 팩토리 초기화
@@ -19,14 +39,24 @@ class ServiceProxyFactory:
             service_type (ServiceType): 서비스 타입 (TITANIC, CRIME, NLP, TF 등)
         """
         self.service_type = service_type
-        self.base_url = SERVICE_URLS.get(service_type)
+        self.default_timeout = PoolSettings.from_env(service_type).timeout
         
         if not self.base_url:
             error_msg = f"서비스 URL을 찾을 수 없습니다: {service_type}"
             logger.error(error_msg)
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error_msg)
         
-        logger.info(f"🩷서비스 프록시 생성: {service_type} → {self.base_url}")
+        logger.info(f"서비스 프록시 생성: {service_type} → {self.base_url}")
+
+    @property
+    def balancer(self):
+        return upstream_balancers[self.service_type]
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """현재 라우팅 테이블의 대표 레플리카 URL (레플리카가 없으면 None)"""
+        replicas = self.balancer.replicas
+        return replicas[0].url if replicas else None
 
     async def request(
         self, 
@@ -34,7 +64,11 @@ class ServiceProxyFactory:
         path: str, 
         headers: Dict[str, str] = None,
         data: Dict[str, Any] = None,
-        files: Dict[str, Tuple[str, bytes, str]] = None
+        files: Dict[str, Tuple[str, Any, str]] = None,
+        content: Union[bytes, AsyncIterable[bytes], None] = None,
+        stream: bool = False,
+        timeout: Optional[float] = None,
+        priority: Optional[str] = None
     ):
         """HTTP 요청을 대상 서비스로 전달
 
@@ -43,66 +77,307 @@ class ServiceProxyFactory:
             path (str): 요청 경로
             headers (Dict[str, str], optional): HTTP 헤더. 기본값은 None.
             data (Dict[str, Any], optional): 폼 데이터. 기본값은 None.
-            files (Dict[str, Tuple[str, bytes, str]], optional): 업로드할 파일. 기본값은 None.
+            files (Dict[str, Tuple[str, Any, str]], optional): 업로드할 파일 (바이트 또는 파일 객체). 기본값은 None.
+            content (bytes | AsyncIterable[bytes], optional): 원본 요청 본문. 비동기 이터러블이면 청크 단위로 전송. 기본값은 None.
+            stream (bool, optional): True 이면 본문을 읽지 않고 응답을 반환 (호출자가 aclose 해야 함). 기본값은 False.
+            timeout (float, optional): 이 요청에만 적용할 업스트림 타임아웃(초). 기본값은 None (라우트 정책의 타임아웃 사용).
+            priority (str, optional): 우선순위 클래스 상한 (예: 비동기 작업은 "batch"). 기본값은 None (분류 결과 사용).
 
         Returns:
             httpx.Response: 대상 서비스의 응답
+
+        Note:
+            레플리카의 진행 중 요청 수는 응답 헤더를 받을 때까지 집계한다. (stream=True 포함)
+            타임아웃은 벌크헤드 대기, 재시도, 헤지를 모두 포함한 마감 시각이며 클라이언트가 보낸
+            X-Request-Timeout-Ms 보다 길어지지 않는다. 마감이 지나면 504 로 응답한다.
+            벌크헤드 대기열에서는 클라이언트/라우트/X-Priority 로 정한 우선순위 클래스의 가중치대로 실행 순서를 정한다.
         """
-        url = f"{self.base_url}/{path}" if not path.startswith("http") else path
-        logger.info(f"🍎1. 요청 URL: {url}")
-        
-        # 요청 헤더 설정
-        request_headers = {}
-        if headers:
-            for k, v in headers.items():
-                # 호스트 헤더 제외 (URL에 맞게 자동으로 설정됨)
-                if k.lower() != 'host':
-                    request_headers[k] = v
-        
-        # 요청 전송
-        timeout = httpx.Timeout(30.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        method = method.upper()
+        if method not in SUPPORTED_METHODS:
+            error_msg = f"지원하지 않는 HTTP 메서드: {method}"
+            logger.error(error_msg)
+            raise HTTPException(
+                status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
+                detail=error_msg
+            )
+
+        # 요청 헤더 설정 (호스트 헤더 제외 - URL에 맞게 자동으로 설정됨)
+        request_headers = _filter_headers(headers)
+        route = match_route_policy(self.service_type, path)
+        deadline = self._deadline(route, request_headers, timeout)
+        priority = self._priority(route, request_headers, priority)
+
+        # 서비스 단위 브레이커가 열려 있으면 대기열에 넣지 않고 즉시 실패
+        service_breaker = service_breakers[self.service_type]
+        if not service_breaker.is_available():
+            raise _unavailable(f"서비스 차단 중 (circuit open): {self.service_type.value}", service_breaker.retry_after())
+
+        # 서비스별 벌크헤드 - 느린 서비스가 게이트웨이 자원을 독점하지 못하게 동시 실행 수 제한
+        # 대기 시간은 요청 마감 시각을 넘지 않음 (마감 때문에 대기가 끝나면 503 대신 504)
+        bulkhead = service_bulkheads[self.service_type]
+        queue_budget = deadline.remaining()
+        try:
+            async with bulkhead.slot(priority, timeout=queue_budget):
+                return await self._send_with_retries(method, path, request_headers, data, files, content, stream, deadline)
+        except BulkheadRejected as e:
+            if e.reason == "queue_timeout" and queue_budget < bulkhead.queue_timeout:
+                raise _deadline_exceeded(deadline)
+            raise _overloaded(e)
+
+    def _deadline(self, route: RoutePolicy, request_headers: Dict[str, str], timeout: Optional[float]) -> Deadline:
+        """라우트 정책(또는 호출자가 지정한 타임아웃)과 클라이언트 예산 중 짧은 쪽으로 마감 시각을 정함
+
+        호출자가 지정한 타임아웃(비동기 작업, SSE 유휴 시간)은 클라이언트 대기 시간이 아니므로
+        클라이언트 예산이 없으면 업스트림에 마감 헤더를 전달하지 않는다.
+        """
+        budget = client_budget(request_headers)
+        for key in [k for k in request_headers if k.lower() == DEADLINE_HEADER]:
+            del request_headers[key]
+        limit = timeout if timeout is not None else upstream_timeouts.timeout_for(route, self.default_timeout)
+        if budget is not None:
+            limit = min(limit, budget)
+        return Deadline(route.route, limit, propagate=timeout is None or budget is not None, route_timeout=route.timeout)
+
+    def _priority(self, route: RoutePolicy, request_headers: Dict[str, str], ceiling: Optional[str]) -> str:
+        """우선순위 클래스 분류 후 X-Priority 헤더를 분류 결과로 바꿔 업스트림에 전달"""
+        client_id = current_client_id.get()
+        if client_id is None:
+            client_id = client_identity({k.lower(): v for k, v in request_headers.items()}, None)
+        priority = classify(self.service_type, route, request_headers, client_id, ceiling)
+        for key in [k for k in request_headers if k.lower() == PRIORITY_HEADER]:
+            del request_headers[key]
+        request_headers[PRIORITY_HEADER] = priority
+        return priority
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        request_headers: Dict[str, str],
+        data: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Tuple[str, Any, str]]],
+        content: Union[bytes, AsyncIterable[bytes], None],
+        stream: bool,
+        deadline: Deadline
+    ) -> httpx.Response:
+        """멱등 요청은 연결 오류/재시도 상태 코드에서 지터 백오프로 재시도하고, 느리면 다른 레플리카로 헤지
+
+        재시도와 헤지는 서비스별 예산 안에서만 수행하므로 장애 시 재시도 폭주를 만들지 않는다.
+        본문이 스트림이거나 파일 업로드이면 다시 보낼 수 없으므로 한 번만 전송한다.
+        마감 시각이 지나면 더 재시도하지 않는다.
+        """
+        policy = service_retry_policies[self.service_type]
+        retryable = method in IDEMPOTENT_METHODS and files is None and not hasattr(content, "__aiter__")
+        policy.budget.record_request()
+        tried: Set[str] = set()
+        attempt = 0
+        while True:
             try:
-                if method.upper() == 'GET':
-                    logger.info(f"🍎2. GET 요청 전송: {url}")
-                    response = await client.get(url, headers=request_headers)
-                
-                elif method.upper() == 'POST':
-                    logger.info(f"🍎3. POST 요청 전송: {url}")
-                    response = await client.post(
-                        url, 
-                        headers=request_headers,
-                        data=data,
-                        files=files
-                    )
-                
-                elif method.upper() == 'PUT':
-                    logger.info(f"🍎4. PUT 요청 전송: {url}")
-                    response = await client.put(url, headers=request_headers, data=data)
-                
-                elif method.upper() == 'DELETE':
-                    logger.info(f"🍎5. DELETE 요청 전송: {url}")
-                    response = await client.delete(url, headers=request_headers)
-                
-                elif method.upper() == 'PATCH':
-                    logger.info(f"🍎6. PATCH 요청 전송: {url}")
-                    response = await client.patch(url, headers=request_headers, data=data)
-                
+                hedge_delay = policy.hedge_delay() if retryable else None
+                if hedge_delay is not None and len([r for r in self.balancer.replicas if r.routable]) > 1:
+                    response = await self._hedged_send(policy, hedge_delay, method, path, request_headers, data, files, content, stream, tried, deadline)
                 else:
-                    error_msg = f"지원하지 않는 HTTP 메서드: {method}"
-                    logger.error(error_msg)
-                    raise HTTPException(
-                        status_code=status.HTTP_405_METHOD_NOT_ALLOWED,
-                        detail=error_msg
-                    )
-                
-                logger.info(f"🍎7. 응답 상태 코드: {response.status_code}")
-                return response
-                
-            except httpx.RequestError as e:
-                error_msg = f"⚠️요청 중 오류 발생: {str(e)}"
-                logger.error(error_msg)
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=error_msg
+                    response = await self._send(method, path, request_headers, data, files, content, stream, tried, deadline)
+            except UpstreamRequestError:
+                if not (retryable and attempt < policy.settings.max_retries and deadline.remaining() > 0
+                        and policy.budget.try_spend()):
+                    raise
+            else:
+                if not (retryable and response.status_code in policy.settings.retry_statuses
+                        and attempt < policy.settings.max_retries and deadline.remaining() > 0
+                        and policy.budget.try_spend()):
+                    return response
+                await response.aclose()
+            attempt += 1
+            policy.retries += 1
+            delay = policy.backoff(attempt)
+            logger.warning(f"업스트림 재시도 {attempt}/{policy.settings.max_retries}: {self.service_type.value}/{path} ({delay:.3f}s 후)")
+            await asyncio.sleep(delay)
+
+    async def _hedged_send(self, policy: RetryPolicy, delay: float, *args) -> httpx.Response:
+        """먼저 보낸 요청이 delay 안에 끝나지 않으면 다른 레플리카로 같은 요청을 한 번 더 보내고 먼저 성공한 응답을 사용"""
+        primary = asyncio.create_task(self._send(*args))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not policy.budget.try_spend():
+            return await primary
+
+        policy.hedges += 1
+        hedge = asyncio.create_task(self._send(*args))
+        pending = {primary, hedge}
+        winner = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+            if winner is None:
+                return await primary  # 둘 다 실패하면 최초 요청의 오류를 그대로 전달
+            if winner is hedge:
+                policy.hedge_wins += 1
+            return winner.result()
+        finally:
+            losers = [task for task in (primary, hedge) if task is not winner]
+            for task in losers:
+                task.cancel()
+            for result in await asyncio.gather(*losers, return_exceptions=True):
+                if isinstance(result, httpx.Response):
+                    await result.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        request_headers: Dict[str, str],
+        data: Optional[Dict[str, Any]],
+        files: Optional[Dict[str, Tuple[str, Any, str]]],
+        content: Union[bytes, AsyncIterable[bytes], None],
+        stream: bool,
+        tried: Optional[Set[str]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> httpx.Response:
+        """레플리카를 골라 한 번 전송하고 브레이커에 결과를 기록
+
+        tried 에 담긴 레플리카는 다른 레플리카가 있으면 피하고, 선택한 레플리카를 tried 에 추가한다.
+        deadline 의 남은 시간을 이번 전송의 타임아웃으로 쓴다.
+        """
+        remaining = deadline.remaining() if deadline is not None else None
+        if remaining is not None and remaining <= 0:
+            raise _deadline_exceeded(deadline)
+        service_breaker = service_breakers[self.service_type]
+        if not service_breaker.try_acquire():
+            raise _unavailable(f"서비스 차단 중 (circuit open): {self.service_type.value}", service_breaker.retry_after())
+
+        # 레플리카 선택 (절대 URL 이면 그대로 사용, 격리된 레플리카는 제외)
+        replica = None
+        if path.startswith("http"):
+            url = path
+        else:
+            replica = self.balancer.choose(exclude=tried or ()) or self.balancer.choose()
+            if replica is None or not replica.breaker.try_acquire():
+                service_breaker.release()
+                retry_after = min((r.breaker.retry_after() for r in self.balancer.replicas), default=1)
+                raise _unavailable(f"사용 가능한 레플리카가 없습니다: {self.service_type.value}", retry_after)
+            url = f"{replica.base_url}/{path}"
+            if tried is not None:
+                tried.add(replica.url)
+        breakers = [service_breaker] + ([replica.breaker] if replica is not None else [])
+        route_timeout = deadline.route_timeout if deadline is not None else None
+
+        # 요청 전송 (서비스별 풀링된 클라이언트 재사용)
+        client = upstream_pool.get(self.service_type)
+        if replica is not None:
+            replica.outstanding += 1
+        started = time.monotonic()
+        try:
+            logger.debug("업스트림 요청 전송", extra={"method": method, "url": url})
+            with tracer.span(f"upstream.{self.service_type.value}", kind="client", **{"http.method": method, "http.url": url}) as span:
+                # 클라이언트가 보낸 traceparent 대신 업스트림 호출 스팬을 부모로 전달
+                headers = {k: v for k, v in request_headers.items() if k.lower() != "traceparent"}
+                headers["traceparent"] = span.context.to_traceparent()
+                if deadline is not None and deadline.propagate:
+                    headers[DEADLINE_HEADER] = str(max(1, int(remaining * 1000)))
+                upstream_request = client.build_request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=data if method in FORM_METHODS else None,
+                    files=files if method == "POST" else None,
+                    content=content,
+                    timeout=remaining if remaining is not None else httpx.USE_CLIENT_DEFAULT,
                 )
+                response = await client.send(upstream_request, stream=stream)
+                span.attributes["http.status_code"] = response.status_code
+            add_upstream_timing(self.service_type.value, response.headers.get("server-timing"))
+            elapsed = time.monotonic() - started
+            logger.debug("업스트림 응답", extra={"status_code": response.status_code, "elapsed_ms": round(elapsed * 1000, 2)})
+            for breaker in breakers:
+                breaker.record(response.status_code < 500, elapsed, route_timeout)
+            record_upstream(self.service_type.value, str(response.status_code), elapsed)
+            if response.status_code < 500:
+                service_retry_policies[self.service_type].latency.record(elapsed)
+                if deadline is not None:
+                    upstream_timeouts.record(deadline.route, elapsed)
+            return response
+
+        except httpx.RequestError as e:
+            elapsed = time.monotonic() - started
+            for breaker in breakers:
+                breaker.record(False, elapsed, route_timeout)
+            record_upstream(self.service_type.value, "error", elapsed)
+            error_msg = f"⚠️요청 중 오류 발생: {type(e).__name__}: {str(e)}"
+            logger.error(error_msg)
+            timed_out = isinstance(e, httpx.TimeoutException)
+            if timed_out and deadline is not None:
+                upstream_timeouts.record_timeout(deadline.route, elapsed)
+            raise UpstreamRequestError(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT if timed_out else status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=error_msg
+            )
+        except BaseException:
+            # 취소 등으로 결과를 알 수 없으면 허가만 반납
+            for breaker in breakers:
+                breaker.release()
+            raise
+        finally:
+            if replica is not None:
+                replica.outstanding -= 1
+
+
+def _deadline_exceeded(deadline: Deadline) -> HTTPException:
+    logger.warning(f"업스트림 마감 시간 초과: {deadline.route} ({deadline.timeout:.3f}s)")
+    return HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        detail=f"업스트림 응답 시간 초과 ({deadline.timeout:.3f}s): {deadline.route}"
+    )
+
+
+def _unavailable(detail: str, retry_after: int) -> HTTPException:
+    logger.warning(detail)
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=detail,
+        headers={"Retry-After": str(retry_after)}
+    )
+
+
+def _overloaded(e: BulkheadRejected) -> HTTPException:
+    # 대기열 초과는 429, 대기 시간 초과는 503 으로 응답
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS if e.reason == "queue_full" else status.HTTP_503_SERVICE_UNAVAILABLE
+    logger.warning(str(e))
+    return HTTPException(
+        status_code=status_code,
+        detail=f"서비스 과부하: {e.name} ({e.reason})",
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+
+def _filter_headers(headers: Union[Mapping[str, str], Iterable[Tuple[bytes, bytes]], None]) -> Dict[str, str]:
+    """전달할 헤더를 정리 (dict 또는 ASGI raw 헤더 목록 모두 허용)"""
+    if not headers:
+        return {}
+    items = headers.items() if isinstance(headers, Mapping) else headers
+    request_headers = {}
+    for k, v in items:
+        if isinstance(k, bytes):
+            k, v = k.decode("latin-1"), v.decode("latin-1")
+        if k.lower() not in EXCLUDED_HEADERS:
+            request_headers[k] = v
+    return request_headers
+
+
+_factories: Dict[ServiceType, ServiceProxyFactory] = {}
+
+
+def get_proxy_factory(service_type: ServiceType) -> ServiceProxyFactory:
+    """서비스 타입별 프록시 팩토리를 재사용하여 반환
+
+    Args:
+        service_type (ServiceType): 서비스 타입
+
+    Returns:
+        ServiceProxyFactory: 캐시된 프록시 팩토리
+    """
+    factory = _factories.get(service_type)
+    if factory is None:
+        factory = ServiceProxyFactory(service_type=service_type)
+        _factories[service_type] = factory
+    return factory
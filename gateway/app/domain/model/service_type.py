@@ -1,4 +1,6 @@
 from enum import Enum
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import json
 import os
 
 # ✅ 서비스 타입 정의
@@ -20,22 +22,92 @@ NLP_SERVICE_URL = os.getenv("NLP_SERVICE_URL")
 TF_SERVICE_URL = os.getenv("TF_SERVICE_URL")
 CHAT_SERVICE_URL = os.getenv("CHAT_SERVICE_URL")
 
-# ✅ 서비스 URL 매핑
+# ✅ 레플리카 목록 파싱
+# 쉼표로 여러 레플리카를 지정하고, ;weight=N 으로 가중치를 줄 수 있음
+# 예: NLP_SERVICE_URL=http://nlp-1:9004;weight=2,http://nlp-2:9004
+# 같은 호스트의 서비스는 unix:///run/ai/nlp.sock (유닉스 소켓), HTTP/2 서버는 h2c://nlp:9004 로 지정
+def parse_replicas(raw: Optional[str]) -> List[Tuple[str, float]]:
+    replicas = []
+    for spec in (raw or "").split(","):
+        url, *options = [part.strip() for part in spec.split(";")]
+        if not url:
+            continue
+        weight = 1.0
+        for option in options:
+            name, _, value = option.partition("=")
+            if name == "weight" and value:
+                weight = float(value)
+        replicas.append((url.rstrip("/"), weight))
+    return replicas
+
+# ✅ 서비스 레플리카 매핑 (시작 시점의 환경변수 값, 실행 중 변경은 routing_table 참고)
+SERVICE_REPLICAS = {
+    ServiceType.TITANIC: parse_replicas(TITANIC_SERVICE_URL),
+    ServiceType.CRIME: parse_replicas(CRIME_SERVICE_URL),
+    ServiceType.MATZIP: parse_replicas(MATZIP_SERVICE_URL),
+    ServiceType.NLP: parse_replicas(NLP_SERVICE_URL),
+    ServiceType.TF: parse_replicas(TF_SERVICE_URL),
+    ServiceType.CHAT: parse_replicas(CHAT_SERVICE_URL),
+}
+
+# ✅ 서비스 URL 매핑 (대표 레플리카)
 SERVICE_URLS = {
-    ServiceType.TITANIC: TITANIC_SERVICE_URL,
-    ServiceType.CRIME: CRIME_SERVICE_URL,
-    ServiceType.MATZIP: MATZIP_SERVICE_URL,
-    ServiceType.NLP: NLP_SERVICE_URL,
-    ServiceType.TF: TF_SERVICE_URL,
-    ServiceType.CHAT: CHAT_SERVICE_URL,
+    service_type: replicas[0][0] if replicas else None
+    for service_type, replicas in SERVICE_REPLICAS.items()
 }
 
-# (선택) 필요하다면 도메인도 별도로 활용 가능
-# 예시
-print(f"도메인: {DOMAIN}")
-print(f"TITANIC 서비스 URL: {SERVICE_URLS[ServiceType.TITANIC]}")
-print(f"CRIME 서비스 URL: {SERVICE_URLS[ServiceType.CRIME]}")
-print(f"MATZIP 서비스 URL: {SERVICE_URLS[ServiceType.MATZIP]}")
-print(f"NLP 서비스 URL: {SERVICE_URLS[ServiceType.NLP]}")
-print(f"TF 서비스 URL: {SERVICE_URLS[ServiceType.TF]}")
-print(f"CHAT 서비스 URL: {SERVICE_URLS[ServiceType.CHAT]}")
+# ✅ 서비스별 동시 실행 제한 (bulkhead)
+# 전역 기본값 GATEWAY_MAX_CONCURRENCY / GATEWAY_MAX_QUEUE / GATEWAY_QUEUE_TIMEOUT 을
+# {SERVICE}_MAX_CONCURRENCY / {SERVICE}_MAX_QUEUE / {SERVICE}_QUEUE_TIMEOUT 으로 덮어씀
+# 예: CHAT_MAX_CONCURRENCY=4, NLP_MAX_CONCURRENCY=2
+class ServiceLimits(NamedTuple):
+    max_concurrency: int
+    max_queue: int
+    queue_timeout: float
+
+def _service_limits(service_type: ServiceType) -> ServiceLimits:
+    prefix = service_type.value.upper()
+    return ServiceLimits(
+        max_concurrency=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", os.getenv("GATEWAY_MAX_CONCURRENCY", "64"))),
+        max_queue=int(os.getenv(f"{prefix}_MAX_QUEUE", os.getenv("GATEWAY_MAX_QUEUE", "128"))),
+        queue_timeout=float(os.getenv(f"{prefix}_QUEUE_TIMEOUT", os.getenv("GATEWAY_QUEUE_TIMEOUT", "5"))),
+    )
+
+SERVICE_LIMITS = {service_type: _service_limits(service_type) for service_type in ServiceType}
+
+# ✅ 서비스별 업로드(POST 본문) 최대 크기 (바이트)
+# 전역 기본값 GATEWAY_MAX_UPLOAD_BYTES 를 {SERVICE}_MAX_UPLOAD_BYTES 로 덮어씀
+# 예: TF_MAX_UPLOAD_BYTES=20971520 (모자이크 이미지 20MB)
+SERVICE_UPLOAD_LIMITS = {
+    service_type: int(os.getenv(
+        f"{service_type.value.upper()}_MAX_UPLOAD_BYTES",
+        os.getenv("GATEWAY_MAX_UPLOAD_BYTES", str(50 * 1024 * 1024))
+    ))
+    for service_type in ServiceType
+}
+
+# ✅ 응답 전달 방식
+class ResponseMode(str, Enum):
+    ENVELOPE = "envelope"  # 업스트림 JSON을 파싱 후 재직렬화 (기존 방식)
+    STREAM = "stream"      # 업스트림 본문을 청크 단위로 그대로 중계
+    PASSTHROUGH = "passthrough"  # 업스트림 원본 바이트와 헤더를 파싱 없이 그대로 전달
+
+# 전역 기본값(GATEWAY_RESPONSE_MODE)과 서비스별 설정({SERVICE}_RESPONSE_MODE)
+DEFAULT_RESPONSE_MODE = ResponseMode(os.getenv("GATEWAY_RESPONSE_MODE", ResponseMode.ENVELOPE.value))
+
+SERVICE_RESPONSE_MODES = {
+    service_type: ResponseMode(os.getenv(f"{service_type.value.upper()}_RESPONSE_MODE", DEFAULT_RESPONSE_MODE.value))
+    for service_type in ServiceType
+}
+
+# ✅ 에러 봉투 매핑 (passthrough 모드에서 명시된 상태 코드만 JSON 봉투로 재작성)
+# 예: GATEWAY_ERROR_MAPPING='{"*": {"500": 502}, "nlp": {"500": 500, "404": 404}}'
+def _load_error_mappings(raw: str) -> Dict[ServiceType, Dict[int, int]]:
+    config = json.loads(raw) if raw else {}
+    defaults = {int(k): int(v) for k, v in config.get("*", {}).items()}
+    return {
+        service_type: {**defaults, **{int(k): int(v) for k, v in config.get(service_type.value, {}).items()}}
+        for service_type in ServiceType
+    }
+
+SERVICE_ERROR_MAPPINGS = _load_error_mappings(os.getenv("GATEWAY_ERROR_MAPPING", ""))
@@ -0,0 +1,238 @@
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, Optional, Tuple
+import asyncio
+import logging
+import math
+import time
+
+from app.domain.model.service_type import SERVICE_LIMITS, ServiceType
+from app.foundation.core.priority import DEFAULT, PRIORITY_CLASSES, PRIORITY_SETTINGS, rank
+
+logger = logging.getLogger("bulkhead")
+
+
+class BulkheadRejected(Exception):
+    """벌크헤드가 요청을 받아들이지 못함
+
+    Attributes:
+        reason (str): "queue_full" (대기열 초과) 또는 "queue_timeout" (대기 시간 초과)
+        retry_after (int): 클라이언트에 안내할 재시도 대기 시간(초)
+    """
+
+    def __init__(self, name: str, reason: str, retry_after: int):
+        super().__init__(f"{name} 벌크헤드 거부: {reason}")
+        self.name = name
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _ClassStats:
+    """우선순위 클래스 하나의 대기 통계"""
+
+    __slots__ = ("admitted", "rejected", "wait_seconds_total", "wait_seconds_max")
+
+    def __init__(self):
+        self.admitted = 0
+        self.rejected = {"queue_full": 0, "queue_timeout": 0}
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, waited: float):
+        self.admitted += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "wait_seconds_total": round(self.wait_seconds_total, 4),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.admitted, 4) if self.admitted else 0.0,
+            "wait_seconds_max": round(self.wait_seconds_max, 4),
+        }
+
+
+class Bulkhead:
+    """서비스 단위 동시 실행 제한과 우선순위 클래스별 대기열
+
+    - 동시 실행 수가 max_concurrent 미만이고 대기자가 없으면 바로 실행
+    - 그렇지 않으면 전체 max_queue 개까지 클래스별 FIFO 로 대기, queue_timeout 을 넘기면 거부
+    - 슬롯이 비면 가중치 비율대로 클래스를 골라 넘겨줌 (stride 방식의 가중 공정 스케줄링)
+    - max_wait 이상 기다린 대기자가 있으면 가장 오래 기다린 대기자를 먼저 실행 (기아 방지)
+    - 대기열이 가득 차면 더 낮은 클래스의 가장 최근 대기자를 밀어내고 자리를 얻음
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        weights: Optional[Dict[str, float]] = None,
+        max_wait: Optional[float] = None,
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.weights = weights or PRIORITY_SETTINGS.weights
+        self.max_wait = max_wait if max_wait is not None else PRIORITY_SETTINGS.max_wait
+        self.active = 0
+        self._waiters: Dict[str, Deque[Tuple[asyncio.Future, float]]] = {p: deque() for p in PRIORITY_CLASSES}
+        # 클래스별 다음 실행 시점(가상 시간) - 실행할 때마다 1/가중치 만큼 늘어남
+        self._pass = {p: 0.0 for p in PRIORITY_CLASSES}
+        self._virtual_time = 0.0
+        self.classes = {p: _ClassStats() for p in PRIORITY_CLASSES}
+        self.rejected = {"queue_full": 0, "queue_timeout": 0}
+        self.admitted = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    @property
+    def queued(self) -> int:
+        return sum(self.queued_by_class().values())
+
+    def queued_by_class(self) -> Dict[str, int]:
+        return {p: sum(1 for waiter, _ in waiters if not waiter.done()) for p, waiters in self._waiters.items()}
+
+    async def acquire(self, priority: str = DEFAULT, timeout: Optional[float] = None) -> float:
+        """실행 슬롯을 얻을 때까지 대기
+
+        Args:
+            priority (str, optional): 우선순위 클래스. 기본값은 "default".
+            timeout (float, optional): 이 요청의 최대 대기 시간(초). queue_timeout 보다 짧을 때만 적용 (요청 마감 시각). 기본값은 None.
+
+        Returns:
+            float: 대기열에서 기다린 시간(초)
+
+        Raises:
+            BulkheadRejected: 대기열이 가득 찼거나 대기 시간이 초과된 경우
+        """
+        if priority not in PRIORITY_CLASSES:
+            # 알 수 없는 클래스는 KeyError 대신 기본 클래스로 처리 (slot() 포함)
+            priority = DEFAULT
+        if self.active < self.max_concurrent and not self.queued:
+            self.active += 1
+            self._record_wait(priority, 0.0)
+            return 0.0
+        if self.queued >= self.max_queue and not self._shed_lower(priority):
+            self._reject(priority, "queue_full")
+            raise BulkheadRejected(self.name, "queue_full", self._retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        started = time.monotonic()
+        self._waiters[priority].append((waiter, started))
+        try:
+            wait = self.queue_timeout if timeout is None else max(0.0, min(self.queue_timeout, timeout))
+            await asyncio.wait_for(waiter, wait)
+        except asyncio.TimeoutError:
+            self._discard(priority, waiter)
+            self._reject(priority, "queue_timeout")
+            raise BulkheadRejected(self.name, "queue_timeout", self._retry_after())
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # 슬롯을 넘겨받은 직후 취소되면 다음 대기자에게 넘긴다
+                self.release()
+            else:
+                self._discard(priority, waiter)
+            raise
+        waited = time.monotonic() - started
+        self._record_wait(priority, waited)
+        return waited
+
+    def release(self):
+        """슬롯 반납 - 대기자가 있으면 스케줄링 순서대로 넘겨주고, 없으면 동시 실행 수를 줄인다."""
+        waiter = self._next_waiter()
+        if waiter is None:
+            self.active -= 1
+            return
+        waiter.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: str = DEFAULT, timeout: Optional[float] = None):
+        await self.acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        queued = self.queued_by_class()
+        return {
+            "active": self.active,
+            "queued": sum(queued.values()),
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.admitted, 4) if self.admitted else 0.0,
+            "wait_seconds_max": round(self.wait_seconds_max, 4),
+            "classes": {
+                p: {"queued": queued[p], "weight": self.weights.get(p, 1.0), **stats.snapshot()}
+                for p, stats in self.classes.items()
+            },
+        }
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        """다음에 실행할 대기자를 꺼냄 (오래 기다린 대기자 > 가상 시간이 가장 이른 클래스)"""
+        heads = {}
+        for p, waiters in self._waiters.items():
+            while waiters and waiters[0][0].done():
+                waiters.popleft()
+            if waiters:
+                heads[p] = waiters[0][1]
+        if not heads:
+            return None
+        now = time.monotonic()
+        overdue = [p for p, enqueued in heads.items() if now - enqueued >= self.max_wait]
+        if overdue:
+            chosen = min(overdue, key=lambda p: heads[p])
+        else:
+            chosen = min(heads, key=lambda p: (max(self._pass[p], self._virtual_time), rank(p)))
+        # 쉬고 있던 클래스가 밀린 몫을 한꺼번에 쓰지 못하도록 현재 가상 시간부터 계산
+        start = max(self._pass[chosen], self._virtual_time)
+        self._virtual_time = start
+        self._pass[chosen] = start + 1.0 / self.weights.get(chosen, 1.0)
+        return self._waiters[chosen].popleft()[0]
+
+    def _shed_lower(self, priority: str) -> bool:
+        """대기열이 가득 찼을 때 priority 보다 낮은 클래스의 가장 최근 대기자를 거부해 자리를 만듦"""
+        for p in reversed(PRIORITY_CLASSES):
+            if rank(p) <= rank(priority):
+                return False
+            waiters = self._waiters[p]
+            while waiters:
+                waiter, _ = waiters.pop()
+                if not waiter.done():
+                    self._reject(p, "queue_full")
+                    waiter.set_exception(BulkheadRejected(self.name, "queue_full", self._retry_after()))
+                    return True
+        return False
+
+    def _reject(self, priority: str, reason: str):
+        self.rejected[reason] += 1
+        self.classes[priority].rejected[reason] += 1
+
+    def _record_wait(self, priority: str, waited: float):
+        self.admitted += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        self.classes[priority].record_wait(waited)
+
+    def _discard(self, priority: str, waiter: asyncio.Future):
+        waiters = self._waiters[priority]
+        for entry in waiters:
+            if entry[0] is waiter:
+                waiters.remove(entry)
+                return
+
+    def _retry_after(self) -> int:
+        return max(1, math.ceil(self.queue_timeout))
+
+
+# ✅ 서비스별 벌크헤드
+service_bulkheads: Dict[ServiceType, Bulkhead] = {
+    service_type: Bulkhead(service_type.value, limits.max_concurrency, limits.max_queue, limits.queue_timeout)
+    for service_type, limits in SERVICE_LIMITS.items()
+}
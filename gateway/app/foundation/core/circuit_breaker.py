@@ -0,0 +1,170 @@
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional
+import logging
+import os
+import time
+
+from app.domain.model.service_type import ServiceType
+
+logger = logging.getLogger("circuit_breaker")
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"        # 정상 - 모든 요청 허용
+    OPEN = "open"            # 차단 - 즉시 실패 응답
+    HALF_OPEN = "half_open"  # 시험 - 제한된 수의 탐색 요청만 허용
+
+
+@dataclass(frozen=True)
+class BreakerSettings:
+    """서킷 브레이커 임계값
+
+    {SERVICE}_BREAKER_* 환경변수가 GATEWAY_BREAKER_* 보다 우선한다. (예: CHAT_BREAKER_SLOW_CALL_SECONDS=20)
+    """
+    window: float = 30.0              # 오류율 집계 구간(초)
+    min_requests: int = 10            # 판정에 필요한 최소 요청 수
+    error_rate: float = 0.5           # 이 비율 이상 실패하면 차단
+    slow_call_seconds: float = 10.0   # 이 시간 이상 걸리면 느린 호출
+    slow_call_fraction: float = 0.8   # 라우트 타임아웃이 지정된 경우 타임아웃의 이 비율 이상 걸려야 느린 호출
+    slow_call_rate: float = 0.8       # 이 비율 이상 느리면 차단
+    open_seconds: float = 15.0        # 차단 유지 시간
+    half_open_probes: int = 3         # 반개방 상태에서 허용할 탐색 요청 수
+
+    @classmethod
+    def from_env(cls, prefix: Optional[str] = None) -> "BreakerSettings":
+        values = {}
+        for name, default in cls.__dataclass_fields__.items():
+            raw = (os.getenv(f"{prefix}_BREAKER_{name.upper()}") if prefix else None) \
+                or os.getenv(f"GATEWAY_BREAKER_{name.upper()}")
+            if raw:
+                values[name] = type(default.default)(raw)
+        return cls(**values)
+
+
+class CircuitBreaker:
+    """오류율/지연 기반 서킷 브레이커 (closed → open → half_open → closed)"""
+
+    def __init__(self, name: str, settings: Optional[BreakerSettings] = None):
+        self.name = name
+        self.settings = settings or BreakerSettings()
+        self._state = BreakerState.CLOSED
+        self._opened_at = 0.0
+        self._outcomes: deque = deque()  # (시각, 실패 여부, 느린 호출 여부)
+        self._failures = 0
+        self._slow_calls = 0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> BreakerState:
+        if self._state == BreakerState.OPEN and time.monotonic() - self._opened_at >= self.settings.open_seconds:
+            self._transition(BreakerState.HALF_OPEN)
+        return self._state
+
+    def is_available(self) -> bool:
+        """요청을 보낼 수 있는 상태인지 (부수효과 없음)"""
+        state = self.state
+        if state == BreakerState.HALF_OPEN:
+            return self._probes_in_flight + self._probe_successes < self.settings.half_open_probes
+        return state == BreakerState.CLOSED
+
+    def try_acquire(self) -> bool:
+        """요청 허가를 받는다. 반개방 상태에서는 탐색 요청 슬롯을 하나 차지한다."""
+        if not self.is_available():
+            return False
+        if self._state == BreakerState.HALF_OPEN:
+            self._probes_in_flight += 1
+        return True
+
+    def release(self):
+        """결과를 기록하지 않고 허가를 반납 (요청 취소 등)"""
+        if self._state == BreakerState.HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record(self, success: bool, latency: float, route_timeout: Optional[float] = None):
+        """요청 결과를 기록하고 상태를 갱신
+
+        Args:
+            success (bool): 성공 여부 (연결 오류, 타임아웃, 5xx 는 실패)
+            latency (float): 응답 헤더까지 걸린 시간(초)
+            route_timeout (float, optional): 라우트 정책에 지정된 타임아웃(초). 수 분씩 걸리는 라우트가
+                정상 응답만으로 느린 호출로 집계되지 않도록 느린 호출 기준을 타임아웃 비율까지 늘린다.
+        """
+        slow = latency >= self.slow_call_threshold(route_timeout)
+        if self._state == BreakerState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if not success or slow:
+                self._transition(BreakerState.OPEN)
+            else:
+                self._probe_successes += 1
+                if self._probe_successes >= self.settings.half_open_probes:
+                    self._transition(BreakerState.CLOSED)
+            return
+        if self._state == BreakerState.OPEN:
+            return
+
+        now = time.monotonic()
+        self._outcomes.append((now, not success, slow))
+        self._failures += not success
+        self._slow_calls += slow
+        self._prune(now)
+        total = len(self._outcomes)
+        if total >= self.settings.min_requests and (
+            self._failures / total >= self.settings.error_rate
+            or self._slow_calls / total >= self.settings.slow_call_rate
+        ):
+            self._transition(BreakerState.OPEN)
+
+    def slow_call_threshold(self, route_timeout: Optional[float] = None) -> float:
+        """느린 호출 기준(초) - 라우트 타임아웃이 있으면 max(slow_call_seconds, 타임아웃 x slow_call_fraction)"""
+        if route_timeout is None:
+            return self.settings.slow_call_seconds
+        return max(self.settings.slow_call_seconds, route_timeout * self.settings.slow_call_fraction)
+
+    def retry_after(self) -> int:
+        """차단 해제까지 남은 시간(초, 올림)"""
+        if self._state != BreakerState.OPEN:
+            return 1
+        remaining = self.settings.open_seconds - (time.monotonic() - self._opened_at)
+        return max(1, int(remaining + 0.999))
+
+    def snapshot(self) -> Dict[str, Any]:
+        self._prune(time.monotonic())
+        total = len(self._outcomes)
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "requests": total,
+            "error_rate": round(self._failures / total, 3) if total else 0.0,
+            "slow_call_rate": round(self._slow_calls / total, 3) if total else 0.0,
+            "retry_after": self.retry_after() if self._state == BreakerState.OPEN else 0,
+        }
+
+    def _prune(self, now: float):
+        while self._outcomes and now - self._outcomes[0][0] > self.settings.window:
+            _, failed, slow = self._outcomes.popleft()
+            self._failures -= failed
+            self._slow_calls -= slow
+
+    def _transition(self, state: BreakerState):
+        if state == self._state:
+            return
+        logger.warning(f"서킷 브레이커 상태 변경: {self.name} {self._state.value} → {state.value}")
+        self._state = state
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        if state == BreakerState.OPEN:
+            self._opened_at = time.monotonic()
+        elif state == BreakerState.CLOSED:
+            self._outcomes.clear()
+            self._failures = 0
+            self._slow_calls = 0
+
+
+# ✅ 서비스 단위 서킷 브레이커 (레플리카 단위 브레이커는 Replica 가 보관)
+service_breakers: Dict[ServiceType, CircuitBreaker] = {
+    service_type: CircuitBreaker(service_type.value, BreakerSettings.from_env(service_type.value.upper()))
+    for service_type in ServiceType
+}
@@ -0,0 +1,216 @@
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+import os
+import random
+import time
+
+from app.domain.model.routing_table import RoutingTable, current_routing_table
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.circuit_breaker import BreakerSettings, CircuitBreaker
+from app.foundation.infrastructure.upstream_transport import resolve_upstream_url
+
+logger = logging.getLogger("load_balancer")
+
+LEAST_OUTSTANDING = "least_outstanding"
+POWER_OF_TWO = "p2c"
+
+
+# 헬스체커가 동작 중이면 아직 확인 전(UNKNOWN)인 레플리카는 첫 헬스체크 성공 전까지 라우팅하지 않음
+# (모델을 불러오느라 포트를 아직 열지 않은 레플리카로 요청이 가지 않도록)
+_probe_required = False
+
+
+def require_probe(required: bool):
+    """UNKNOWN 레플리카를 라우팅에서 제외할지 설정 (헬스체커 시작/종료 시 호출)"""
+    global _probe_required
+    _probe_required = required
+
+
+class HealthState(str, Enum):
+    UNKNOWN = "unknown"  # 아직 헬스체크 전 (헬스체크를 사용하지 않을 때만 라우팅 허용)
+    UP = "up"
+    DOWN = "down"        # 헬스체크 실패 또는 워밍업 중 (라우팅 제외)
+
+
+class Replica:
+    """업스트림 레플리카 - 진행 중 요청 수와 가중치, 슬로우 스타트 시작 시각, 격리용 브레이커를 보관"""
+
+    def __init__(
+        self,
+        url: str,
+        weight: float = 1.0,
+        warming_since: Optional[float] = None,
+        breaker_settings: Optional[BreakerSettings] = None
+    ):
+        self.url = url
+        self.base_url = resolve_upstream_url(url)
+        self.weight = weight
+        self.outstanding = 0
+        self.warming_since = warming_since  # None 이면 슬로우 스타트 없이 전체 가중치
+        self.breaker = CircuitBreaker(url, breaker_settings)
+        self.health = HealthState.UNKNOWN
+        self.draining = False  # 라우팅 테이블에서 빠져 진행 중 요청만 마무리하는 중
+
+    def mark_health(self, health: HealthState):
+        """헬스체크 결과 반영 - 다운에서 복구되면 슬로우 스타트로 다시 투입"""
+        if self.health == HealthState.DOWN and health == HealthState.UP:
+            self.warming_since = time.monotonic()
+        self.health = health
+
+    @property
+    def routable(self) -> bool:
+        if self.draining or self.health == HealthState.DOWN:
+            return False
+        if self.health == HealthState.UNKNOWN and _probe_required:
+            return False
+        return self.breaker.is_available()
+
+    def effective_weight(self, slow_start: float, now: Optional[float] = None) -> float:
+        if self.warming_since is None or slow_start <= 0:
+            return self.weight
+        elapsed = (now or time.monotonic()) - self.warming_since
+        if elapsed >= slow_start:
+            self.warming_since = None
+            return self.weight
+        # 슬로우 스타트 구간에는 가중치를 10% 부터 선형으로 올림
+        return self.weight * max(0.1, elapsed / slow_start)
+
+    def score(self, slow_start: float, now: float) -> float:
+        return (self.outstanding + 1) / self.effective_weight(slow_start, now)
+
+
+class LoadBalancer:
+    """서비스 하나의 레플리카 중 하나를 고르는 부하 분산기
+
+    - least_outstanding: (진행 중 요청 + 1) / 유효 가중치 가 가장 작은 레플리카
+    - p2c: 임의의 두 레플리카 중 위 점수가 작은 쪽 (power of two choices)
+    """
+
+    def __init__(self, replicas: Iterable[Replica], strategy: str = LEAST_OUTSTANDING, slow_start: float = 30.0):
+        self.replicas: List[Replica] = list(replicas)
+        self.draining: List[Replica] = []
+        self.strategy = strategy
+        self.slow_start = slow_start
+
+    def choose(self, exclude: Iterable[str] = ()) -> Optional[Replica]:
+        """요청을 보낼 레플리카 선택
+
+        Args:
+            exclude (Iterable[str], optional): 제외할 레플리카 URL. 기본값은 ().
+
+        Returns:
+            Optional[Replica]: 선택된 레플리카 (후보가 없으면 None)
+        """
+        excluded = set(exclude)
+        # 헬스체크에서 다운되었거나 브레이커가 열린(격리된) 레플리카는 후보에서 제외
+        candidates = [replica for replica in self.replicas if replica.url not in excluded and replica.routable]
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+        now = time.monotonic()
+        if self.strategy == POWER_OF_TWO:
+            first, second = random.sample(candidates, 2)
+            return first if first.score(self.slow_start, now) <= second.score(self.slow_start, now) else second
+        scores = [(replica.score(self.slow_start, now), replica) for replica in candidates]
+        best = min(score for score, _ in scores)
+        return random.choice([replica for score, replica in scores if score == best])
+
+    def add_replica(self, url: str, weight: float = 1.0, breaker_settings: Optional[BreakerSettings] = None) -> Replica:
+        """새 레플리카를 슬로우 스타트 상태로 추가"""
+        replica = Replica(url.rstrip("/"), weight, warming_since=time.monotonic(), breaker_settings=breaker_settings)
+        # 목록을 새로 만들어 교체하므로 다른 코루틴이 순회 중인 목록에는 영향이 없음
+        self.replicas = self.replicas + [replica]
+        logger.info(f"레플리카 추가 (슬로우 스타트 {self.slow_start}s): {replica.url}")
+        return replica
+
+    def remove_replica(self, url: str):
+        """레플리카를 라우팅에서 제외 - 진행 중 요청이 있으면 끝날 때까지 draining 목록에 보관"""
+        url = url.rstrip("/")
+        for replica in self.replicas:
+            if replica.url == url:
+                replica.draining = True
+                self.draining.append(replica)
+                logger.info(f"레플리카 제외 (진행 중 {replica.outstanding}건 마무리 후 정리): {url}")
+        self.replicas = [replica for replica in self.replicas if replica.url != url]
+        self.reap()
+
+    def reap(self) -> int:
+        """진행 중 요청이 모두 끝난 draining 레플리카를 정리하고 남은 수를 반환"""
+        self.draining = [replica for replica in self.draining if replica.outstanding > 0]
+        return len(self.draining)
+
+    def update_replicas(
+        self, replicas: Iterable[Tuple[str, float]], breaker_settings: Optional[BreakerSettings] = None
+    ) -> Tuple[List[Replica], List[str]]:
+        """레플리카 목록을 새 설정으로 맞춤
+
+        - 그대로 남는 레플리카는 상태(브레이커, 헬스, 진행 중 요청 수)를 유지하고 가중치만 갱신
+        - 새 레플리카는 슬로우 스타트로 추가 (draining 중이던 레플리카면 되살림)
+        - 빠진 레플리카는 draining 으로 전환
+
+        Returns:
+            Tuple[List[Replica], List[str]]: 추가된 레플리카, 제외된 URL
+        """
+        wanted = {url.rstrip("/"): weight for url, weight in replicas}
+        current = {replica.url: replica for replica in self.replicas}
+        removed = [url for url in current if url not in wanted]
+        for url in removed:
+            self.remove_replica(url)
+        added = []
+        for url, weight in wanted.items():
+            replica = current.get(url)
+            if replica is not None:
+                replica.weight = weight
+                continue
+            revived = next((r for r in self.draining if r.url == url), None)
+            if revived is not None:
+                self.draining.remove(revived)
+                revived.draining = False
+                revived.weight = weight
+                self.replicas = self.replicas + [revived]
+                continue
+            added.append(self.add_replica(url, weight, breaker_settings))
+        return added, removed
+
+    def stats(self) -> List[Dict[str, object]]:
+        now = time.monotonic()
+        self.reap()
+        return [
+            {
+                "url": replica.url,
+                "weight": replica.weight,
+                "effective_weight": round(replica.effective_weight(self.slow_start, now), 3),
+                "outstanding": replica.outstanding,
+                "health": replica.health.value,
+                "draining": replica.draining,
+                "breaker": replica.breaker.snapshot(),
+            }
+            for replica in self.replicas + self.draining
+        ]
+
+
+def _create_balancer(service_type: ServiceType, replicas: Iterable[Tuple[str, float]]) -> LoadBalancer:
+    breaker_settings = BreakerSettings.from_env(service_type.value.upper())
+    return LoadBalancer(
+        [Replica(url, weight, breaker_settings=breaker_settings) for url, weight in replicas],
+        strategy=os.getenv("GATEWAY_LB_STRATEGY", LEAST_OUTSTANDING),
+        slow_start=float(os.getenv("GATEWAY_LB_SLOW_START", "30")),
+    )
+
+
+# ✅ 서비스별 부하 분산기
+upstream_balancers: Dict[ServiceType, LoadBalancer] = {
+    service_type: _create_balancer(service_type, replicas)
+    for service_type, replicas in current_routing_table().services.items()
+}
+
+
+def apply_replicas(table: RoutingTable) -> Dict[ServiceType, Tuple[List[Replica], List[str]]]:
+    """라우팅 테이블의 레플리카 목록을 서비스별 부하 분산기에 반영 (부하 분산기와 커넥션 풀은 그대로 재사용)"""
+    changes = {}
+    for service_type, replicas in table.services.items():
+        breaker_settings = BreakerSettings.from_env(service_type.value.upper())
+        added, removed = upstream_balancers[service_type].update_replicas(replicas, breaker_settings)
+        if added or removed:
+            changes[service_type] = (added, removed)
+    return changes
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional
+import hashlib
+import json
+import os
+
+from app.domain.model.route_policy import RoutePolicy
+from app.domain.model.service_type import ServiceType
+
+# 우선순위 클래스 (앞쪽일수록 높음)
+INTERACTIVE = "interactive"
+DEFAULT = "default"
+BATCH = "batch"
+PRIORITY_CLASSES = (INTERACTIVE, DEFAULT, BATCH)
+
+PRIORITY_HEADER = "x-priority"
+
+# 서비스 기본 클래스 ({SERVICE}_PRIORITY 로 덮어씀) - 채팅은 사람이 응답을 기다림
+DEFAULT_SERVICE_PRIORITIES = {ServiceType.CHAT: INTERACTIVE}
+
+
+def rank(priority: str) -> int:
+    return PRIORITY_CLASSES.index(priority)
+
+
+def _client_key(key: str) -> str:
+    """설정의 클라이언트 키를 client_identity 형식으로 변환 (원본 API 키면 해시)"""
+    if key.startswith(("key:", "ip:")):
+        return key
+    return "key:" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class PrioritySettings:
+    """우선순위 분류와 가중 공정 스케줄링 설정
+
+    - GATEWAY_PRIORITY_WEIGHTS: 클래스별 가중치 (예: "interactive=8,default=4,batch=1")
+    - GATEWAY_PRIORITY_CLIENTS: 클라이언트별 클래스 JSON (예: '{"<API 키>": "batch", "ip:10.0.0.5": "batch"}')
+    - GATEWAY_PRIORITY_TRUST_HEADER: 1 이면 X-Priority 로 클래스를 올리는 것도 허용 (기본은 낮추기만 허용)
+    - GATEWAY_PRIORITY_MAX_WAIT: 이 시간(초) 이상 기다린 대기자는 가중치와 관계없이 먼저 실행 (기아 방지)
+    - {SERVICE}_PRIORITY: 서비스 기본 클래스
+    """
+    weights: Dict[str, float] = field(default_factory=lambda: {INTERACTIVE: 8.0, DEFAULT: 4.0, BATCH: 1.0})
+    clients: Dict[str, str] = field(default_factory=dict)
+    services: Dict[ServiceType, str] = field(default_factory=lambda: dict(DEFAULT_SERVICE_PRIORITIES))
+    trust_header: bool = False
+    max_wait: float = 2.0
+
+    @classmethod
+    def from_env(cls) -> "PrioritySettings":
+        defaults = cls()
+        weights = dict(defaults.weights)
+        for item in os.getenv("GATEWAY_PRIORITY_WEIGHTS", "").split(","):
+            name, _, value = item.partition("=")
+            if name.strip() in weights and value.strip():
+                weights[name.strip()] = max(0.01, float(value))
+        clients = {
+            _client_key(key): value
+            for key, value in json.loads(os.getenv("GATEWAY_PRIORITY_CLIENTS") or "{}").items()
+            if value in PRIORITY_CLASSES
+        }
+        services = {
+            service_type: os.getenv(f"{service_type.value.upper()}_PRIORITY", defaults.services.get(service_type, DEFAULT))
+            for service_type in ServiceType
+        }
+        return cls(
+            weights=weights,
+            clients=clients,
+            services={k: v for k, v in services.items() if v in PRIORITY_CLASSES},
+            trust_header=os.getenv("GATEWAY_PRIORITY_TRUST_HEADER", "0") == "1",
+            max_wait=float(os.getenv("GATEWAY_PRIORITY_MAX_WAIT", str(defaults.max_wait))),
+        )
+
+
+PRIORITY_SETTINGS = PrioritySettings.from_env()
+
+
+def classify(
+    service_type: ServiceType,
+    route: RoutePolicy,
+    headers: Mapping[str, str],
+    client_id: Optional[str] = None,
+    ceiling: Optional[str] = None,
+    settings: PrioritySettings = PRIORITY_SETTINGS,
+) -> str:
+    """요청의 우선순위 클래스 결정
+
+    클라이언트 설정 > 라우트 정책 > 서비스 기본값 순으로 정하고,
+    X-Priority 헤더는 클래스를 낮출 때만 반영한다. (trust_header 이면 올리는 것도 허용)
+
+    Args:
+        service_type (ServiceType): 서비스 타입
+        route (RoutePolicy): 요청 경로에 일치한 라우트 정책
+        headers (Mapping[str, str]): 요청 헤더
+        client_id (str, optional): client_identity 결과
+        ceiling (str, optional): 호출자가 정한 상한 (예: 비동기 작업은 batch)
+
+    Returns:
+        str: "interactive" | "default" | "batch"
+    """
+    priority = settings.clients.get(client_id or "") or route.priority or settings.services.get(service_type, DEFAULT)
+    requested = next((v.strip().lower() for k, v in headers.items() if k.lower() == PRIORITY_HEADER), None)
+    if requested in PRIORITY_CLASSES and (settings.trust_header or rank(requested) > rank(priority)):
+        priority = requested
+    if ceiling is not None and rank(ceiling) > rank(priority):
+        priority = ceiling
+    return priority
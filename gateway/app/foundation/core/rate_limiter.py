@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import hashlib
+import logging
+import math
+import os
+import time
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.infrastructure.redis_client import get_redis
+
+logger = logging.getLogger("rate_limiter")
+
+# 프록시 뒤에서 실행될 때만 X-Forwarded-For 를 클라이언트 IP 로 신뢰
+TRUST_FORWARDED = os.getenv("GATEWAY_TRUST_FORWARDED", "0") == "1"
+
+# RateLimitMiddleware 가 계산한 현재 요청의 클라이언트 식별자 (우선순위 분류에서 재사용)
+current_client_id: ContextVar[Optional[str]] = ContextVar("current_client_id", default=None)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """토큰 버킷 설정 - 초당 rate 개씩 채워지고 최대 burst 개까지 쌓임"""
+    rate: float
+    burst: int
+
+    @classmethod
+    def parse(cls, raw: Optional[str]) -> Optional["RateLimit"]:
+        """ "초당요청수/버스트" 형식 파싱 (예: "5/10"). 버스트를 생략하면 rate 와 같음"""
+        if not raw:
+            return None
+        rate, _, burst = raw.partition("/")
+        return cls(rate=float(rate), burst=int(burst) if burst else max(1, math.ceil(float(rate))))
+
+
+class MemoryTokenBucketBackend:
+    """프로세스 내 토큰 버킷 (게이트웨이 워커 하나 기준)"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def consume(self, key: str, limit: RateLimit, cost: int = 1) -> Tuple[bool, float, float]:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (float(limit.burst), now))
+        tokens = min(float(limit.burst), tokens + (now - updated) * limit.rate)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        retry_after = 0.0 if allowed else (cost - tokens) / limit.rate
+        return allowed, retry_after, tokens
+
+
+# KEYS[1]=버킷 키, ARGV=rate, burst, cost, now(초)
+_TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisTokenBucketBackend:
+    """Redis 공유 토큰 버킷 - 여러 게이트웨이 워커가 같은 한도를 공유 (Lua 스크립트로 원자적 처리)"""
+
+    def __init__(self, redis=None, namespace: str = "gateway:ratelimit:"):
+        self._redis = redis
+        self.namespace = namespace
+        self._script = None
+
+    async def consume(self, key: str, limit: RateLimit, cost: int = 1) -> Tuple[bool, float, float]:
+        redis = self._redis if self._redis is not None else get_redis()
+        if self._script is None:
+            self._script = redis.register_script(_TOKEN_BUCKET_LUA)
+        allowed, tokens = await self._script(
+            keys=[self.namespace + key], args=[limit.rate, limit.burst, cost, time.time()]
+        )
+        tokens = float(tokens)
+        retry_after = 0.0 if allowed else (cost - tokens) / limit.rate
+        return bool(allowed), retry_after, tokens
+
+
+class RateLimiter:
+    """클라이언트(API 키 또는 IP) × 서비스 단위 요청 제한"""
+
+    def __init__(self, backend, default_limit: Optional[RateLimit], service_limits: Dict[ServiceType, RateLimit]):
+        self.backend = backend
+        self.default_limit = default_limit
+        self.service_limits = service_limits
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """GATEWAY_RATE_LIMIT / {SERVICE}_RATE_LIMIT ("초당요청수/버스트"), GATEWAY_RATE_LIMIT_BACKEND (memory|redis)"""
+        if os.getenv("GATEWAY_RATE_LIMIT_BACKEND", "memory").lower() == "redis":
+            backend = RedisTokenBucketBackend()
+        else:
+            backend = MemoryTokenBucketBackend()
+        service_limits = {}
+        for service_type in ServiceType:
+            limit = RateLimit.parse(os.getenv(f"{service_type.value.upper()}_RATE_LIMIT"))
+            if limit is not None:
+                service_limits[service_type] = limit
+        return cls(backend, RateLimit.parse(os.getenv("GATEWAY_RATE_LIMIT")), service_limits)
+
+    def limit_for(self, service_type: ServiceType) -> Optional[RateLimit]:
+        return self.service_limits.get(service_type, self.default_limit)
+
+    async def check(self, client_id: str, service_type: ServiceType) -> Tuple[bool, float, Optional[RateLimit], float]:
+        """토큰 하나를 소비
+
+        Returns:
+            Tuple[bool, float, Optional[RateLimit], float]: (허용 여부, 재시도 대기 시간(초), 적용된 한도, 남은 토큰)
+        """
+        limit = self.limit_for(service_type)
+        if limit is None:
+            return True, 0.0, None, 0.0
+        try:
+            allowed, retry_after, remaining = await self.backend.consume(f"{service_type.value}:{client_id}", limit)
+        except Exception as e:
+            # 저장소 장애 시에는 요청을 막지 않는다 (fail-open)
+            logger.warning(f"요청 제한 확인 실패 (허용 처리): {str(e)}")
+            return True, 0.0, limit, 0.0
+        if not allowed:
+            self.rejected += 1
+        return allowed, retry_after, limit, remaining
+
+
+def client_identity(headers: Dict[str, str], client_host: Optional[str], trust_forwarded: bool = TRUST_FORWARDED) -> str:
+    """요청 제한 키로 쓸 클라이언트 식별자 (API 키 해시 우선, 없으면 IP)
+
+    Args:
+        headers (Dict[str, str]): 소문자 키의 요청 헤더
+        client_host (str, optional): 접속한 클라이언트 IP
+        trust_forwarded (bool, optional): X-Forwarded-For 의 첫 번째 IP 를 신뢰할지. 기본값은 GATEWAY_TRUST_FORWARDED.
+    """
+    api_key = headers.get("x-api-key")
+    if api_key:
+        return "key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    if trust_forwarded and headers.get("x-forwarded-for"):
+        return "ip:" + headers["x-forwarded-for"].split(",")[0].strip()
+    return f"ip:{client_host or 'unknown'}"
+
+
+# ✅ 게이트웨이 전역 요청 제한기
+rate_limiter = RateLimiter.from_env()
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional
+import os
+import random
+import time
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.utils.latency_tracker import LatencyTracker
+
+# 재시도/헤지해도 결과가 같은 메서드만 대상 (PATCH, POST 제외)
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetrySettings:
+    """재시도 및 헤지 설정
+
+    {SERVICE}_RETRY_* / {SERVICE}_HEDGE* 환경변수가 GATEWAY_RETRY_* / GATEWAY_HEDGE* 보다 우선한다.
+    (예: NLP_HEDGE=1, CHAT_RETRY_MAX=0)
+    """
+    max_retries: int = 2               # 최초 요청 이후 최대 재시도 횟수
+    base_delay: float = 0.05           # 지수 백오프 기본 간격(초)
+    max_delay: float = 1.0             # 백오프 상한(초)
+    retry_statuses: FrozenSet[int] = frozenset({502, 503, 504})
+    budget_ratio: float = 0.1          # 재시도+헤지는 최근 요청 수의 이 비율까지만 허용
+    budget_min_per_second: float = 1.0  # 트래픽이 적을 때도 허용할 초당 재시도 수
+    budget_window: float = 10.0        # 예산 집계 구간(초)
+    hedge: bool = False                # 다른 레플리카로 헤지 요청을 보낼지
+    hedge_quantile: float = 0.95       # 이 분위수 지연을 넘으면 헤지
+    hedge_min_samples: int = 20        # 헤지 판단에 필요한 최소 지연 표본 수
+
+    @classmethod
+    def from_env(cls, prefix: Optional[str] = None) -> "RetrySettings":
+        env_names = {
+            "max_retries": "RETRY_MAX",
+            "base_delay": "RETRY_BASE_DELAY",
+            "max_delay": "RETRY_MAX_DELAY",
+            "retry_statuses": "RETRY_STATUSES",
+            "budget_ratio": "RETRY_BUDGET_RATIO",
+            "budget_min_per_second": "RETRY_BUDGET_MIN_PER_SECOND",
+            "budget_window": "RETRY_BUDGET_WINDOW",
+            "hedge": "HEDGE",
+            "hedge_quantile": "HEDGE_QUANTILE",
+            "hedge_min_samples": "HEDGE_MIN_SAMPLES",
+        }
+        values: Dict[str, Any] = {}
+        for name, suffix in env_names.items():
+            raw = (os.getenv(f"{prefix}_{suffix}") if prefix else None) or os.getenv(f"GATEWAY_{suffix}")
+            if not raw:
+                continue
+            default = cls.__dataclass_fields__[name].default
+            if name == "retry_statuses":
+                values[name] = frozenset(int(code) for code in raw.split(",") if code.strip())
+            elif isinstance(default, bool):
+                values[name] = raw.lower() in ("1", "true", "yes")
+            else:
+                values[name] = type(default)(raw)
+        return cls(**values)
+
+
+class RetryBudget:
+    """재시도 폭주 방지용 예산 - 최근 window 초 동안 재시도 수를 (요청 수 × ratio + 초당 최소값 × window) 로 제한
+
+    1초 단위 버킷을 링 형태로 보관한다.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, window: float):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = max(1, int(window))
+        self._buckets = [[0, 0, 0] for _ in range(self.window)]  # [초, 요청 수, 재시도 수]
+        self.rejected = 0
+
+    def record_request(self):
+        self._bucket()[1] += 1
+
+    def try_spend(self) -> bool:
+        """재시도(또는 헤지) 한 번을 예산에서 차감. 예산이 없으면 False"""
+        now = int(time.monotonic())
+        requests = retries = 0
+        for second, request_count, retry_count in self._buckets:
+            if now - second < self.window:
+                requests += request_count
+                retries += retry_count
+        if retries >= requests * self.ratio + self.min_per_second * self.window:
+            self.rejected += 1
+            return False
+        self._bucket()[2] += 1
+        return True
+
+    def _bucket(self) -> list:
+        now = int(time.monotonic())
+        bucket = self._buckets[now % self.window]
+        if bucket[0] != now:
+            bucket[:] = [now, 0, 0]
+        return bucket
+
+
+class RetryPolicy:
+    """서비스 하나의 재시도 설정, 예산, 지연 분포"""
+
+    def __init__(self, settings: Optional[RetrySettings] = None):
+        self.settings = settings or RetrySettings()
+        self.budget = RetryBudget(
+            self.settings.budget_ratio, self.settings.budget_min_per_second, self.settings.budget_window
+        )
+        self.latency = LatencyTracker()
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def backoff(self, attempt: int) -> float:
+        """full jitter 지수 백오프 - 0 ~ min(max_delay, base_delay × 2^(attempt-1)) 중 임의의 값"""
+        ceiling = min(self.settings.max_delay, self.settings.base_delay * (2 ** max(0, attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def hedge_delay(self) -> Optional[float]:
+        """헤지 요청을 보낼 대기 시간 (헤지 비활성 또는 표본 부족이면 None)"""
+        if not self.settings.hedge or len(self.latency) < self.settings.hedge_min_samples:
+            return None
+        return self.latency.quantile(self.settings.hedge_quantile)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_rejected": self.budget.rejected,
+            "hedge_delay": self.hedge_delay(),
+        }
+
+
+# ✅ 서비스별 재시도 정책
+service_retry_policies: Dict[ServiceType, RetryPolicy] = {
+    service_type: RetryPolicy(RetrySettings.from_env(service_type.value.upper()))
+    for service_type in ServiceType
+}
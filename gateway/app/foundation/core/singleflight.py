@@ -0,0 +1,77 @@
+from typing import Any, Awaitable, Callable, Dict, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger("singleflight")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 하나의 실행으로 합치고 결과를 모든 대기자에게 전달
+
+    - 대기자 한 명이 취소되어도 공유 실행은 계속된다.
+    - 마지막 대기자까지 취소되면 공유 실행도 취소한다.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.executions = 0   # 실제로 실행된 호출 수
+        self.coalesced = 0    # 진행 중인 호출에 합류한 대기자 수
+        self.cancelled = 0    # 대기자가 모두 떠나 취소된 실행 수
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """키에 해당하는 호출을 실행하거나 진행 중인 호출에 합류
+
+        Args:
+            key (str): 동일 요청 판별 키
+            fn (Callable): 실행할 코루틴 함수
+
+        Returns:
+            Tuple[Any, bool]: (결과, 다른 호출의 결과를 공유받았는지 여부)
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), shared
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                flight.waiters -= 1
+                if flight.waiters == 0:
+                    # 새 요청이 취소 중인 실행에 합류하지 않도록 먼저 제거
+                    self._forget(key, flight)
+                    flight.task.cancel()
+                    self.cancelled += 1
+                    logger.info(f"대기자가 모두 취소되어 공유 요청 취소: {key}")
+            raise
+
+    def _forget(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executions": self.executions,
+            "coalesced_waiters": self.coalesced,
+            "cancelled": self.cancelled,
+            "inflight_keys": len(self._flights),
+            "inflight_waiters": sum(flight.waiters for flight in self._flights.values()),
+        }
+
+
+# ✅ 게이트웨이 GET 요청 병합기
+request_coalescer = SingleFlight()
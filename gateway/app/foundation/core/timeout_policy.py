@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+import os
+import time
+
+from app.domain.model.route_policy import RoutePolicy
+from app.foundation.utils.latency_tracker import LatencyTracker
+
+# 클라이언트가 기다릴 수 있는 남은 시간(ms). 게이트웨이는 남은 예산으로 바꿔서 업스트림에 전달한다.
+DEADLINE_HEADER = "x-request-timeout-ms"
+
+
+@dataclass(frozen=True)
+class TimeoutSettings:
+    """적응형 업스트림 타임아웃 설정 (GATEWAY_ADAPTIVE_TIMEOUT* 환경변수)
+
+    적응형 타임아웃 = clamp(최근 지연의 quantile 분위수 × headroom, min_timeout, 라우트/서비스 타임아웃)
+    표본이 min_samples 보다 적으면 라우트/서비스 타임아웃을 그대로 사용한다.
+    """
+    enabled: bool = False      # 라우트 정책에 adaptive_timeout 이 없을 때의 기본값
+    quantile: float = 0.99
+    headroom: float = 2.0
+    min_timeout: float = 1.0
+    min_samples: int = 20
+
+    @classmethod
+    def from_env(cls) -> "TimeoutSettings":
+        env_names = {
+            "enabled": "GATEWAY_ADAPTIVE_TIMEOUT",
+            "quantile": "GATEWAY_ADAPTIVE_TIMEOUT_QUANTILE",
+            "headroom": "GATEWAY_ADAPTIVE_TIMEOUT_HEADROOM",
+            "min_timeout": "GATEWAY_ADAPTIVE_TIMEOUT_MIN",
+            "min_samples": "GATEWAY_ADAPTIVE_TIMEOUT_MIN_SAMPLES",
+        }
+        values: Dict[str, Any] = {}
+        for name, env_name in env_names.items():
+            raw = os.getenv(env_name)
+            if not raw:
+                continue
+            default = cls.__dataclass_fields__[name].default
+            values[name] = raw.lower() in ("1", "true", "yes") if isinstance(default, bool) else type(default)(raw)
+        return cls(**values)
+
+
+class Deadline:
+    """요청 하나의 업스트림 마감 시각 (재시도/헤지가 같은 예산을 나눠 씀)
+
+    Attributes:
+        route (str): 지연을 집계할 라우트 템플릿
+        timeout (float): 처음 정해진 타임아웃(초)
+        propagate (bool): 남은 예산을 DEADLINE_HEADER 로 업스트림에 전달할지 여부
+        route_timeout (float, optional): 라우트 정책에 지정된 타임아웃(초). 서킷 브레이커의 느린 호출 기준에 사용
+    """
+
+    __slots__ = ("route", "timeout", "propagate", "route_timeout", "expires_at")
+
+    def __init__(self, route: str, timeout: float, propagate: bool = True, route_timeout: Optional[float] = None):
+        self.route = route
+        self.timeout = timeout
+        self.propagate = propagate
+        self.route_timeout = route_timeout
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+
+def client_budget(headers: Mapping[str, str]) -> Optional[float]:
+    """클라이언트가 보낸 DEADLINE_HEADER 를 초 단위로 변환 (없거나 잘못된 값이면 None)"""
+    for key, value in headers.items():
+        if key.lower() == DEADLINE_HEADER:
+            try:
+                return max(0.0, float(value) / 1000)
+            except ValueError:
+                return None
+    return None
+
+
+class UpstreamTimeouts:
+    """라우트별 지연 분포로 업스트림 타임아웃을 정하는 정책"""
+
+    def __init__(self, settings: Optional[TimeoutSettings] = None):
+        self.settings = settings or TimeoutSettings.from_env()
+        self._latency: Dict[str, LatencyTracker] = {}
+        self._current: Dict[str, float] = {}
+        self._timeouts: Dict[str, int] = {}
+
+    def timeout_for(self, policy: RoutePolicy, default: float) -> float:
+        """라우트 정책과 서비스 기본값으로 이번 요청의 타임아웃(초) 계산
+
+        Args:
+            policy (RoutePolicy): 요청 경로에 일치한 라우트 정책
+            default (float): 서비스 기본 업스트림 타임아웃
+
+        Returns:
+            float: 적응형이면 지연 분위수 × headroom (라우트/서비스 타임아웃을 넘지 않음), 아니면 고정 타임아웃
+        """
+        ceiling = policy.timeout if policy.timeout is not None else default
+        adaptive = policy.adaptive_timeout if policy.adaptive_timeout is not None else self.settings.enabled
+        timeout = ceiling
+        tracker = self._latency.get(policy.route)
+        if adaptive and tracker is not None and len(tracker) >= self.settings.min_samples:
+            observed = tracker.quantile(self.settings.quantile) * self.settings.headroom
+            timeout = min(ceiling, max(self.settings.min_timeout, observed))
+        self._current[policy.route] = timeout
+        return timeout
+
+    def record(self, route: str, seconds: float):
+        tracker = self._latency.get(route)
+        if tracker is None:
+            tracker = self._latency[route] = LatencyTracker()
+        tracker.record(seconds)
+
+    def record_timeout(self, route: str, seconds: float):
+        """타임아웃도 지연 표본으로 남겨 업스트림이 느려지면 적응형 타임아웃이 다시 늘어나게 함"""
+        self._timeouts[route] = self._timeouts.get(route, 0) + 1
+        self.record(route, seconds)
+
+    def stats(self, service: str) -> Dict[str, Dict[str, Any]]:
+        prefix = f"{service}/"
+        return {
+            route: {
+                "timeout": self._current.get(route),
+                "samples": len(tracker),
+                "latency_quantile": tracker.quantile(self.settings.quantile),
+                "timeouts": self._timeouts.get(route, 0),
+            }
+            for route, tracker in self._latency.items()
+            if route.startswith(prefix)
+        }
+
+
+# ✅ 라우트별 업스트림 타임아웃
+upstream_timeouts = UpstreamTimeouts()
@@ -0,0 +1,434 @@
+"""
+W3C Trace Context 전파와 Server-Timing 헤더
+
+게이트웨이와 각 서비스가 같은 파일을 복사해서 사용한다. (서비스마다 빌드 컨텍스트가 분리되어 있음)
+외부 의존성 없이 동작하며, 스팬은 환경변수에 따라 JSONL 파일 또는 OTLP/HTTP 수집기로 내보낸다.
+
+- OTEL_SERVICE_NAME: 스팬에 기록할 서비스 이름 (기본값은 configure_tracing 인자)
+- OTEL_TRACES_EXPORTER: none | file | otlp (기본값 none - Server-Timing 만 기록)
+- TRACE_FILE: file 익스포터 경로 (기본값 traces/{service}.jsonl)
+- OTEL_EXPORTER_OTLP_ENDPOINT: otlp 익스포터 주소 (기본값 http://otel-collector:4318)
+
+서비스에서는 게이트웨이가 보낸 X-Request-Timeout-Ms 마감도 함께 적용해 기다리는 쪽이 없는 요청을 중단한다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import re
+import secrets
+import threading
+import time
+import urllib.request
+
+logger = logging.getLogger("tracing")
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+# Server-Timing 메트릭 이름은 HTTP token 문자만 허용
+_TOKEN_RE = re.compile(r"[^!#$%&'*+\-.^_`|~0-9A-Za-z]")
+# 게이트웨이가 남은 요청 예산(ms)을 전달하는 헤더
+DEADLINE_HEADER = b"x-request-timeout-ms"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    @classmethod
+    def new(cls, trace_id: Optional[str] = None, sampled: bool = True) -> "SpanContext":
+        return cls(trace_id or secrets.token_hex(16), secrets.token_hex(8), sampled)
+
+    @classmethod
+    def parse(cls, traceparent: Optional[str]) -> Optional["SpanContext"]:
+        """traceparent 헤더 파싱 (형식이 잘못되었거나 ID 가 모두 0 이면 None)"""
+        match = TRACEPARENT_RE.match((traceparent or "").strip().lower())
+        if not match or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+            return None
+        return cls(match.group(1), match.group(2), int(match.group(3), 16) & 1 == 1)
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    parent_id: Optional[str]
+    service: str
+    kind: str = "internal"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.time)
+    duration: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "service": self.service,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+@dataclass
+class RequestTrace:
+    """요청 하나에서 끝난 스팬들 (Server-Timing 헤더 생성용)"""
+    root: Span
+    stages: List[Span] = field(default_factory=list)
+    # 하위 서비스가 돌려준 Server-Timing 항목 (서비스 이름 접두사를 붙여 그대로 전달)
+    upstream_timings: List[str] = field(default_factory=list)
+
+    def server_timing(self) -> str:
+        entries = [f"total;dur={(time.time() - self.root.start_time) * 1000:.1f}"]
+        entries += [f"{_TOKEN_RE.sub('_', span.name)};dur={span.duration * 1000:.1f}" for span in self.stages]
+        return ", ".join(entries + self.upstream_timings)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_current_request: ContextVar[Optional[RequestTrace]] = ContextVar("current_request_trace", default=None)
+
+
+class JsonFileExporter:
+    """스팬을 한 줄에 하나씩 JSON 으로 파일에 추가 (백그라운드 스레드)
+
+    요청을 처리하는 쪽은 큐에 넣기만 하고, 직렬화와 파일 쓰기는 출력 스레드가 담당한다.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="trace-file-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def export(self, span: Span):
+        self._queue.put(span.to_dict())
+
+    def shutdown(self):
+        """남은 스팬을 모두 쓰고 출력 스레드 종료"""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                item = self._queue.get()
+                if item is self._STOP:
+                    return
+                f.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+                # 큐가 비었을 때만 flush 해서 몰려온 스팬은 한 번에 기록
+                if self._queue.empty():
+                    f.flush()
+
+
+class OtlpHttpExporter:
+    """OTLP/HTTP(JSON) 수집기로 스팬을 묶어서 전송 (백그라운드 스레드, 실패 시 버림)"""
+
+    def __init__(self, endpoint: str, service: str, batch_size: int = 64, flush_interval: float = 2.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service = service
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._spans: List[Span] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def export(self, span: Span):
+        with self._cond:
+            self._spans.append(span)
+            if len(self._spans) >= self.batch_size:
+                self._cond.notify()
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=5)
+
+    def encode(self, spans: List[Span]) -> Dict[str, Any]:
+        """OTLP JSON 형식의 ExportTraceServiceRequest"""
+        return {"resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", self.service)]},
+            "scopeSpans": [{
+                "scope": {"name": "app.tracing"},
+                "spans": [{
+                    "traceId": span.context.trace_id,
+                    "spanId": span.context.span_id,
+                    "parentSpanId": span.parent_id or "",
+                    "name": span.name,
+                    "kind": 2 if span.kind == "server" else 3 if span.kind == "client" else 1,
+                    "startTimeUnixNano": str(int(span.start_time * 1e9)),
+                    "endTimeUnixNano": str(int((span.start_time + span.duration) * 1e9)),
+                    "attributes": [_otlp_attribute(k, v) for k, v in span.attributes.items()],
+                    "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+                } for span in spans],
+            }],
+        }]}
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._closed and len(self._spans) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                spans, self._spans = self._spans, []
+                closed = self._closed
+            if spans:
+                self._post(spans)
+            if closed:
+                return
+
+    def _post(self, spans: List[Span]):
+        body = json.dumps(self.encode(spans), ensure_ascii=False).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        try:
+            urllib.request.urlopen(request, timeout=5).close()
+        except Exception as e:
+            logger.warning(f"스팬 전송 실패 ({len(spans)}개 버림): {str(e)}")
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Tracer:
+    def __init__(self, service: str = "app", exporter=None):
+        self.service = service
+        self.exporter = exporter
+
+    def configure(self, service: str):
+        """환경변수로 서비스 이름과 익스포터를 설정"""
+        self.service = os.getenv("OTEL_SERVICE_NAME", service)
+        kind = os.getenv("OTEL_TRACES_EXPORTER", "none").lower()
+        if kind == "file":
+            self.exporter = JsonFileExporter(os.getenv("TRACE_FILE", f"traces/{self.service}.jsonl"))
+        elif kind == "otlp":
+            endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://otel-collector:4318")
+            self.exporter = OtlpHttpExporter(endpoint, self.service)
+        else:
+            self.exporter = None
+
+    def shutdown(self):
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes):
+        """현재 스팬의 자식 스팬을 만들고, 끝나면 내보낸 뒤 요청의 Server-Timing 단계로 기록"""
+        parent = _current_span.get()
+        context = SpanContext.new(parent.context.trace_id, parent.context.sampled) if parent else SpanContext.new()
+        span = Span(name, context, parent.context.span_id if parent else None, self.service, kind, attributes)
+        token = _current_span.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            _current_span.reset(token)
+            request = _current_request.get()
+            if request is not None:
+                request.stages.append(span)
+            self._export(span)
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """함수 실행 구간을 스팬으로 기록하는 데코레이터 (동기/비동기 모두 지원)"""
+        def decorator(fn):
+            span_name = name or fn.__name__
+            if asyncio.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(span_name):
+                        return await fn(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _export(self, span: Span):
+        if self.exporter is None or not span.context.sampled:
+            return
+        try:
+            self.exporter.export(span)
+        except Exception as e:
+            logger.warning(f"스팬 기록 실패: {str(e)}")
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def add_upstream_timing(service: str, server_timing: Optional[str]):
+    """하위 서비스 응답의 Server-Timing 항목을 현재 요청 헤더에 {service}.{name} 으로 합침"""
+    request = _current_request.get()
+    if request is None or not server_timing:
+        return
+    for entry in server_timing.split(","):
+        entry = entry.strip()
+        if entry:
+            request.upstream_timings.append(f"{service}.{entry}")
+
+
+class TracingMiddleware:
+    """들어온 traceparent 를 이어받아 서버 스팬을 만들고 응답에 Server-Timing 헤더를 추가하는 ASGI 미들웨어"""
+
+    def __init__(self, app, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        incoming = SpanContext.parse(headers.get("traceparent"))
+        context = SpanContext.new(incoming.trace_id, incoming.sampled) if incoming else SpanContext.new()
+        root = Span(
+            f"{scope['method']} {scope['path']}", context, incoming.span_id if incoming else None,
+            self.tracer.service, "server", {"http.method": scope["method"], "http.target": scope["path"]},
+        )
+        request = RequestTrace(root)
+        span_token = _current_span.set(root)
+        request_token = _current_request.set(request)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                root.attributes["http.status_code"] = message["status"]
+                response_headers = [
+                    (k, v) for k, v in message.get("headers", []) if k.lower() not in (b"server-timing", b"traceparent")
+                ]
+                response_headers.append((b"server-timing", request.server_timing().encode("latin-1")))
+                response_headers.append((b"traceparent", context.to_traceparent().encode("latin-1")))
+                message = {**message, "headers": response_headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except BaseException as e:
+            root.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            root.duration = time.perf_counter() - started
+            _current_span.reset(span_token)
+            _current_request.reset(request_token)
+            self.tracer._export(root)
+
+
+class DeadlineMiddleware:
+    """X-Request-Timeout-Ms 마감까지 응답을 시작하지 못하면 핸들러를 취소하고 504 로 응답하는 ASGI 미들웨어
+
+    마감이 이미 지난 요청은 핸들러를 실행하지 않는다. 응답을 시작한 뒤에는 끝까지 보낸다.
+    동기 핸들러는 스레드풀에서 실행되므로 취소해도 스레드의 작업은 끝날 때까지 계속된다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        budget = _deadline_budget(scope) if scope["type"] == "http" else None
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+        if budget <= 0:
+            await _send_deadline_exceeded(send, scope)
+            return
+
+        response_started = False
+
+        async def send_tracking(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        task = asyncio.ensure_future(self.app(scope, receive, send_tracking))
+        try:
+            done, _ = await asyncio.wait({task}, timeout=budget)
+            if done or response_started:
+                await task
+                return
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            await _send_deadline_exceeded(send, scope)
+        except BaseException:
+            # 클라이언트 연결 종료 등으로 바깥이 취소되면 핸들러도 취소
+            if not task.done():
+                task.cancel()
+            raise
+
+
+def _deadline_budget(scope) -> Optional[float]:
+    for key, value in scope["headers"]:
+        if key.lower() == DEADLINE_HEADER:
+            try:
+                return float(value) / 1000
+            except ValueError:
+                return None
+    return None
+
+
+async def _send_deadline_exceeded(send, scope):
+    logger.warning(f"요청 마감 시간 초과로 처리 중단: {scope['method']} {scope['path']}")
+    body = json.dumps({"detail": "요청 마감 시간(X-Request-Timeout-Ms)을 초과했습니다."}, ensure_ascii=False).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": 504,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+# ✅ 프로세스 전역 트레이서
+tracer = Tracer()
+traced = tracer.traced
+
+
+def configure_tracing(app, service: str, enforce_deadline: bool = True):
+    """앱에 트레이싱 미들웨어를 등록 (가장 바깥에서 실행되도록 미들웨어 중 마지막에 호출)
+
+    enforce_deadline 이면 트레이싱 바로 안쪽에 DeadlineMiddleware 를 등록한다.
+    (게이트웨이는 업스트림 호출마다 마감을 직접 적용하므로 False)
+    """
+    tracer.configure(service)
+    if enforce_deadline:
+        app.add_middleware(DeadlineMiddleware)
+    app.add_middleware(TracingMiddleware, tracer=tracer)
@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, List, Optional
+import asyncio
+import logging
+import os
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.load_balancer import HealthState, Replica, require_probe, upstream_balancers
+from app.foundation.infrastructure.http_client_pool import upstream_pool
+
+logger = logging.getLogger("health_checker")
+
+# 상태 페이로드의 status 값이 이 중 하나가 아니면 (예: "loading") 워밍업 중으로 간주
+READY_STATUSES = {"online", "ok", "up", "healthy", "ready"}
+
+
+class HealthChecker:
+    """모든 서비스 레플리카를 주기적으로 확인하는 백그라운드 작업
+
+    - 응답 코드가 500 미만이면 살아있는 것으로 본다. (루트 경로가 없는 서비스의 404 포함)
+    - JSON 본문에 status 필드가 있으면 READY_STATUSES 일 때만 정상으로 본다.
+    - 연속 unhealthy_threshold 회 실패하면 다운으로 표시하고 라우팅에서 제외한다.
+    - 동작 중에는 새 레플리카(시작 시점, 라우팅 테이블 교체로 추가된 레플리카 모두)를 첫 확인에 성공할 때까지 라우팅하지 않는다.
+    """
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        timeout: float = 2.0,
+        unhealthy_threshold: int = 2,
+        health_paths: Optional[Dict[ServiceType, str]] = None
+    ):
+        self.interval = interval
+        self.timeout = timeout
+        self.unhealthy_threshold = unhealthy_threshold
+        self.health_paths = health_paths or {}
+        self._failures: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "HealthChecker":
+        return cls(
+            interval=float(os.getenv("GATEWAY_HEALTH_INTERVAL", "10")),
+            timeout=float(os.getenv("GATEWAY_HEALTH_TIMEOUT", "2")),
+            unhealthy_threshold=int(os.getenv("GATEWAY_HEALTH_UNHEALTHY_THRESHOLD", "2")),
+            health_paths={
+                service_type: os.getenv(f"{service_type.value.upper()}_HEALTH_PATH", "/")
+                for service_type in ServiceType
+            },
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """백그라운드 헬스체크 시작 (GATEWAY_HEALTH_CHECKS=0 이면 사용 안 함)"""
+        if self.running or os.getenv("GATEWAY_HEALTH_CHECKS", "1") == "0":
+            return
+        self._task = asyncio.create_task(self._run(), name="gateway-health-checker")
+        require_probe(True)
+        logger.info(f"헬스체크 시작: {self.interval}s 간격")
+
+    async def stop(self):
+        task, self._task = self._task, None
+        require_probe(False)
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self):
+        while True:
+            try:
+                await self.check_all()
+            except Exception as e:
+                logger.error(f"헬스체크 실행 중 오류: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    async def check_all(self):
+        """모든 서비스의 모든 레플리카를 동시에 확인"""
+        probes = [
+            self.check_replica(service_type, replica)
+            for service_type, balancer in upstream_balancers.items()
+            for replica in balancer.replicas
+        ]
+        await asyncio.gather(*probes)
+        self.last_run = asyncio.get_running_loop().time()
+
+    async def check_replica(self, service_type: ServiceType, replica: Replica) -> HealthState:
+        """레플리카 하나를 확인하고 상태를 반영
+
+        Returns:
+            HealthState: 반영된 상태
+        """
+        path = self.health_paths.get(service_type, "/")
+        healthy = False
+        try:
+            response = await upstream_pool.get(service_type).get(
+                f"{replica.base_url}/{path.lstrip('/')}", timeout=self.timeout
+            )
+            healthy = response.status_code < 500 and _payload_ready(response)
+        except httpx.HTTPError as e:
+            logger.debug(f"헬스체크 실패: {replica.url} ({type(e).__name__})")
+
+        if healthy:
+            self._failures[replica.url] = 0
+            state = HealthState.UP
+        else:
+            self._failures[replica.url] = self._failures.get(replica.url, 0) + 1
+            state = HealthState.DOWN if self._failures[replica.url] >= self.unhealthy_threshold else replica.health
+        if state != replica.health:
+            logger.warning(f"레플리카 상태 변경: {service_type.value} {replica.url} {replica.health.value} → {state.value}")
+            replica.mark_health(state)
+        return state
+
+    def readiness(self, required: Iterable[ServiceType]) -> Dict[str, object]:
+        """필수 서비스마다 정상 레플리카가 하나 이상 있는지 집계"""
+        services = {}
+        for service_type in required:
+            replicas = upstream_balancers[service_type].replicas
+            up = [r.url for r in replicas if r.health == HealthState.UP]
+            services[service_type.value] = {
+                "ready": bool(up),
+                "up": len(up),
+                "total": len(replicas),
+                "replicas": {r.url: r.health.value for r in replicas},
+            }
+        return {"ready": all(s["ready"] for s in services.values()), "services": services}
+
+
+def _payload_ready(response: httpx.Response) -> bool:
+    if "json" not in response.headers.get("content-type", ""):
+        return True
+    try:
+        payload = response.json()
+    except ValueError:
+        return True
+    if isinstance(payload, dict) and isinstance(payload.get("status"), str):
+        return payload["status"].lower() in READY_STATUSES
+    return True
+
+
+def required_services() -> List[ServiceType]:
+    """준비 상태 판단에 필요한 서비스 (GATEWAY_READY_SERVICES, 기본값은 레플리카가 설정된 모든 서비스)"""
+    configured = os.getenv("GATEWAY_READY_SERVICES")
+    if configured:
+        return [ServiceType(name.strip()) for name in configured.split(",") if name.strip()]
+    return [service_type for service_type, balancer in upstream_balancers.items() if balancer.replicas]
+
+
+# ✅ 게이트웨이 전역 헬스체커
+health_checker = HealthChecker.from_env()
@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+import logging
+import os
+
+import httpx
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.infrastructure.upstream_transport import UpstreamTransport
+
+logger = logging.getLogger("http_client_pool")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """업스트림 커넥션 풀 설정
+
+    전역 값은 GATEWAY_POOL_* 환경변수로, 서비스별 값은 {SERVICE}_POOL_* 환경변수로 덮어쓴다.
+    (예: CHAT_POOL_MAX_CONNECTIONS=20)
+    timeout 은 GATEWAY_UPSTREAM_TIMEOUT / {SERVICE}_UPSTREAM_TIMEOUT 이며 라우트 정책에 타임아웃이 없을 때 쓰인다.
+    """
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls, service_type: ServiceType) -> "PoolSettings":
+        prefix = service_type.value.upper()
+        max_connections = _env_int("GATEWAY_POOL_MAX_CONNECTIONS", cls.max_connections)
+        max_keepalive = _env_int("GATEWAY_POOL_MAX_KEEPALIVE", cls.max_keepalive_connections)
+        keepalive_expiry = _env_float("GATEWAY_POOL_KEEPALIVE_EXPIRY", cls.keepalive_expiry)
+        timeout = _env_float("GATEWAY_UPSTREAM_TIMEOUT", cls.timeout)
+        return cls(
+            max_connections=_env_int(f"{prefix}_POOL_MAX_CONNECTIONS", max_connections),
+            max_keepalive_connections=_env_int(f"{prefix}_POOL_MAX_KEEPALIVE", max_keepalive),
+            keepalive_expiry=_env_float(f"{prefix}_POOL_KEEPALIVE_EXPIRY", keepalive_expiry),
+            timeout=_env_float(f"{prefix}_UPSTREAM_TIMEOUT", timeout),
+        )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class UpstreamClientPool:
+    """ServiceType 별로 하나의 장기 실행 httpx.AsyncClient 를 보관하는 풀
+
+    게이트웨이 lifespan 에서 startup()/shutdown() 으로 생성과 정리를 담당한다.
+    """
+
+    def __init__(self):
+        self._clients: Dict[ServiceType, httpx.AsyncClient] = {}
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+
+    @property
+    def started(self) -> bool:
+        return bool(self._clients)
+
+    async def startup(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """모든 서비스의 클라이언트를 생성
+
+        Args:
+            transport (httpx.AsyncBaseTransport, optional): 테스트용 전송 계층. 기본값은 None.
+        """
+        self._transport = transport
+        for service_type in ServiceType:
+            if service_type not in self._clients:
+                self._clients[service_type] = self._create_client(service_type)
+        logger.info(f"업스트림 커넥션 풀 생성 완료: {len(self._clients)}개 서비스")
+
+    async def shutdown(self):
+        """보관 중인 모든 클라이언트를 닫는다."""
+        clients, self._clients = self._clients, {}
+        for service_type, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"클라이언트 종료 중 오류 ({service_type.value}): {str(e)}")
+        self._transport = None
+        logger.info("업스트림 커넥션 풀 종료 완료")
+
+    def get(self, service_type: ServiceType) -> httpx.AsyncClient:
+        """서비스 타입에 해당하는 클라이언트를 반환 (없으면 생성)
+
+        Args:
+            service_type (ServiceType): 서비스 타입
+
+        Returns:
+            httpx.AsyncClient: 커넥션이 재사용되는 클라이언트
+        """
+        client = self._clients.get(service_type)
+        if client is None or client.is_closed:
+            client = self._create_client(service_type)
+            self._clients[service_type] = client
+        return client
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """서비스별 커넥션 풀 상태 (httpcore 내부 상태를 읽으므로 확인할 수 없으면 건너뜀)
+
+        Returns:
+            Dict[str, Dict[str, int]]: 활성/유휴 연결 수, 처리 중/연결 대기 중 요청 수
+        """
+        stats = {}
+        for service_type, client in self._clients.items():
+            transport = getattr(client, "_transport", None)
+            # 전송 방식(TCP, h2c, 소켓 경로)별 풀을 합산
+            transports = transport.transports if isinstance(transport, UpstreamTransport) else [transport]
+            pools = [getattr(t, "_pool", None) for t in transports]
+            if None in pools:
+                continue
+            try:
+                idle = [connection.is_idle() for pool in pools for connection in pool.connections]
+                queued = [request.is_queued() for pool in pools for request in pool._requests]
+            except AttributeError:
+                continue
+            stats[service_type.value] = {
+                "active_connections": idle.count(False),
+                "idle_connections": idle.count(True),
+                "active_requests": queued.count(False),
+                "queued_requests": queued.count(True),
+            }
+        return stats
+
+    def _create_client(self, service_type: ServiceType) -> httpx.AsyncClient:
+        settings = PoolSettings.from_env(service_type)
+        logger.info(
+            f"클라이언트 생성: {service_type.value} "
+            f"(max_connections={settings.max_connections}, "
+            f"max_keepalive={settings.max_keepalive_connections})"
+        )
+        if self._transport is not None:
+            return httpx.AsyncClient(timeout=httpx.Timeout(settings.timeout), transport=self._transport)
+        # unix:// 와 h2c:// 레플리카는 UpstreamTransport 가 소켓/HTTP2 풀로 보냄
+        transport = UpstreamTransport(settings.limits(), http2_over_tls=os.getenv("GATEWAY_UPSTREAM_HTTP2", "0") == "1")
+        return httpx.AsyncClient(timeout=httpx.Timeout(settings.timeout), transport=transport)
+
+
+# ✅ 게이트웨이 전역 커넥션 풀
+upstream_pool = UpstreamClientPool()
@@ -0,0 +1,209 @@
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from dataclasses import replace
+import asyncio
+import hashlib
+import logging
+import os
+import secrets
+import time
+
+from fastapi import HTTPException, status
+
+from app.domain.model.response_snapshot import ResponseSnapshot
+from app.foundation.core.singleflight import SingleFlight
+from app.foundation.infrastructure.response_cache import MemoryCacheBackend, RedisCacheBackend
+
+logger = logging.getLogger("idempotency_store")
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = "idempotent-replayed"
+MAX_KEY_LENGTH = 255
+# 다시 시도하면 결과가 달라질 수 있는 응답은 저장하지 않음 (5xx 포함)
+UNSTORED_STATUSES = {408, 409, 425, 429}
+
+
+class IdempotencyStore:
+    """Idempotency-Key 가 붙은 POST 의 첫 응답을 TTL 동안 보관하고 중복 요청에 그대로 돌려주는 저장소
+
+    - 같은 워커의 동시 중복 요청은 SingleFlight 로 진행 중인 요청 하나의 결과를 기다린다.
+    - Redis 백엔드이면 워커 사이에서도 잠금 키로 한 요청만 업스트림을 호출하고 나머지는 결과를 폴링한다.
+    - 키는 클라이언트, 서비스 경로별로 분리되므로 다른 클라이언트가 같은 키를 써도 섞이지 않는다.
+    - 요청 본문 지문을 응답과 함께 저장해 같은 키를 다른 본문으로 다시 쓰면 422 로 거부한다.
+    """
+
+    def __init__(
+        self,
+        backend,
+        ttl: float = 3600.0,
+        lock_timeout: float = 60.0,
+        max_body_bytes: int = 8 * 1024 * 1024,
+        poll_interval: float = 0.1,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.max_body_bytes = max_body_bytes
+        self.poll_interval = poll_interval
+        self._flights = SingleFlight()
+        self._pending: Dict[str, Optional[str]] = {}
+        self.stored = 0
+        self.replayed = 0
+        self.mismatched = 0
+
+    @classmethod
+    def from_env(cls) -> "IdempotencyStore":
+        """환경변수로 저장소 구성
+
+        GATEWAY_IDEMPOTENCY_BACKEND (memory|redis), GATEWAY_IDEMPOTENCY_TTL, GATEWAY_IDEMPOTENCY_LOCK_TIMEOUT,
+        GATEWAY_IDEMPOTENCY_MAX_ENTRIES, GATEWAY_IDEMPOTENCY_MAX_BODY_BYTES
+        """
+        max_body_bytes = int(os.getenv("GATEWAY_IDEMPOTENCY_MAX_BODY_BYTES", str(8 * 1024 * 1024)))
+        if os.getenv("GATEWAY_IDEMPOTENCY_BACKEND", "memory").lower() == "redis":
+            backend = RedisCacheBackend(namespace="gateway:idempotency:")
+        else:
+            backend = MemoryCacheBackend(
+                max_entries=int(os.getenv("GATEWAY_IDEMPOTENCY_MAX_ENTRIES", "1024")),
+                max_bytes=int(os.getenv("GATEWAY_IDEMPOTENCY_MAX_BYTES", str(64 * 1024 * 1024))),
+            )
+        return cls(
+            backend,
+            ttl=float(os.getenv("GATEWAY_IDEMPOTENCY_TTL", "3600")),
+            lock_timeout=float(os.getenv("GATEWAY_IDEMPOTENCY_LOCK_TIMEOUT", "60")),
+            max_body_bytes=max_body_bytes,
+        )
+
+    @staticmethod
+    def make_key(client_id: str, service: str, path: str, idempotency_key: str) -> str:
+        """저장 키 - "{service}/{path}|{클라이언트}|{키 해시}"
+
+        Raises:
+            HTTPException: 키가 비어 있거나 너무 긴 경우 (400)
+        """
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Idempotency-Key 는 1~{MAX_KEY_LENGTH}자여야 합니다."
+            )
+        digest = hashlib.sha256(idempotency_key.encode("utf-8")).hexdigest()[:32]
+        return f"{service}/{path.strip('/')}|{client_id}|{digest}"
+
+    async def execute(
+        self,
+        key: str,
+        send: Callable[[], Awaitable[ResponseSnapshot]],
+        fingerprint: Optional[str] = None
+    ) -> Tuple[ResponseSnapshot, bool]:
+        """저장된 응답이 있으면 반환하고, 없으면 send 를 한 번만 실행해 결과를 저장
+
+        Args:
+            key (str): make_key 로 만든 저장 키
+            send (Callable): 업스트림을 호출해 스냅샷을 만드는 코루틴 함수
+            fingerprint (str, optional): 요청 본문 지문. 저장된/진행 중인 요청과 다르면 422. 기본값은 None.
+
+        Returns:
+            Tuple[ResponseSnapshot, bool]: (응답 스냅샷, 저장된/다른 요청의 응답을 재사용했는지 여부)
+
+        Raises:
+            HTTPException: 같은 키가 다른 본문으로 사용된 경우 (422)
+        """
+        stored = await self._get(key)
+        if stored is not None:
+            self._check_fingerprint(stored.request_fingerprint, fingerprint)
+            self.replayed += 1
+            return stored, True
+        owner = key not in self._pending
+        if owner:
+            self._pending[key] = fingerprint
+        else:
+            # 진행 중인 요청에 합류하기 전에 본문이 같은지 확인
+            self._check_fingerprint(self._pending[key], fingerprint)
+        try:
+            (snapshot, replayed), shared = await self._flights.do(key, lambda: self._run_once(key, send, fingerprint))
+        finally:
+            if owner:
+                self._pending.pop(key, None)
+        if replayed or shared:
+            self.replayed += 1
+        return snapshot, replayed or shared
+
+    def _check_fingerprint(self, expected: Optional[str], fingerprint: Optional[str]):
+        if expected is not None and fingerprint is not None and expected != fingerprint:
+            self.mismatched += 1
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="같은 Idempotency-Key 가 다른 요청 본문으로 사용되었습니다."
+            )
+
+    async def _run_once(
+        self, key: str, send: Callable[[], Awaitable[ResponseSnapshot]], fingerprint: Optional[str]
+    ) -> Tuple[ResponseSnapshot, bool]:
+        token = await self._lock(key)
+        try:
+            # 잠금을 기다리는 동안 다른 워커가 끝냈을 수 있음
+            stored = await self._get(key)
+            if stored is not None:
+                self._check_fingerprint(stored.request_fingerprint, fingerprint)
+                return stored, True
+            snapshot = replace(await send(), request_fingerprint=fingerprint)
+            if self._storable(snapshot):
+                try:
+                    await self.backend.set(key, snapshot, self.ttl)
+                    self.stored += 1
+                except Exception as e:
+                    logger.warning(f"멱등 응답 저장 실패: {str(e)}")
+            return snapshot, False
+        finally:
+            await self._unlock(key, token)
+
+    def _storable(self, snapshot: ResponseSnapshot) -> bool:
+        return (snapshot.status_code < 500 and snapshot.status_code not in UNSTORED_STATUSES
+                and len(snapshot.body) <= self.max_body_bytes)
+
+    async def _get(self, key: str) -> Optional[ResponseSnapshot]:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"멱등 응답 조회 실패 (무시하고 업스트림 호출): {str(e)}")
+            return None
+
+    async def _lock(self, key: str) -> Optional[str]:
+        """워커 간 잠금 (Redis 백엔드만). 다른 워커가 처리 중이면 결과가 저장되거나 잠금이 풀릴 때까지 대기"""
+        if not isinstance(self.backend, RedisCacheBackend):
+            return None
+        lock_key = f"{self.backend.namespace}lock:{key}"
+        token = secrets.token_hex(8)
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                if await self.backend.redis.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000)):
+                    return token
+            except Exception as e:
+                logger.warning(f"멱등 잠금 실패 (잠금 없이 진행): {str(e)}")
+                return None
+            if await self._get(key) is not None:
+                return None
+            if time.monotonic() >= deadline:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="같은 Idempotency-Key 요청이 아직 처리 중입니다.",
+                    headers={"Retry-After": "1"}
+                )
+            await asyncio.sleep(self.poll_interval)
+
+    async def _unlock(self, key: str, token: Optional[str]):
+        if token is None:
+            return
+        lock_key = f"{self.backend.namespace}lock:{key}"
+        try:
+            current = await self.backend.redis.get(lock_key)
+            if current is not None and (current.decode() if isinstance(current, bytes) else current) == token:
+                await self.backend.redis.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"멱등 잠금 해제 실패 (만료 시 자동 해제): {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"stored": self.stored, "replayed": self.replayed, "mismatched": self.mismatched, **self._flights.stats()}
+
+
+# ✅ 게이트웨이 전역 멱등성 저장소
+idempotency_store = IdempotencyStore.from_env()
@@ -0,0 +1,163 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+import logging
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+logger = logging.getLogger("metrics")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+REQUESTS = Counter(
+    "gateway_requests_total", "게이트웨이가 처리한 요청 수",
+    ["service", "route", "method", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "gateway_request_duration_seconds", "게이트웨이 전체 처리 시간 (응답 본문 전송 완료까지)",
+    ["service", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_DURATION = Histogram(
+    "gateway_upstream_duration_seconds", "요청 하나가 업스트림 응답 헤더를 기다린 시간의 합",
+    ["service", "route"], buckets=LATENCY_BUCKETS,
+)
+OVERHEAD_DURATION = Histogram(
+    "gateway_overhead_duration_seconds", "전체 처리 시간 중 업스트림 대기를 제외한 시간 (대기열, 본문 처리, 전송 등)",
+    ["service", "route"], buckets=LATENCY_BUCKETS,
+)
+IN_FLIGHT = Gauge("gateway_in_flight_requests", "처리 중인 요청 수", ["service"])
+REQUEST_SIZE = Histogram(
+    "gateway_request_size_bytes", "요청 본문 크기", ["service", "route"], buckets=SIZE_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    "gateway_response_size_bytes", "응답 본문 크기", ["service", "route"], buckets=SIZE_BUCKETS,
+)
+UPSTREAM_ATTEMPTS = Counter(
+    "gateway_upstream_attempts_total", "업스트림 호출 시도 수 (결과별)",
+    ["service", "outcome"],
+)
+
+
+@dataclass
+class RequestTiming:
+    """요청 하나의 업스트림 대기 시간 누적 (미들웨어가 만들고 프록시가 채움)"""
+    upstream_seconds: float = 0.0
+    upstream_calls: int = 0
+
+
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar("gateway_request_timing", default=None)
+
+
+def start_request_timing() -> RequestTiming:
+    timing = RequestTiming()
+    _current_timing.set(timing)
+    return timing
+
+
+def record_upstream(service: str, outcome: str, elapsed: float):
+    """업스트림 호출 한 번의 결과와 소요 시간을 기록
+
+    Args:
+        service (str): 서비스 이름
+        outcome (str): 상태 코드 또는 "error"
+        elapsed (float): 응답 헤더를 받을 때까지 걸린 시간(초)
+    """
+    UPSTREAM_ATTEMPTS.labels(service, outcome).inc()
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.upstream_seconds += elapsed
+        timing.upstream_calls += 1
+
+
+class GatewayStateCollector:
+    """스크레이프 시점에 커넥션 풀, 벌크헤드, 서킷 브레이커, 요청 병합 상태를 읽어 노출"""
+
+    def collect(self):
+        # 순환 임포트를 피하기 위해 수집 시점에 임포트
+        from app.domain.model.service_type import ServiceType
+        from app.foundation.core.bulkhead import service_bulkheads
+        from app.foundation.core.circuit_breaker import service_breakers
+        from app.foundation.core.rate_limiter import rate_limiter
+        from app.foundation.core.singleflight import request_coalescer
+        from app.foundation.infrastructure.http_client_pool import upstream_pool
+        from app.platform.adapters.multipart_spool import upload_budget
+
+        connections = GaugeMetricFamily(
+            "gateway_upstream_pool_connections", "업스트림 커넥션 풀의 연결 수", labels=["service", "state"]
+        )
+        pool_requests = GaugeMetricFamily(
+            "gateway_upstream_pool_requests", "커넥션 풀의 요청 수 (queued = 연결을 기다리는 요청)", labels=["service", "state"]
+        )
+        for service, stats in upstream_pool.stats().items():
+            connections.add_metric([service, "active"], stats["active_connections"])
+            connections.add_metric([service, "idle"], stats["idle_connections"])
+            pool_requests.add_metric([service, "active"], stats["active_requests"])
+            pool_requests.add_metric([service, "queued"], stats["queued_requests"])
+        yield connections
+        yield pool_requests
+
+        bulkhead = GaugeMetricFamily(
+            "gateway_bulkhead_requests", "벌크헤드의 실행/대기 중 요청 수", labels=["service", "state"]
+        )
+        breaker = GaugeMetricFamily(
+            "gateway_circuit_breaker_state", "서비스 서킷 브레이커 상태 (현재 상태만 1)", labels=["service", "state"]
+        )
+        class_queued = GaugeMetricFamily(
+            "gateway_bulkhead_class_queued_requests", "우선순위 클래스별 벌크헤드 대기 요청 수", labels=["service", "priority"]
+        )
+        class_admitted = CounterMetricFamily(
+            "gateway_bulkhead_class_admitted", "우선순위 클래스별 실행 슬롯을 얻은 요청 수", labels=["service", "priority"]
+        )
+        class_wait = CounterMetricFamily(
+            "gateway_bulkhead_class_wait_seconds", "우선순위 클래스별 벌크헤드 대기 시간 합계(초)", labels=["service", "priority"]
+        )
+        class_rejected = CounterMetricFamily(
+            "gateway_bulkhead_class_rejected", "우선순위 클래스별 벌크헤드 거부 수", labels=["service", "priority", "reason"]
+        )
+        for service_type in ServiceType:
+            stats = service_bulkheads[service_type].stats()
+            bulkhead.add_metric([service_type.value, "active"], stats["active"])
+            bulkhead.add_metric([service_type.value, "queued"], stats["queued"])
+            for priority, class_stats in stats["classes"].items():
+                labels = [service_type.value, priority]
+                class_queued.add_metric(labels, class_stats["queued"])
+                class_admitted.add_metric(labels, class_stats["admitted"])
+                class_wait.add_metric(labels, class_stats["wait_seconds_total"])
+                for reason, count in class_stats["rejected"].items():
+                    class_rejected.add_metric(labels + [reason], count)
+            state = service_breakers[service_type].state.value
+            for candidate in ("closed", "open", "half_open"):
+                breaker.add_metric([service_type.value, candidate], 1 if state == candidate else 0)
+        yield bulkhead
+        yield class_queued
+        yield class_admitted
+        yield class_wait
+        yield class_rejected
+        yield breaker
+
+        coalescing = request_coalescer.stats()
+        inflight = GaugeMetricFamily("gateway_coalescing_inflight_keys", "병합 중인 GET 요청 키 수")
+        inflight.add_metric([], coalescing["inflight_keys"])
+        yield inflight
+        coalesced = CounterMetricFamily("gateway_coalesced_waiters", "다른 요청의 결과를 공유한 대기자 수")
+        coalesced.add_metric([], coalescing["coalesced_waiters"])
+        yield coalesced
+        rate_limited = CounterMetricFamily("gateway_rate_limited_requests", "요청 제한으로 거부된 요청 수")
+        rate_limited.add_metric([], rate_limiter.rejected)
+        yield rate_limited
+
+        uploads = upload_budget.stats()
+        upload_memory = GaugeMetricFamily("gateway_upload_memory_reserved_bytes", "업로드 파일 파트가 메모리에 예약한 바이트 수")
+        upload_memory.add_metric([], uploads["reserved_bytes"])
+        yield upload_memory
+        upload_disk = CounterMetricFamily("gateway_upload_spooled_to_disk", "임시 파일에 기록한 업로드 파일 파트 수")
+        upload_disk.add_metric([], uploads["spooled_to_disk"])
+        yield upload_disk
+        upload_rejected = CounterMetricFamily("gateway_upload_rejected", "크기 제한으로 거부한(413) 업로드 수")
+        upload_rejected.add_metric([], uploads["rejected"])
+        yield upload_rejected
+
+
+REGISTRY.register(GatewayStateCollector())
@@ -0,0 +1,43 @@
+from typing import Any, Optional
+import logging
+import os
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis 패키지가 없는 환경에서는 메모리 백엔드만 사용
+    aioredis = None
+
+logger = logging.getLogger("redis_client")
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+_client: Optional[Any] = None
+
+
+def get_redis() -> Any:
+    """게이트웨이 공용 Redis 클라이언트를 반환 (최초 호출 시 생성)
+
+    Returns:
+        redis.asyncio.Redis: 비동기 Redis 클라이언트
+    """
+    global _client
+    if _client is None:
+        if aioredis is None:
+            raise RuntimeError("redis 패키지가 설치되어 있지 않습니다. (pip install redis)")
+        _client = aioredis.from_url(REDIS_URL)
+        logger.info(f"Redis 클라이언트 생성: {REDIS_URL}")
+    return _client
+
+
+def set_redis(client: Any):
+    """Redis 클라이언트를 교체 (테스트에서 fakeredis 등 로컬 대체재 주입용)"""
+    global _client
+    _client = client
+
+
+async def close_redis():
+    """생성된 Redis 클라이언트를 닫는다."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
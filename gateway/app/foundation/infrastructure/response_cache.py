@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from typing import Iterable, Mapping, Optional, Tuple
+import logging
+import os
+import time
+
+from app.domain.model.response_snapshot import ResponseSnapshot
+from app.foundation.infrastructure.redis_client import get_redis
+
+logger = logging.getLogger("response_cache")
+
+
+class MemoryCacheBackend:
+    """프로세스 내 LRU 캐시 백엔드 (항목 수와 본문 총 바이트로 크기 제한)"""
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[ResponseSnapshot, float]]" = OrderedDict()
+        self._bytes = 0
+
+    async def get(self, key: str) -> Optional[ResponseSnapshot]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        snapshot, retain_until = item
+        if retain_until <= time.time():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return snapshot
+
+    async def set(self, key: str, snapshot: ResponseSnapshot, retention: float):
+        if len(snapshot.body) > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (snapshot, time.time() + retention)
+        self._bytes += len(snapshot.body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    async def purge(self, prefix: str = "") -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def _remove(self, key: str):
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._bytes -= len(item[0].body)
+
+
+class RedisCacheBackend:
+    """Redis 캐시 백엔드 (여러 게이트웨이 워커가 공유)
+
+    크기 제한은 Redis 서버의 maxmemory-policy(allkeys-lru 권장)에 맡긴다.
+    """
+
+    def __init__(self, redis=None, namespace: str = "gateway:cache:"):
+        self._redis = redis
+        self.namespace = namespace
+
+    @property
+    def redis(self):
+        return self._redis if self._redis is not None else get_redis()
+
+    async def get(self, key: str) -> Optional[ResponseSnapshot]:
+        raw = await self.redis.get(self.namespace + key)
+        return ResponseSnapshot.loads(raw) if raw else None
+
+    async def set(self, key: str, snapshot: ResponseSnapshot, retention: float):
+        await self.redis.set(self.namespace + key, snapshot.dumps(), px=max(1, int(retention * 1000)))
+
+    async def purge(self, prefix: str = "") -> int:
+        keys = [key async for key in self.redis.scan_iter(match=f"{self.namespace}{prefix}*")]
+        if keys:
+            await self.redis.delete(*keys)
+        return len(keys)
+
+
+class ResponseCache:
+    """멱등 GET 응답 캐시 (서비스, 경로, 쿼리, vary 헤더 기준)"""
+
+    def __init__(self, backend, vary_headers: Iterable[str] = ("accept",), stale_retention: float = 600.0):
+        self.backend = backend
+        self.vary_headers = tuple(sorted(h.strip().lower() for h in vary_headers if h.strip()))
+        self.stale_retention = stale_retention
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """환경변수로 캐시 구성
+
+        GATEWAY_CACHE_BACKEND (memory|redis), GATEWAY_CACHE_MAX_ENTRIES, GATEWAY_CACHE_MAX_BYTES,
+        GATEWAY_CACHE_VARY_HEADERS (쉼표 구분), GATEWAY_CACHE_STALE_SECONDS
+        """
+        if os.getenv("GATEWAY_CACHE_BACKEND", "memory").lower() == "redis":
+            backend = RedisCacheBackend()
+        else:
+            backend = MemoryCacheBackend(
+                max_entries=int(os.getenv("GATEWAY_CACHE_MAX_ENTRIES", "512")),
+                max_bytes=int(os.getenv("GATEWAY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            )
+        return cls(
+            backend,
+            vary_headers=os.getenv("GATEWAY_CACHE_VARY_HEADERS", "accept").split(","),
+            stale_retention=float(os.getenv("GATEWAY_CACHE_STALE_SECONDS", "600")),
+        )
+
+    def make_key(self, service: str, path: str, query: str, headers: Mapping[str, str]) -> str:
+        """캐시 키 생성 - "{service}/{path}?{정렬된 쿼리}|{vary 헤더 값}" """
+        sorted_query = "&".join(sorted(query.split("&"))) if query else ""
+        vary = "|".join(f"{name}={headers.get(name, '')}" for name in self.vary_headers)
+        return f"{service}/{path.strip('/')}?{sorted_query}|{vary}"
+
+    async def get(self, key: str) -> Optional[ResponseSnapshot]:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"캐시 조회 실패 (무시하고 업스트림 호출): {str(e)}")
+            return None
+
+    async def set(self, key: str, snapshot: ResponseSnapshot, ttl: float):
+        # 업스트림 ETag 가 있으면 만료 후에도 재검증용으로 더 오래 보관
+        retention = ttl + (self.stale_retention if snapshot.upstream_etag else 0.0)
+        try:
+            await self.backend.set(key, snapshot, retention)
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패: {str(e)}")
+
+    async def purge(self, prefix: str = "") -> int:
+        """키 접두사로 캐시 항목 삭제
+
+        키의 경로는 route_path 로 정규화되어 있으므로 서비스 전체는 "crime/", 경로 단위는 "crime/map" 처럼 지정한다.
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        purged = await self.backend.purge(prefix.lstrip("/") if prefix else "")
+        logger.info(f"캐시 삭제: prefix='{prefix}', {purged}건")
+        return purged
+
+
+# ✅ 게이트웨이 전역 응답 캐시
+response_cache = ResponseCache.from_env()
@@ -0,0 +1,139 @@
+from typing import Any, Dict, Optional, Set, Tuple
+import asyncio
+import logging
+import os
+
+from app.domain.model.routing_table import ROUTING_FILE, RoutingTable, current_routing_table, install_routing_table
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.load_balancer import Replica, apply_replicas
+from app.foundation.infrastructure.health_checker import health_checker
+
+logger = logging.getLogger("routing_manager")
+
+
+class RoutingManager:
+    """실행 중인 게이트웨이의 라우팅 테이블 교체 담당
+
+    - 새 테이블은 참조 하나를 바꾸는 방식으로 한 번에 교체 (요청은 이전 또는 새 테이블 중 하나만 봄)
+    - 빠진 레플리카는 새 요청을 받지 않고 진행 중인 요청만 마무리 (draining)
+    - 추가된 레플리카는 기존 부하 분산기/커넥션 풀에 슬로우 스타트로 합류하고 바로 헬스체크로 연결을 연다
+    - GATEWAY_ROUTING_FILE 이 있으면 GATEWAY_ROUTING_RELOAD_INTERVAL 초마다 변경 여부를 확인해 다시 읽음
+
+    PUT /admin/routing 은 요청을 받은 워커에만 반영되므로 워커가 여럿이면 파일을 사용한다.
+    """
+
+    def __init__(self, path: Optional[str] = ROUTING_FILE, interval: float = 5.0):
+        self.path = path
+        self.interval = interval
+        self.reloads = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._file_state: Optional[Tuple[int, int]] = self._stat()
+        self._warmups: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_env(cls) -> "RoutingManager":
+        return cls(interval=float(os.getenv("GATEWAY_ROUTING_RELOAD_INTERVAL", "5")))
+
+    def apply(self, table: RoutingTable) -> Dict[str, Any]:
+        """라우팅 테이블 교체 후 변경 내역 반환"""
+        previous = install_routing_table(table)
+        changes = apply_replicas(table)
+        self.reloads += 1
+        for service_type, (added, _) in changes.items():
+            for replica in added:
+                self._warm_up(service_type, replica)
+        summary = {
+            "version": table.version,
+            "previous_version": previous.version,
+            "source": table.source,
+            "added": {s.value: [r.url for r in added] for s, (added, _) in changes.items() if added},
+            "removed": {s.value: removed for s, (_, removed) in changes.items() if removed},
+        }
+        logger.info("라우팅 테이블 교체", extra=summary)
+        return summary
+
+    async def reload(self) -> Dict[str, Any]:
+        """라우팅 파일을 다시 읽어 내용이 바뀌었으면 교체
+
+        Raises:
+            ValueError: 파일이 설정되지 않았거나 내용이 올바르지 않은 경우
+            OSError: 파일을 읽을 수 없는 경우
+        """
+        if not self.path:
+            raise ValueError("GATEWAY_ROUTING_FILE 이 설정되지 않았습니다.")
+        self._file_state = self._stat()
+        table = RoutingTable.from_file(self.path)
+        current = current_routing_table()
+        if table.version == current.version:
+            return {"version": current.version, "previous_version": current.version, "source": current.source,
+                    "added": {}, "removed": {}}
+        return self.apply(table)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": current_routing_table().version,
+            "source": current_routing_table().source,
+            "file": self.path,
+            "watching": self._task is not None and not self._task.done(),
+            "reloads": self.reloads,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+    def start(self):
+        if self.path and self._task is None:
+            self._task = asyncio.create_task(self._watch(), name="gateway-routing-watcher")
+            logger.info(f"라우팅 파일 감시 시작: {self.path} ({self.interval}s 간격)")
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for warmup in list(self._warmups):
+            warmup.cancel()
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            state = self._stat()
+            if state is None or state == self._file_state:
+                continue
+            try:
+                await self.reload()
+            except (OSError, ValueError) as e:
+                # 잘못된 파일이면 현재 테이블을 유지
+                self.errors += 1
+                self.last_error = str(e)
+                logger.error(f"라우팅 파일 반영 실패: {e}")
+
+    def _warm_up(self, service_type: ServiceType, replica: Replica):
+        """새 레플리카를 바로 한 번 헬스체크 (첫 요청 전에 연결을 열고 상태를 확인)"""
+        try:
+            task = asyncio.get_running_loop().create_task(self._probe(service_type, replica))
+        except RuntimeError:
+            return
+        self._warmups.add(task)
+        task.add_done_callback(self._warmups.discard)
+
+    async def _probe(self, service_type: ServiceType, replica: Replica):
+        try:
+            await health_checker.check_replica(service_type, replica)
+        except Exception as e:
+            logger.debug(f"새 레플리카 확인 실패: {replica.url} ({type(e).__name__})")
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path) if self.path else None
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size) if stat else None
+
+
+# ✅ 게이트웨이 전역 라우팅 관리자
+routing_manager = RoutingManager.from_env()
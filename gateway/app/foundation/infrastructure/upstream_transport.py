@@ -0,0 +1,108 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import hashlib
+import logging
+import os
+import re
+
+import httpx
+
+logger = logging.getLogger("upstream_transport")
+
+UDS_SCHEME = "unix://"
+H2C_SCHEME = "h2c://"
+
+# 요청 URL 호스트 → 전송 방식 (resolve_upstream_url 로 등록)
+_ROUTES: Dict[Tuple[str, int], "UpstreamRoute"] = {}
+
+
+class UpstreamRoute(NamedTuple):
+    """업스트림 전송 방식
+
+    protocol:
+        "http1" - TCP 위 HTTP/1.1 (https 이고 GATEWAY_UPSTREAM_HTTP2=1 이면 ALPN 으로 HTTP/2 협상)
+        "h2c"   - TCP 위 HTTP/2 (prior knowledge, 연결 하나로 여러 요청 다중화)
+        "uds"   - 유닉스 도메인 소켓 위 HTTP/1.1
+    """
+    protocol: str
+    uds: Optional[str] = None
+
+
+def resolve_upstream_url(raw: str) -> str:
+    """서비스 URL 을 요청에 쓸 http(s) 기본 URL 로 변환하고 전송 방식을 등록
+
+    - http://nlp:9004, https://...  → 그대로
+    - h2c://nlp:9004                → http://nlp:9004 (HTTP/2 prior knowledge)
+    - unix:///run/ai/nlp.sock       → http://nlp-sock-<hash>.uds (소켓 경로별 가상 호스트)
+
+    Args:
+        raw (str): 환경변수에 적힌 레플리카 URL
+
+    Returns:
+        str: 요청 URL 을 만들 때 쓰는 기본 URL (끝의 / 제거)
+    """
+    raw = raw.rstrip("/")
+    if raw.startswith(UDS_SCHEME):
+        path = raw[len(UDS_SCHEME):]
+        stem = re.sub(r"[^a-z0-9]+", "-", os.path.basename(path).lower()).strip("-") or "socket"
+        host = f"{stem}-{hashlib.sha1(path.encode('utf-8')).hexdigest()[:8]}.uds"
+        _ROUTES[(host, 80)] = UpstreamRoute("uds", path)
+        return f"http://{host}"
+    if raw.startswith(H2C_SCHEME):
+        url = "http://" + raw[len(H2C_SCHEME):]
+        parsed = httpx.URL(url)
+        _ROUTES[(parsed.host, parsed.port or 80)] = UpstreamRoute("h2c")
+        return url
+    return raw
+
+
+def route_for(url: httpx.URL) -> UpstreamRoute:
+    return _ROUTES.get((url.host, url.port or (443 if url.scheme == "https" else 80)), UpstreamRoute("http1"))
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class UpstreamTransport(httpx.AsyncBaseTransport):
+    """요청 URL 호스트에 따라 TCP(HTTP/1.1), HTTP/2(h2c), 유닉스 소켓 전송으로 나눠 보내는 전송 계층
+
+    전송 방식마다 (소켓 경로마다) 커넥션 풀을 따로 두고 처음 쓸 때 만든다.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2_over_tls: bool = False):
+        self.limits = limits
+        self.http2_over_tls = http2_over_tls and http2_available()
+        self._transports: Dict[UpstreamRoute, httpx.AsyncHTTPTransport] = {}
+
+    @property
+    def transports(self) -> List[httpx.AsyncHTTPTransport]:
+        return list(self._transports.values())
+
+    def _transport_for(self, route: UpstreamRoute) -> httpx.AsyncHTTPTransport:
+        transport = self._transports.get(route)
+        if transport is not None:
+            return transport
+        if route.protocol == "uds":
+            transport = httpx.AsyncHTTPTransport(limits=self.limits, uds=route.uds)
+        elif route.protocol == "h2c":
+            if http2_available():
+                transport = httpx.AsyncHTTPTransport(limits=self.limits, http1=False, http2=True)
+            else:
+                logger.warning("h2 패키지가 없어 h2c 업스트림을 HTTP/1.1 로 호출합니다.")
+                transport = httpx.AsyncHTTPTransport(limits=self.limits)
+        else:
+            transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2_over_tls)
+        self._transports[route] = transport
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport_for(route_for(request.url)).handle_async_request(request)
+
+    async def aclose(self):
+        transports, self._transports = list(self._transports.values()), {}
+        for transport in transports:
+            await transport.aclose()
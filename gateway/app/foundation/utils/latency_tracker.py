@@ -0,0 +1,31 @@
+from typing import List, Optional
+
+
+class LatencyTracker:
+    """최근 N 개 응답 시간으로 분위수(p95 등)를 추정하는 고정 크기 링 버퍼"""
+
+    def __init__(self, size: int = 256):
+        self.size = size
+        self._samples: List[float] = []
+        self._next = 0
+        self._sorted: Optional[List[float]] = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float):
+        if len(self._samples) < self.size:
+            self._samples.append(seconds)
+        else:
+            self._samples[self._next] = seconds
+        self._next = (self._next + 1) % self.size
+        self._sorted = None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """분위수 (표본이 없으면 None). 정렬 결과는 다음 기록 전까지 재사용"""
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        index = min(len(self._sorted) - 1, int(q * len(self._sorted)))
+        return self._sorted[index]
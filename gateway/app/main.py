@@ -1,33 +1,55 @@
-from fastapi import FastAPI, APIRouter, Request, HTTPException, File, UploadFile, Form, Depends, Body
+from fastapi import FastAPI, APIRouter, Request, HTTPException, Depends, Body
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import httpx
-from typing import Dict, Any, Literal, Optional, Annotated, Union
+from typing import Dict, Any, Literal, Optional, Annotated, Union, Tuple, Callable, Awaitable
+import asyncio
 import os
 from dotenv import load_dotenv
 import logging
-import sys
 from contextlib import asynccontextmanager
 import json
 from pydantic import BaseModel
 import traceback
 import json as pyjson
 import httpx
-from app.domain.model.service_proxy_factory import ServiceProxyFactory
-from app.domain.model.service_type import ServiceType
-
-# ✅ 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
-logger = logging.getLogger("gateway_api")
+from app.domain.model.service_proxy_factory import ServiceProxyFactory, get_proxy_factory
+from app.domain.model.service_type import ServiceType, ResponseMode, SERVICE_RESPONSE_MODES, SERVICE_ERROR_MAPPINGS, SERVICE_UPLOAD_LIMITS, DOMAIN
+from app.foundation.infrastructure.http_client_pool import upstream_pool
+from app.domain.model.response_snapshot import ResponseSnapshot
+from app.domain.model.route_policy import RoutePolicy, match_route_policy, route_path
+from app.domain.model.routing_table import current_routing_table
+from app.foundation.core.priority import BATCH
+from app.foundation.core.rate_limiter import client_identity, current_client_id, rate_limiter
+from app.foundation.core.singleflight import request_coalescer
+from app.foundation.core.structured_logging import configure_logging
+from app.foundation.core.tracing import configure_tracing, tracer
+from app.foundation.infrastructure.health_checker import health_checker
+from app.foundation.infrastructure.idempotency_store import IDEMPOTENCY_HEADER, REPLAYED_HEADER, idempotency_store
+from app.foundation.infrastructure.redis_client import close_redis
+from app.foundation.infrastructure.response_cache import response_cache
+from app.foundation.infrastructure.routing_manager import routing_manager
+from app.platform.adapters.compression_middleware import CompressionMiddleware
+from app.platform.adapters.metrics_middleware import MetricsMiddleware
+from app.platform.adapters.multipart_spool import SpooledForm, check_content_length, limited_stream, read_body, read_form
+from app.platform.adapters.rate_limit_middleware import RateLimitMiddleware
+from app.platform.adapters.response_relay import SSE_IDLE_TIMEOUT, accepts_event_stream, relay_response, snapshot_response
+from app.platform.messaging.job_manager import JobSender, job_manager, prefers_async, strip_prefer
+from app.api.admin_router import router as admin_router
+from app.api.batch_router import router as batch_router
+from app.api.health_router import router as health_router
+from app.api.jobs_router import job_accepted_response, router as jobs_router
+from app.api.metrics_router import router as metrics_router
+from app.api.websocket_router import router as websocket_router
 
-# ✅ 환경변수 로드
+# ✅ 환경변수 로드 (.env 의 LOG_LEVEL/LOG_FORMAT 이 로깅 설정에 반영되도록 먼저 실행)
 # Load environment variables from .env file
 load_dotenv()
 
+# ✅ 로깅 설정 (JSON, 큐 핸들러 + 백그라운드 출력 스레드)
+configure_logging("gateway")
+logger = logging.getLogger("gateway_api")
+
 
 
 # ✅ 요청 모델 정의
@@ -38,9 +60,25 @@ class FinanceRequest(BaseModel):
 # ✅ 라이프스팬 설정
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("🚀🚀🚀 FastAPI 앱이 시작됩니다.")
-    yield
-    print("🛑 FastAPI 앱이 종료됩니다.")
+    routing = current_routing_table()
+    logger.info("게이트웨이가 시작됩니다.", extra={
+        "domain": DOMAIN,
+        "routing_version": routing.version,
+        "service_urls": {k.value: [url for url, _ in v] for k, v in routing.services.items()},
+    })
+    await upstream_pool.startup()
+    health_checker.start()
+    routing_manager.start()
+    try:
+        yield
+    finally:
+        await routing_manager.stop()
+        await health_checker.stop()
+        await job_manager.shutdown()
+        await upstream_pool.shutdown()
+        await close_redis()
+        tracer.shutdown()
+        logger.info("게이트웨이가 종료됩니다.")
 
 # ✅ FastAPI 설정
 app = FastAPI(
@@ -50,6 +88,9 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# ✅ 요청 제한 (CORS 보다 안쪽에 두어 429 응답에도 CORS 헤더가 붙도록 먼저 등록)
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
 # ✅ CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -59,9 +100,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ 응답 압축 (Accept-Encoding 협상, 메트릭은 압축 후 크기로 기록)
+app.add_middleware(CompressionMiddleware)
+
+# ✅ 메트릭 수집 (가장 바깥에서 요청 제한 거부까지 포함해 측정)
+app.add_middleware(MetricsMiddleware)
+
+# ✅ 트레이스 전파 및 Server-Timing (가장 바깥, 요청 마감은 업스트림 호출마다 적용)
+configure_tracing(app, "gateway", enforce_deadline=False)
+
 # ✅ 메인 라우터 생성
 gateway_router = APIRouter(prefix="/ai/v1", tags=["Gateway API"])
 
+def _http_error(e: HTTPException) -> JSONResponse:
+    """게이트웨이가 의도적으로 발생시킨 오류(차단, 과부하 등)를 상태 코드와 헤더를 유지해 반환"""
+    return JSONResponse(content={"error": e.detail}, status_code=e.status_code, headers=e.headers)
+
+async def _submit_job(service: ServiceType, method: str, path: str, send: JobSender) -> JSONResponse:
+    """Prefer: respond-async 요청을 백그라운드 작업으로 넘기고 202 반환 (결과는 /ai/v1/jobs/{id}/result)
+
+    기다리는 사람이 없는 요청이므로 send 는 batch 우선순위로 업스트림을 호출한다.
+    """
+    job = await job_manager.submit(service, method, path, send)
+    return job_accepted_response(job)
+
 # ✅ 메인 라우터 실행
 # GET
 @gateway_router.get("/{service}/{path:path}", summary="GET 프록시")
@@ -71,31 +133,30 @@ async def proxy_get(
     request: Request
 ):
     try:
-        logger.info(f"GET 요청: {service.value}/{path}")
-        factory = ServiceProxyFactory(service_type=service)
-        print(f"🍊1")
+        logger.debug("GET 요청", extra={"upstream_service": service.value, "path": path})
+        factory = get_proxy_factory(service)
+        if prefers_async(request.headers):
+            headers = strip_prefer(request.headers.raw)
+            return await _submit_job(service, "GET", path, lambda timeout: factory.request(
+                method="GET", path=path, headers=headers, timeout=timeout, priority=BATCH
+            ))
+        # SSE 구독은 캐시/병합 없이 바로 중계 (업스트림 읽기 타임아웃을 유휴 타임아웃으로 사용)
+        event_stream = accepts_event_stream(request.headers)
+        policy = match_route_policy(service, path)
+        if not event_stream and (policy.cache_ttl > 0 or policy.coalesce):
+            return await _cached_get(factory, service, path, request, policy)
         response = await factory.request(
             method="GET",
             path=path,
-            headers=request.headers.raw
+            headers=request.headers.raw,
+            stream=True,
+            timeout=SSE_IDLE_TIMEOUT if event_stream else None
         )
-        print(f"🍊2 response: {response}")
-        if response.status_code == 200:
-            print(f"🍊3 response: {response}")
-            try:
-                return JSONResponse(content=response.json(), status_code=response.status_code)
-            except Exception:
-                print(f"⚠️ 메인라우터 get 에러 발생")
-                return JSONResponse(
-                    content={"message": "성공", "raw_response": response.text[:1000]},
-                    status_code=200
-                )
-        else:
-            print(f"🍊4")
-            return JSONResponse(
-                content={"error": f"서비스 오류: HTTP {response.status_code}", "details": response.text[:500]},
-                status_code=response.status_code
-            )
+        return await relay_response(
+            response, SERVICE_RESPONSE_MODES[service], SERVICE_ERROR_MAPPINGS[service]
+        )
+    except HTTPException as e:
+        return _http_error(e)
     except Exception as e:
         logger.error(f"게이트웨이 오류: {str(e)}")
         return JSONResponse(
@@ -103,6 +164,55 @@ async def proxy_get(
             status_code=500
         )
 
+# 캐시 재검증은 게이트웨이가 직접 수행하므로 클라이언트 조건부 헤더는 전달하지 않음
+CONDITIONAL_HEADERS = {b"if-none-match", b"if-modified-since"}
+
+async def _cached_get(
+    factory: ServiceProxyFactory,
+    service: ServiceType,
+    path: str,
+    request: Request,
+    policy: RoutePolicy
+):
+    """캐시/병합 대상 GET 처리
+
+    - 캐시가 신선하면 캐시 응답, 만료되었으면 ETag 로 업스트림 재검증
+    - coalesce 정책이면 동시에 들어온 동일 요청은 하나의 업스트림 호출 결과를 공유
+    """
+    mode = SERVICE_RESPONSE_MODES[service]
+    # /ai/v1/crime/crime/map 과 /ai/v1/crime/map 이 같은 키가 되도록 라우트 경로로 정규화
+    key = response_cache.make_key(service.value, route_path(service, path), request.url.query, request.headers)
+    if_none_match = request.headers.get("if-none-match")
+    cached = await response_cache.get(key) if policy.cache_ttl > 0 else None
+    if cached is not None and cached.is_fresh() and "no-cache" not in request.headers.get("cache-control", ""):
+        return snapshot_response(cached, mode, if_none_match, {"x-cache": "HIT"})
+
+    async def refresh() -> Tuple[ResponseSnapshot, Optional[str]]:
+        headers = [(k, v) for k, v in request.headers.raw if k.lower() not in CONDITIONAL_HEADERS]
+        if cached is not None and cached.upstream_etag:
+            headers.append((b"if-none-match", cached.upstream_etag.encode("latin-1")))
+        response = await factory.request(method="GET", path=path, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            snapshot = cached.refreshed(policy.cache_ttl)
+            await response_cache.set(key, snapshot, policy.cache_ttl)
+            return snapshot, "REVALIDATED"
+        snapshot = ResponseSnapshot.from_response(response, policy.cache_ttl)
+        cache_control = response.headers.get("cache-control", "")
+        if (policy.cache_ttl > 0 and response.status_code == 200
+                and "no-store" not in cache_control and "private" not in cache_control):
+            await response_cache.set(key, snapshot, policy.cache_ttl)
+            return snapshot, "MISS"
+        return snapshot, None
+
+    if policy.coalesce:
+        (snapshot, cache_status), _ = await request_coalescer.do(key, refresh)
+    else:
+        snapshot, cache_status = await refresh()
+    if cache_status:
+        return snapshot_response(snapshot, mode, if_none_match, {"x-cache": cache_status})
+    return await relay_response(snapshot.to_httpx(), mode, SERVICE_ERROR_MAPPINGS[service])
+
 # 통합 POST 요청 처리 (JSON 또는 파일 업로드)
 @gateway_router.post(
     "/{service}/{path:path}",
@@ -112,26 +222,41 @@ async def proxy_get(
 async def proxy_post(
     service: ServiceType,
     path: str,
-    request: Request,
-    file: UploadFile = File(None),
-    json_data: str = Form(None)
+    request: Request
 ):
+    form = None
     try:
-        logger.info(f"🟠1. POST 요청: {service.value}/{path}")
-        factory = ServiceProxyFactory(service_type=service)
+        logger.debug("POST 요청", extra={"upstream_service": service.value, "path": path})
+        factory = get_proxy_factory(service)
         
+        mode = SERVICE_RESPONSE_MODES[service]
+        content_type = request.headers.get("content-type", "")
+        is_form = content_type.startswith(("multipart/form-data", "application/x-www-form-urlencoded"))
+
         # Content-Type 헤더 제거 (httpx가 자동으로 설정하도록)
-        headers = {k: v for k, v in request.headers.items() 
-                  if k.lower() not in ['content-length', 'host', 'content-type']}
+        # 스트리밍/패스스루 모드에서 폼이 아닌 본문은 원본 그대로 전달하므로 Content-Type 유지
+        keep_content_type = mode != ResponseMode.ENVELOPE and not is_form
+        headers = {k: v for k, v in request.headers.items()
+                  if k.lower() not in ['content-length', 'host']
+                  and (keep_content_type or k.lower() != 'content-type')}
         
+        # ✅ 폼 본문은 스트리밍으로 읽어 파일 파트는 임계값을 넘으면 임시 파일에 기록 (서비스별 크기 제한 초과 시 413)
+        if is_form:
+            form = await read_form(request, SERVICE_UPLOAD_LIMITS[service])
+        else:
+            check_content_length(request, SERVICE_UPLOAD_LIMITS[service])
+            form = SpooledForm()
+        file = form.files.get("file")
+        json_data = form.fields.get("json_data")
+
         # 데이터 초기화
         files = {}  # 파일 데이터용
         data = {}   # 폼 데이터용
 
-        # ✅ 파일이 있는 경우 files에 추가
+        # ✅ 파일이 있는 경우 files에 추가 (메모리/임시 파일 객체를 넘겨 청크 단위로 전송)
         if file and file.filename:
-            files["file"] = (file.filename, await file.read(), file.content_type)
-            logger.info(f"파일 업로드 설정: {file.filename}")
+            files["file"] = (file.filename, file.reader(), file.content_type)
+            logger.debug(f"파일 업로드 설정: {file.filename} ({file.size} bytes)")
 
         # ✅ json_data를 서비스 타입에 따라 적절한 키로 data에 추가
         if json_data:
@@ -141,69 +266,148 @@ async def proxy_post(
                 if isinstance(json_dict, dict) and "filename" in json_dict:
                     # JSON에 filename 필드가 있는 경우
                     data["filename"] = json_dict["filename"]
-                    logger.info(f"JSON에서 filename 필드 추출: {json_dict['filename']}")
+                    logger.debug(f"JSON에서 filename 필드 추출: {json_dict['filename']}")
                 else:
                     # JSON이지만 filename 필드가 없는 경우
                     data["filename"] = json_data
-                    logger.info(f"JSON 데이터를 그대로 filename으로 사용: {json_data}")
+                    logger.debug(f"JSON 데이터를 그대로 filename으로 사용: {json_data}")
             except json.JSONDecodeError:
                 # JSON이 아닌 경우 그대로 사용
                 data["filename"] = json_data
-                logger.info(f"일반 문자열을 filename으로 사용: {json_data}")
+                logger.debug(f"일반 문자열을 filename으로 사용: {json_data}")
 
         # ✅ 서비스 타입에 따라 data 키 변경
         if service == ServiceType.CHAT:
             if "filename" in data:
                 data["message"] = data.pop("filename")
-                logger.info(f"chat 서비스용으로 키를 'message'로 변경: {data['message']}")
+                logger.debug(f"chat 서비스용으로 키를 'message'로 변경: {data['message']}")
             
         # ✅ 프록시 요청
         prefix_path = f"{service.value}/{path}"
+        if prefers_async(request.headers):
+            # 요청이 끝난 뒤에도 실행되므로 본문은 미리 읽어 두고, 업로드 파일은 작업이 끝날 때 닫는다
+            content = await read_body(request, SERVICE_UPLOAD_LIMITS[service]) if keep_content_type else None
+            job_headers = strip_prefer(headers)
+            return await _submit_job(service, "POST", path, form.hand_off(lambda timeout: factory.request(
+                method="POST",
+                path=prefix_path,
+                headers=job_headers,
+                data=data if data else None,
+                files=files if files else None,
+                content=content,
+                timeout=timeout, priority=BATCH
+            )))
+        idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+        if idempotency_key is not None and not accepts_event_stream(request.headers):
+            # 키 검증(400)은 업로드 파일을 넘기기 전에 (실패하면 finally 에서 닫힘)
+            key = _idempotency_key(service, path, request, idempotency_key)
+            # 중복 요청이 이 요청의 결과를 기다리는 동안에도 쓸 수 있도록 본문은 미리 읽어 두고,
+            # 업로드 파일은 공유 실행이 끝날 때 닫는다 (이 요청이 먼저 취소되어도 유지)
+            content = await read_body(request, SERVICE_UPLOAD_LIMITS[service]) if keep_content_type else None
+            fingerprint = await form.fingerprint(content)
+            send = form.hand_off(lambda: factory.request(
+                method="POST",
+                path=prefix_path,
+                headers=headers,
+                data=data if data else None,
+                files=files if files else None,
+                content=content
+            ))
+            try:
+                response = await _idempotent_post(service, key, fingerprint, send)
+            except asyncio.CancelledError:
+                raise
+            except BaseException:
+                # 본문 불일치(422), 처리 중(409) 등으로 send 가 실행되지 않았을 수 있음
+                form.close()
+                raise
+            # 저장된 응답을 재사용해 send 가 실행되지 않은 경우에도 임시 파일 정리
+            form.close()
+            return response
         response = await factory.request(
             method="POST",
             path=prefix_path,
             headers=headers,
             data=data if data else None,  # data가 비어있으면 None 전달
-            files=files if files else None  # files가 비어있으면 None 전달
+            files=files if files else None,  # files가 비어있으면 None 전달
+            content=limited_stream(request, SERVICE_UPLOAD_LIMITS[service]) if keep_content_type else None,  # JSON 등 원본 본문을 청크 단위로 전달 (크기 제한 적용)
+            stream=True,
+            timeout=SSE_IDLE_TIMEOUT if accepts_event_stream(request.headers) else None
         )
-        logger.info(f"🟠5. response: {response}")
         # ✅ 응답 처리
-        if response.status_code == 200:
-            try:
-                return JSONResponse(content=response.json(), status_code=response.status_code)
-            except Exception:
-                return JSONResponse(
-                    content={"message": "성공", "raw_response": response.text[:1000]},
-                    status_code=200
-                )
-        else:
-            return JSONResponse(
-                content={"error": f"서비스 오류: HTTP {response.status_code}", "details": response.text[:500]},
-                status_code=response.status_code
-            )
+        return await relay_response(response, mode, SERVICE_ERROR_MAPPINGS[service])
 
+    except HTTPException as e:
+        return _http_error(e)
     except Exception as e:
-        logger.error(f"⚠️ 게이트웨이 오류: {str(e)}")
+        logger.error(f"게이트웨이 오류: {str(e)}")
         return JSONResponse(
             content={"error": str(e)},
             status_code=500
         )
+    finally:
+        # 업스트림이 응답 헤더를 보냈으면 요청 본문은 모두 전송된 상태
+        if form is not None and not form.handed_off:
+            form.close()
 
 
         
+def _idempotency_key(service: ServiceType, path: str, request: Request, idempotency_key: str) -> str:
+    """클라이언트/서비스 경로/키로 멱등 저장 키 생성 (키가 올바르지 않으면 400)"""
+    client_id = current_client_id.get() or client_identity(
+        dict(request.headers), request.client.host if request.client else None
+    )
+    return idempotency_store.make_key(client_id, service.value, path, idempotency_key)
+
+
+async def _idempotent_post(
+    service: ServiceType,
+    key: str,
+    fingerprint: str,
+    send: Callable[[], Awaitable[httpx.Response]]
+):
+    """Idempotency-Key 가 있는 POST 처리
+
+    - 같은 클라이언트/경로/키의 첫 응답을 저장하고, 이후 중복 요청에는 업스트림 호출 없이 저장된 응답을 반환
+    - 동시에 들어온 중복 요청은 진행 중인 요청의 결과를 기다림
+    - 같은 키를 다른 본문으로 다시 보내면 422
+    - 재사용한 응답에는 Idempotent-Replayed: true 헤더를 붙임
+    """
+    async def send_once() -> ResponseSnapshot:
+        return ResponseSnapshot.from_response(await send())
+
+    snapshot, replayed = await idempotency_store.execute(key, send_once, fingerprint)
+    response = await relay_response(snapshot.to_httpx(), SERVICE_RESPONSE_MODES[service], SERVICE_ERROR_MAPPINGS[service])
+    if replayed:
+        response.headers[REPLAYED_HEADER] = "true"
+    return response
+
+def _json_response(response: httpx.Response) -> JSONResponse:
+    """PUT/DELETE/PATCH 의 envelope 모드 응답 (업스트림 JSON 그대로 반환)"""
+    return JSONResponse(content=response.json(), status_code=response.status_code)
 
 # PUT
 @gateway_router.put("/{service}/{path:path}", summary="PUT 프록시")
 async def proxy_put(service: ServiceType, path: str, request: Request):
     try:
-        factory = ServiceProxyFactory(service_type=service)
+        factory = get_proxy_factory(service)
+        if prefers_async(request.headers):
+            headers, content = strip_prefer(request.headers.raw), await read_body(request, SERVICE_UPLOAD_LIMITS[service])
+            return await _submit_job(service, "PUT", path, lambda timeout: factory.request(
+                method="PUT", path=path, headers=headers, content=content, timeout=timeout, priority=BATCH
+            ))
         response = await factory.request(
             method="PUT",
             path=path,
             headers=request.headers.raw,
-            body=await request.body()
+            content=await read_body(request, SERVICE_UPLOAD_LIMITS[service]),
+            stream=True
+        )
+        return await relay_response(
+            response, SERVICE_RESPONSE_MODES[service], SERVICE_ERROR_MAPPINGS[service], envelope=_json_response
         )
-        return JSONResponse(content=response.json(), status_code=response.status_code)
+    except HTTPException as e:
+        return _http_error(e)
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
@@ -211,14 +415,24 @@ async def proxy_put(service: ServiceType, path: str, request: Request):
 @gateway_router.delete("/{service}/{path:path}", summary="DELETE 프록시")
 async def proxy_delete(service: ServiceType, path: str, request: Request):
     try:
-        factory = ServiceProxyFactory(service_type=service)
+        factory = get_proxy_factory(service)
+        if prefers_async(request.headers):
+            headers, content = strip_prefer(request.headers.raw), await read_body(request, SERVICE_UPLOAD_LIMITS[service])
+            return await _submit_job(service, "DELETE", path, lambda timeout: factory.request(
+                method="DELETE", path=path, headers=headers, content=content, timeout=timeout, priority=BATCH
+            ))
         response = await factory.request(
             method="DELETE",
             path=path,
             headers=request.headers.raw,
-            body=await request.body()
+            content=await read_body(request, SERVICE_UPLOAD_LIMITS[service]),
+            stream=True
         )
-        return JSONResponse(content=response.json(), status_code=response.status_code)
+        return await relay_response(
+            response, SERVICE_RESPONSE_MODES[service], SERVICE_ERROR_MAPPINGS[service], envelope=_json_response
+        )
+    except HTTPException as e:
+        return _http_error(e)
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
@@ -226,19 +440,35 @@ async def proxy_delete(service: ServiceType, path: str, request: Request):
 @gateway_router.patch("/{service}/{path:path}", summary="PATCH 프록시")
 async def proxy_patch(service: ServiceType, path: str, request: Request):
     try:
-        factory = ServiceProxyFactory(service_type=service)
+        factory = get_proxy_factory(service)
+        if prefers_async(request.headers):
+            headers, content = strip_prefer(request.headers.raw), await read_body(request, SERVICE_UPLOAD_LIMITS[service])
+            return await _submit_job(service, "PATCH", path, lambda timeout: factory.request(
+                method="PATCH", path=path, headers=headers, content=content, timeout=timeout, priority=BATCH
+            ))
         response = await factory.request(
             method="PATCH",
             path=path,
             headers=request.headers.raw,
-            body=await request.body()
+            content=await read_body(request, SERVICE_UPLOAD_LIMITS[service]),
+            stream=True
+        )
+        return await relay_response(
+            response, SERVICE_RESPONSE_MODES[service], SERVICE_ERROR_MAPPINGS[service], envelope=_json_response
         )
-        return JSONResponse(content=response.json(), status_code=response.status_code)
+    except HTTPException as e:
+        return _http_error(e)
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
-# ✅ 메인 라우터 등록
+# ✅ 메인 라우터 등록 (배치/작업 경로가 /{service}/{path} 보다 먼저 매칭되도록 먼저 등록)
+app.include_router(batch_router)
+app.include_router(jobs_router)
 app.include_router(gateway_router)
+app.include_router(admin_router)
+app.include_router(health_router)
+app.include_router(metrics_router)
+app.include_router(websocket_router)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+from typing import List, Optional, Tuple
+import os
+import zlib
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli 패키지가 없으면 gzip 만 사용
+    brotli = None
+
+DEFAULT_COMPRESSIBLE_TYPES = (
+    "text/html,text/plain,text/css,text/csv,text/javascript,application/json,"
+    "application/problem+json,application/javascript,application/xml,image/svg+xml"
+)
+
+
+def _env_list(name: str, default: str) -> Tuple[str, ...]:
+    return tuple(item.strip().lower() for item in os.getenv(name, default).split(",") if item.strip())
+
+
+class _GzipEncoder:
+    name = "gzip"
+
+    def __init__(self, level: int):
+        # wbits=31 → gzip 헤더/트레일러 포함
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def process(self, data: bytes) -> bytes:
+        # 스트리밍 중에도 클라이언트가 바로 풀 수 있도록 청크마다 sync flush
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    name = "br"
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def choose_encoding(accept_encoding: str, brotli_available: bool = brotli is not None) -> Optional[str]:
+    """Accept-Encoding 의 q 값을 반영해 br > gzip 순으로 사용할 인코딩 선택 (없으면 None)"""
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            weights[name.strip()] = q
+    candidates = (["br"] if brotli_available else []) + ["gzip"]
+    best = None
+    for name in candidates:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > 0 and (best is None or q > best[1]):
+            best = (name, q)
+    return best[0] if best else None
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 에 따라 응답을 gzip/brotli 로 압축하는 ASGI 미들웨어
+
+    - 이미 Content-Encoding 이 있는 응답(업스트림 압축 패스스루)은 그대로 전달
+    - 허용된 Content-Type 이고 최소 크기 이상일 때만 압축
+    - 스트리밍 응답은 청크 단위로 압축하고 매 청크를 flush
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.enabled = os.getenv("GATEWAY_COMPRESSION", "1") == "1"
+        self.min_size = int(os.getenv("GATEWAY_COMPRESSION_MIN_SIZE", "1024"))
+        self.content_types = _env_list("GATEWAY_COMPRESSION_TYPES", DEFAULT_COMPRESSIBLE_TYPES)
+        self.gzip_level = int(os.getenv("GATEWAY_GZIP_LEVEL", "6"))
+        self.brotli_quality = int(os.getenv("GATEWAY_BROTLI_QUALITY", "4"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for key, value in scope["headers"]:
+            if key.lower() == b"accept-encoding":
+                accept = value.decode("latin-1")
+        encoding = choose_encoding(accept) if accept else None
+        if encoding is None or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponse(self, encoding, send).run(scope, receive)
+
+    def compressible(self, status: int, headers: List[Tuple[bytes, bytes]]) -> bool:
+        if status < 200 or status in (204, 206, 304):
+            return False
+        values = {k.decode("latin-1").lower(): v.decode("latin-1").lower() for k, v in headers}
+        if "content-encoding" in values or "content-range" in values:
+            return False
+        if "no-transform" in values.get("cache-control", ""):
+            return False
+        content_type = values.get("content-type", "").split(";")[0].strip()
+        if content_type not in self.content_types:
+            return False
+        length = values.get("content-length")
+        return length is None or int(length) >= self.min_size
+
+    def encoder(self, encoding: str):
+        return _BrotliEncoder(self.brotli_quality) if encoding == "br" else _GzipEncoder(self.gzip_level)
+
+
+class _CompressedResponse:
+    """응답 하나의 압축 상태 (시작 메시지는 첫 본문 청크를 볼 때까지 보류)"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def run(self, scope: Scope, receive: Receive):
+        await self.middleware.app(scope, receive, self.on_send)
+
+    async def on_send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = not self.middleware.compressible(message["status"], message.get("headers", []))
+            if self.passthrough:
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoder is None:
+            # 한 번에 끝나는 작은 본문은 압축하지 않음
+            if not more_body and len(body) < self.middleware.min_size:
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+            self.encoder = self.middleware.encoder(self.encoding)
+            await self.send(self._compressed_start())
+
+        data = self.encoder.process(body) if body else b""
+        if not more_body:
+            data += self.encoder.finish()
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _compressed_start(self) -> Message:
+        headers = [(k, v) for k, v in self.start.get("headers", []) if k.lower() not in (b"content-length", b"etag")]
+        vary = [v for k, v in headers if k.lower() == b"vary"]
+        headers = [(k, v) for k, v in headers if k.lower() != b"vary"]
+        vary_values = [item.strip() for value in vary for item in value.decode("latin-1").split(",") if item.strip()]
+        if not any(item.lower() == "accept-encoding" for item in vary_values):
+            vary_values.append("Accept-Encoding")
+        headers.append((b"vary", ", ".join(vary_values).encode("latin-1")))
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        # 압축 표현은 바이트가 다르므로 강한 ETag 는 약한 ETag 로 바꿔서 유지
+        for k, v in self.start.get("headers", []):
+            if k.lower() == b"etag":
+                headers.append((b"etag", v if v.startswith(b"W/") else b"W/" + v))
+        return {**self.start, "headers": headers}
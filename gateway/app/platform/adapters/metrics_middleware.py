@@ -0,0 +1,89 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.domain.model.route_policy import match_route_policy
+from app.domain.model.service_type import ServiceType
+from app.foundation.infrastructure.metrics import (
+    IN_FLIGHT,
+    OVERHEAD_DURATION,
+    REQUEST_DURATION,
+    REQUEST_SIZE,
+    REQUESTS,
+    RESPONSE_SIZE,
+    UPSTREAM_DURATION,
+    start_request_timing,
+)
+
+GATEWAY_PREFIX = "/ai/v1/"
+
+
+class MetricsMiddleware:
+    """요청별 지연 시간, 본문 크기, 처리 중 요청 수를 Prometheus 메트릭으로 기록하는 ASGI 미들웨어
+
+    - route 라벨은 경로 원문이 아니라 라우트 정책 이름(예: crime/map, nlp/*)을 사용해 카디널리티를 제한
+    - 전체 시간은 응답 본문 전송이 끝날 때까지, 업스트림 시간은 응답 헤더를 받을 때까지로 측정
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        service, route = _labels(scope)
+        timing = start_request_timing()
+        started = time.perf_counter()
+        status_code = 500
+        request_bytes = 0
+        response_bytes = 0
+
+        async def counting_receive() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message):
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        in_flight = IN_FLIGHT.labels(service)
+        in_flight.inc()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            in_flight.dec()
+            if route is None:
+                endpoint = scope.get("endpoint")
+                route = getattr(endpoint, "__name__", "unmatched")
+            elapsed = time.perf_counter() - started
+            status = str(status_code)
+            REQUESTS.labels(service, route, scope["method"], status).inc()
+            REQUEST_DURATION.labels(service, route, status).observe(elapsed)
+            REQUEST_SIZE.labels(service, route).observe(request_bytes)
+            RESPONSE_SIZE.labels(service, route).observe(response_bytes)
+            if timing.upstream_calls:
+                UPSTREAM_DURATION.labels(service, route).observe(timing.upstream_seconds)
+            OVERHEAD_DURATION.labels(service, route).observe(max(0.0, elapsed - timing.upstream_seconds))
+
+
+def _labels(scope: Scope):
+    """(service, route) 라벨. 게이트웨이 외 경로는 라우팅 후 엔드포인트 이름으로 route 를 정함"""
+    path = scope["path"]
+    if not path.startswith(GATEWAY_PREFIX):
+        return "gateway", None
+    service_name, _, rest = path[len(GATEWAY_PREFIX):].partition("/")
+    try:
+        service_type = ServiceType(service_name)
+    except ValueError:
+        # /ai/v1/batch 같은 게이트웨이 자체 경로
+        return "gateway", None
+    return service_type.value, match_route_policy(service_type, rest).route
@@ -0,0 +1,353 @@
+from dataclasses import dataclass, field
+from typing import IO, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from urllib.parse import parse_qsl
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from fastapi import HTTPException, Request, status
+from multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger("multipart_spool")
+
+# 파일 파트를 메모리에 두는 최대 크기 - 넘으면 임시 파일로 옮김
+SPOOL_THRESHOLD = int(os.getenv("GATEWAY_UPLOAD_SPOOL_THRESHOLD", str(1024 * 1024)))
+# 동시에 처리 중인 업로드 전체가 메모리에 둘 수 있는 크기 - 다 쓰면 새 파일 파트는 처음부터 디스크에 씀
+MEMORY_BUDGET = int(os.getenv("GATEWAY_UPLOAD_MEMORY_BUDGET", str(64 * 1024 * 1024)))
+# 파일이 아닌 폼 필드 하나의 최대 크기
+MAX_FIELD_BYTES = int(os.getenv("GATEWAY_UPLOAD_MAX_FIELD_BYTES", str(1024 * 1024)))
+
+T = TypeVar("T")
+
+
+def _too_large(limit: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"요청 본문이 허용 크기({limit} bytes)를 넘었습니다."
+    )
+
+
+def check_content_length(request: Request, limit: int):
+    """Content-Length 가 제한을 넘으면 본문을 읽기 전에 413
+
+    Raises:
+        HTTPException: 본문이 너무 큰 경우 (413)
+    """
+    try:
+        length = int(request.headers.get("content-length", "0"))
+    except ValueError:
+        return
+    if length > limit:
+        raise _too_large(limit)
+
+
+class UploadMemoryBudget:
+    """동시에 처리 중인 업로드가 메모리에 들고 있는 바이트 수 제한
+
+    파일 파트는 시작할 때 SPOOL_THRESHOLD 만큼 예약하고, 예약하지 못하면 바로 디스크에 쓴다.
+    임시 파일로 넘어가거나 요청이 끝나면 예약을 돌려준다.
+    """
+
+    def __init__(self, limit: int = MEMORY_BUDGET):
+        self.limit = limit
+        self.reserved = 0
+        self.spooled_to_disk = 0
+        self.rejected = 0
+
+    def reserve(self, size: int) -> bool:
+        if self.reserved + size > self.limit:
+            return False
+        self.reserved += size
+        return True
+
+    def release(self, size: int):
+        self.reserved = max(0, self.reserved - size)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "limit_bytes": self.limit,
+            "reserved_bytes": self.reserved,
+            "spooled_to_disk": self.spooled_to_disk,
+            "rejected": self.rejected,
+        }
+
+
+async def limited_stream(request: Request, limit: int, budget: Optional[UploadMemoryBudget] = None) -> AsyncIterator[bytes]:
+    """요청 본문을 청크 단위로 넘기되 받은 양이 limit 를 넘는 순간 413 (Content-Length 가 없는 chunked 본문 포함)
+
+    Raises:
+        HTTPException: 본문이 너무 큰 경우 (413)
+    """
+    budget = budget or upload_budget
+    try:
+        check_content_length(request, limit)
+    except HTTPException:
+        budget.rejected += 1
+        raise
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > limit:
+            budget.rejected += 1
+            raise _too_large(limit)
+        yield chunk
+
+
+async def read_body(request: Request, limit: int, budget: Optional[UploadMemoryBudget] = None) -> bytes:
+    """요청 본문 전체를 읽되 limit 를 넘으면 413 (비동기 작업/멱등 요청처럼 본문을 보관해야 하는 경우)
+
+    Raises:
+        HTTPException: 본문이 너무 큰 경우 (413)
+    """
+    body = bytearray()
+    async for chunk in limited_stream(request, limit, budget):
+        body.extend(chunk)
+    return bytes(body)
+
+
+class _MemoryReader:
+    """메모리에 있는 SpooledTemporaryFile 을 읽기 위한 래퍼
+
+    httpx 는 파일 길이를 구할 때 fileno() 를 호출하는데, SpooledTemporaryFile 은 fileno() 호출 시
+    디스크로 옮겨지므로(rollover) fileno 가 없는 객체로 감싸 seek/tell 로 길이를 구하게 한다.
+    """
+
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+
+class SpooledUpload:
+    """메모리 또는 임시 파일에 받아 둔 파일 파트"""
+
+    def __init__(self, filename: str, content_type: Optional[str], budget: UploadMemoryBudget, threshold: int):
+        self.filename = filename
+        self.content_type = content_type
+        self.size = 0
+        self._budget = budget
+        self._reserved = threshold if threshold > 0 and budget.reserve(threshold) else 0
+        if self._reserved:
+            self.file: IO[bytes] = tempfile.SpooledTemporaryFile(max_size=threshold)
+        else:
+            # 메모리 예산을 다 쓴 경우 처음부터 디스크에 기록
+            self.file = tempfile.TemporaryFile()
+            budget.spooled_to_disk += 1
+            logger.debug(f"업로드 메모리 예산 소진, 임시 파일에 기록: {filename}")
+
+    @property
+    def in_memory(self) -> bool:
+        return isinstance(self.file, tempfile.SpooledTemporaryFile) and not self.file._rolled
+
+    def reader(self) -> Union[IO[bytes], _MemoryReader]:
+        """업스트림으로 보낼 파일 객체 (메모리에 있으면 디스크로 옮겨지지 않도록 감쌈)"""
+        self.file.seek(0)
+        return _MemoryReader(self.file) if self.in_memory else self.file
+
+    async def digest(self) -> str:
+        """파일 내용의 sha256 (디스크에 있으면 스레드에서 읽음)"""
+        def compute() -> str:
+            digest = hashlib.sha256()
+            self.file.seek(0)
+            for chunk in iter(lambda: self.file.read(64 * 1024), b""):
+                digest.update(chunk)
+            self.file.seek(0)
+            return digest.hexdigest()
+
+        return compute() if self.in_memory else await run_in_threadpool(compute)
+
+    async def write(self, data: bytes):
+        self.size += len(data)
+        if self.in_memory:
+            self.file.write(data)
+            if not self.in_memory:
+                # 임시 파일로 넘어갔으므로 메모리 예약 반환
+                self._release()
+                self._budget.spooled_to_disk += 1
+        else:
+            await run_in_threadpool(self.file.write, data)
+
+    def close(self):
+        self._release()
+        self.file.close()
+
+    def _release(self):
+        if self._reserved:
+            self._budget.release(self._reserved)
+            self._reserved = 0
+
+
+@dataclass
+class SpooledForm:
+    """읽어 둔 폼 필드와 파일 파트
+
+    파일은 업스트림으로 보낼 때까지 열어 두어야 하므로 호출자가 close 해야 한다.
+    요청이 끝난 뒤에도 쓰는 경우(비동기 작업 등) hand_off 로 감싼 send 가 끝날 때 닫는다.
+    """
+    fields: Dict[str, str] = field(default_factory=dict)
+    files: Dict[str, SpooledUpload] = field(default_factory=dict)
+    handed_off: bool = False
+
+    def hand_off(self, send: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        """send 가 끝날 때 파일을 닫도록 감싸고, 요청 핸들러는 더 이상 닫지 않도록 표시"""
+        self.handed_off = True
+
+        async def send_and_close(*args: Any) -> T:
+            try:
+                return await send(*args)
+            finally:
+                self.close()
+
+        return send_and_close
+
+    async def fingerprint(self, content: Optional[bytes] = None) -> str:
+        """폼 필드, 파일 내용, 원본 본문으로 만든 요청 지문 (sha256)"""
+        digest = hashlib.sha256(json.dumps(sorted(self.fields.items())).encode("utf-8"))
+        for name, upload in sorted(self.files.items()):
+            digest.update(json.dumps([name, upload.filename, upload.content_type]).encode("utf-8"))
+            digest.update((await upload.digest()).encode("ascii"))
+        if content:
+            digest.update(hashlib.sha256(content).hexdigest().encode("ascii"))
+        return digest.hexdigest()
+
+    def close(self):
+        for upload in self.files.values():
+            upload.close()
+
+
+async def read_form(
+    request: Request,
+    limit: int,
+    budget: Optional[UploadMemoryBudget] = None,
+    threshold: int = SPOOL_THRESHOLD,
+    max_field_bytes: int = MAX_FIELD_BYTES,
+) -> SpooledForm:
+    """multipart/form-data 또는 application/x-www-form-urlencoded 본문을 스트리밍으로 읽음
+
+    - Content-Length 가 limit 를 넘으면 본문을 읽지 않고 413
+    - Content-Length 가 없거나 틀려도 읽은 양이 limit 를 넘는 순간 413
+    - 파일 파트는 threshold 까지 메모리, 넘으면 임시 파일에 쓰고 전체 메모리 사용량은 budget 으로 제한
+
+    Raises:
+        HTTPException: 본문이 너무 크거나 (413) 폼 형식이 잘못된 경우 (400)
+    """
+    budget = budget or upload_budget
+    try:
+        check_content_length(request, limit)
+    except HTTPException:
+        budget.rejected += 1
+        raise
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    if content_type == b"multipart/form-data":
+        boundary = options.get(b"boundary")
+        if not boundary:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="multipart boundary 가 없습니다.")
+        return await _MultipartSpooler(boundary, limit, budget, threshold, max_field_bytes).parse(request)
+
+    body = await read_body(request, limit, budget)
+    return SpooledForm(fields=dict(parse_qsl(body.decode("latin-1"), keep_blank_values=True)))
+
+
+class _MultipartSpooler:
+    """python-multipart 콜백으로 파트를 나눠 필드는 메모리, 파일은 SpooledUpload 에 기록"""
+
+    def __init__(self, boundary: bytes, limit: int, budget: UploadMemoryBudget, threshold: int, max_field_bytes: int):
+        self.limit = limit
+        self.budget = budget
+        self.threshold = threshold
+        self.max_field_bytes = max_field_bytes
+        self.form = SpooledForm()
+        self._events: List[Tuple[str, Any]] = []
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self._parser = MultipartParser(boundary, {
+            "on_part_begin": lambda: self._events.append(("begin", b"")),
+            "on_part_data": lambda data, start, end: self._events.append(("data", data[start:end])),
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": lambda: self._events.append(("headers", b"")),
+            "on_part_end": lambda: self._events.append(("end", b"")),
+        })
+        self._name = ""
+        self._upload: Optional[SpooledUpload] = None
+        self._value = bytearray()
+
+    async def parse(self, request: Request) -> SpooledForm:
+        received = 0
+        try:
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > self.limit:
+                    self.budget.rejected += 1
+                    raise _too_large(self.limit)
+                self._parser.write(chunk)
+                await self._drain()
+            self._parser.finalize()
+            await self._drain()
+        except HTTPException:
+            self.form.close()
+            raise
+        except Exception as e:
+            self.form.close()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"multipart 본문을 읽을 수 없습니다: {e}")
+        return self.form
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        self._events.append(("header", (self._header_field.lower(), self._header_value)))
+        self._header_field = self._header_value = b""
+
+    async def _drain(self):
+        """파서가 남긴 이벤트 처리 (파일 쓰기는 await 가 필요해 콜백 밖에서 처리)"""
+        events, self._events = self._events, []
+        for kind, data in events:
+            if kind == "begin":
+                self._headers = {}
+                self._name, self._upload, self._value = "", None, bytearray()
+            elif kind == "header":
+                self._headers[data[0]] = data[1]
+            elif kind == "headers":
+                _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+                self._name = options.get(b"name", b"").decode("utf-8", "replace")
+                if b"filename" in options:
+                    content_type = self._headers.get(b"content-type")
+                    self._upload = SpooledUpload(
+                        options[b"filename"].decode("utf-8", "replace"),
+                        content_type.decode("latin-1") if content_type else None,
+                        self.budget,
+                        self.threshold,
+                    )
+                    previous = self.form.files.pop(self._name, None)
+                    if previous is not None:
+                        previous.close()
+                    self.form.files[self._name] = self._upload
+            elif kind == "end":
+                if self._upload is None:
+                    self.form.fields[self._name] = self._value.decode("utf-8", "replace")
+            elif self._upload is not None:
+                await self._upload.write(data)
+            else:
+                self._value.extend(data)
+                if len(self._value) > self.max_field_bytes:
+                    raise _too_large(self.max_field_bytes)
+
+
+# ✅ 게이트웨이 전역 업로드 메모리 예산
+upload_budget = UploadMemoryBudget()
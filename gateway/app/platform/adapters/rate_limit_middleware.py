@@ -0,0 +1,65 @@
+import json
+import math
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.rate_limiter import TRUST_FORWARDED, RateLimiter, client_identity, current_client_id
+
+GATEWAY_PREFIX = "/ai/v1/"
+
+
+class RateLimitMiddleware:
+    """/ai/v1/{service}/... 요청(WebSocket 연결 포함)에 토큰 버킷 제한을 적용하는 ASGI 미들웨어
+
+    본문을 읽거나 업스트림을 호출하기 전에 거부하므로 초과 요청은 백엔드에 전혀 도달하지 않는다.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+        self.trust_forwarded = TRUST_FORWARDED
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket") or not scope["path"].startswith(GATEWAY_PREFIX):
+            await self.app(scope, receive, send)
+            return
+        service_name = scope["path"][len(GATEWAY_PREFIX):].split("/", 1)[0]
+        try:
+            service_type = ServiceType(service_name)
+        except ValueError:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope["headers"]}
+        client = scope.get("client")
+        client_id = client_identity(headers, client[0] if client else None, self.trust_forwarded)
+        allowed, retry_after, limit, remaining = await self.limiter.check(client_id, service_type)
+        if allowed:
+            token = current_client_id.set(client_id)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                current_client_id.reset(token)
+            return
+
+        if scope["type"] == "websocket":
+            # 핸드셰이크를 수락하기 전에 닫으면 클라이언트는 403 을 받음 (1008: 정책 위반)
+            await send({"type": "websocket.close", "code": 1008, "reason": "rate limited"})
+            return
+
+        body = json.dumps(
+            {"error": f"요청 한도를 초과했습니다: {service_type.value}"}, ensure_ascii=False
+        ).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                (b"x-ratelimit-limit", str(limit.burst).encode()),
+                (b"x-ratelimit-remaining", str(int(remaining)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
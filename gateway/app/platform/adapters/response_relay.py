@@ -0,0 +1,218 @@
+from typing import AsyncIterator, Callable, Dict, Mapping, Optional
+import asyncio
+import logging
+import os
+
+import httpx
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.domain.model.response_snapshot import ResponseSnapshot
+from app.domain.model.service_type import ResponseMode
+
+logger = logging.getLogger("response_relay")
+
+# SSE 스트림에서 업스트림이 이 시간(초) 동안 아무것도 보내지 않으면 스트림을 닫음
+SSE_IDLE_TIMEOUT = float(os.getenv("GATEWAY_SSE_IDLE_TIMEOUT", "60"))
+EVENT_STREAM = "text/event-stream"
+
+
+# 프록시 구간마다 새로 정해지는 hop-by-hop 헤더는 전달하지 않음
+HOP_BY_HOP_HEADERS = {
+    b"connection", b"keep-alive", b"proxy-authenticate", b"proxy-authorization",
+    b"te", b"trailer", b"trailers", b"transfer-encoding", b"upgrade",
+}
+
+
+async def relay_response(
+    response: httpx.Response,
+    mode: ResponseMode,
+    error_mapping: Optional[Dict[int, int]] = None,
+    envelope: Callable[[httpx.Response], Response] = None
+) -> Response:
+    """업스트림 응답을 설정된 방식으로 클라이언트 응답으로 변환
+
+    Args:
+        response (httpx.Response): stream=True 로 받은 업스트림 응답
+        mode (ResponseMode): 응답 전달 방식
+        error_mapping (Dict[int, int], optional): passthrough 모드에서 봉투로 재작성할 상태 코드 매핑. 기본값은 None.
+        envelope (Callable, optional): envelope 모드의 응답 변환 함수. 기본값은 envelope_response.
+
+    Returns:
+        Response: 클라이언트로 반환할 응답
+    """
+    if is_event_stream(response):
+        # SSE 는 응답 모드와 관계없이 이벤트 단위로 바로 중계
+        return event_stream_response(response)
+    if mode == ResponseMode.STREAM:
+        return stream_response(response)
+    if mode == ResponseMode.PASSTHROUGH:
+        if error_mapping and response.status_code in error_mapping:
+            return await mapped_error_response(response, error_mapping[response.status_code])
+        return passthrough_response(response)
+
+    try:
+        await response.aread()
+    finally:
+        await response.aclose()
+    return (envelope or envelope_response)(response)
+
+
+def envelope_response(response: httpx.Response) -> JSONResponse:
+    """본문을 모두 읽은 업스트림 응답을 JSON 봉투로 감싸서 반환 (기존 방식)"""
+    if response.status_code == 200:
+        try:
+            return JSONResponse(content=response.json(), status_code=response.status_code)
+        except Exception:
+            logger.warning("⚠️ 업스트림 응답이 JSON이 아닙니다.")
+            return JSONResponse(
+                content={"message": "성공", "raw_response": response.text[:1000]},
+                status_code=200
+            )
+    return JSONResponse(
+        content={"error": f"서비스 오류: HTTP {response.status_code}", "details": response.text[:500]},
+        status_code=response.status_code
+    )
+
+
+def passthrough_response(response: httpx.Response) -> StreamingResponse:
+    """업스트림 원본 바이트와 헤더를 디코딩/파싱 없이 그대로 전달
+
+    content-encoding, content-length 를 포함한 엔드투엔드 헤더는 모두 유지하고
+    hop-by-hop 헤더만 제외한다. 이미 읽힌(디코딩된) 응답은 인코딩 관련 헤더를 제외한다.
+    """
+    excluded = HOP_BY_HOP_HEADERS
+    if response.is_stream_consumed:
+        excluded = HOP_BY_HOP_HEADERS | {b"content-encoding", b"content-length"}
+    relayed = StreamingResponse(
+        _iter_body(response, raw=True),
+        status_code=response.status_code,
+        background=BackgroundTask(response.aclose),
+    )
+    relayed.raw_headers = [
+        (key.lower(), value) for key, value in response.headers.raw
+        if key.lower() not in excluded
+    ]
+    return relayed
+
+
+async def mapped_error_response(response: httpx.Response, status_code: int) -> JSONResponse:
+    """에러 매핑이 설정된 상태 코드를 JSON 봉투로 재작성"""
+    try:
+        await response.aread()
+    finally:
+        await response.aclose()
+    return JSONResponse(
+        content={"error": f"서비스 오류: HTTP {response.status_code}", "details": response.text[:500]},
+        status_code=status_code
+    )
+
+
+def snapshot_response(
+    snapshot: ResponseSnapshot,
+    mode: ResponseMode,
+    if_none_match: Optional[str] = None,
+    extra_headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """저장된 응답 스냅샷을 클라이언트 응답으로 재생
+
+    Args:
+        snapshot (ResponseSnapshot): 캐시 등에 보관된 응답
+        mode (ResponseMode): 응답 전달 방식 (envelope 이면 기존 JSON 봉투 적용)
+        if_none_match (str, optional): 클라이언트의 If-None-Match 헤더. 기본값은 None.
+        extra_headers (Dict[str, str], optional): 추가로 붙일 헤더 (X-Cache 등). 기본값은 None.
+
+    Returns:
+        Response: ETag 가 일치하면 304, 아니면 저장된 본문
+    """
+    headers = {"etag": snapshot.etag, **(extra_headers or {})}
+    if if_none_match and _etag_matches(snapshot.etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+
+    if mode == ResponseMode.ENVELOPE:
+        replayed = envelope_response(snapshot.to_httpx())
+    else:
+        replayed = Response(content=snapshot.body, status_code=snapshot.status_code)
+        replayed.raw_headers.extend(
+            (key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in snapshot.headers
+        )
+    for key, value in headers.items():
+        replayed.headers[key] = value
+    return replayed
+
+
+def stream_response(response: httpx.Response) -> StreamingResponse:
+    """업스트림 본문을 메모리에 모으지 않고 청크 단위로 중계 (상태 코드와 content-type 유지)"""
+    return StreamingResponse(
+        _iter_body(response),
+        status_code=response.status_code,
+        media_type=response.headers.get("content-type"),
+        background=BackgroundTask(response.aclose),
+    )
+
+
+def accepts_event_stream(headers: Mapping[str, str]) -> bool:
+    """클라이언트가 SSE 응답을 요청했는지 (Accept: text/event-stream)"""
+    return EVENT_STREAM in headers.get("accept", "")
+
+
+def is_event_stream(response: httpx.Response) -> bool:
+    content_type = response.headers.get("content-type", "")
+    return content_type.split(";")[0].strip().lower() == EVENT_STREAM and not response.is_stream_consumed
+
+
+def event_stream_response(response: httpx.Response, idle_timeout: Optional[float] = None) -> StreamingResponse:
+    """SSE 업스트림 응답을 버퍼링 없이 청크 단위로 중계
+
+    업스트림에서 읽은 청크를 클라이언트에 보낸 뒤에야 다음 청크를 읽으므로 느린 클라이언트의 압력이
+    업스트림 연결까지 전달된다. idle_timeout 동안 업스트림이 조용하면 스트림을 닫는다.
+    """
+    relayed = StreamingResponse(
+        _iter_events(response, SSE_IDLE_TIMEOUT if idle_timeout is None else idle_timeout),
+        status_code=response.status_code,
+        background=BackgroundTask(response.aclose),
+    )
+    relayed.raw_headers = [
+        (key.lower(), value) for key, value in response.headers.raw
+        if key.lower() not in HOP_BY_HOP_HEADERS | {b"content-length", b"content-encoding"}
+    ]
+    relayed.headers["cache-control"] = "no-cache"
+    # 중간 프록시(nginx 등)가 버퍼링하지 않도록
+    relayed.headers["x-accel-buffering"] = "no"
+    return relayed
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    # If-None-Match 는 약한 비교를 사용 (W/ 접두사 무시)
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+async def _iter_events(response: httpx.Response, idle_timeout: float) -> AsyncIterator[bytes]:
+    chunks = response.aiter_bytes().__aiter__()
+    try:
+        while True:
+            try:
+                async with asyncio.timeout(idle_timeout):
+                    chunk = await chunks.__anext__()
+            except StopAsyncIteration:
+                return
+            except (TimeoutError, httpx.ReadTimeout):
+                logger.info(f"SSE 업스트림 유휴 시간 초과로 스트림 종료 ({idle_timeout}s): {response.request.url}")
+                return
+            yield chunk
+    finally:
+        await response.aclose()
+
+
+async def _iter_body(response: httpx.Response, raw: bool = False) -> AsyncIterator[bytes]:
+    # 클라이언트 연결이 끊겨도 업스트림 커넥션이 풀로 반환되도록 항상 닫는다
+    try:
+        if response.is_stream_consumed:
+            yield response.content
+            return
+        chunks = response.aiter_raw() if raw else response.aiter_bytes()
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await response.aclose()
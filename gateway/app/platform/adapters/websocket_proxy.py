@@ -0,0 +1,156 @@
+from typing import List, Optional, Tuple
+import asyncio
+import logging
+import os
+import time
+
+import httpx
+from starlette.websockets import WebSocket, WebSocketState
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.load_balancer import Replica, upstream_balancers
+from app.foundation.infrastructure.upstream_transport import route_for
+
+try:
+    from websockets.asyncio.client import connect, unix_connect
+    from websockets.exceptions import ConnectionClosed
+except ImportError:  # websockets 패키지가 없으면 WebSocket 프록시를 사용하지 않음
+    connect = unix_connect = None
+    ConnectionClosed = Exception
+
+logger = logging.getLogger("websocket_proxy")
+
+WS_IDLE_TIMEOUT = float(os.getenv("GATEWAY_WS_IDLE_TIMEOUT", "300"))
+WS_OPEN_TIMEOUT = float(os.getenv("GATEWAY_WS_OPEN_TIMEOUT", "10"))
+# 업스트림에서 받아 두고 아직 클라이언트로 보내지 못한 메시지 수 상한 (초과하면 업스트림 읽기를 멈춤)
+WS_MAX_QUEUE = int(os.getenv("GATEWAY_WS_MAX_QUEUE", "16"))
+WS_MAX_SIZE = int(os.getenv("GATEWAY_WS_MAX_SIZE", str(1024 * 1024)))
+
+# 핸드셰이크마다 새로 정해지는 헤더는 업스트림으로 전달하지 않음
+HANDSHAKE_HEADERS = {
+    "host", "connection", "upgrade", "content-length",
+    "sec-websocket-key", "sec-websocket-version", "sec-websocket-extensions", "sec-websocket-protocol",
+}
+
+CLOSE_GOING_AWAY = 1001
+CLOSE_INTERNAL_ERROR = 1011
+CLOSE_TRY_AGAIN_LATER = 1013
+CLOSE_BAD_GATEWAY = 1014
+# 프레임으로 보낼 수 없는 예약 코드 (연결이 비정상 종료된 경우 등)
+RESERVED_CLOSE_CODES = {1005, 1006, 1015}
+
+
+def upstream_ws_url(replica: Replica, path: str, query: str) -> str:
+    """레플리카 기본 URL 을 ws(s):// 주소로 변환"""
+    url = f"{replica.base_url}/{path.lstrip('/')}"
+    if query:
+        url = f"{url}?{query}"
+    return "wss://" + url[len("https://"):] if url.startswith("https://") else "ws://" + url[len("http://"):]
+
+
+def forwarded_headers(websocket: WebSocket) -> List[Tuple[str, str]]:
+    return [(k, v) for k, v in websocket.headers.items() if k.lower() not in HANDSHAKE_HEADERS]
+
+
+def _close_code(code: Optional[int]) -> int:
+    if code is None or code in RESERVED_CLOSE_CODES:
+        return CLOSE_INTERNAL_ERROR if code in (1006, 1015) else 1000
+    return code
+
+
+async def _open_upstream(replica: Replica, websocket: WebSocket, path: str):
+    url = upstream_ws_url(replica, path, websocket.url.query)
+    options = dict(
+        additional_headers=forwarded_headers(websocket),
+        subprotocols=websocket.scope.get("subprotocols") or None,
+        open_timeout=WS_OPEN_TIMEOUT,
+        max_size=WS_MAX_SIZE,
+        max_queue=WS_MAX_QUEUE,
+    )
+    route = route_for(httpx.URL(replica.base_url))
+    if route.protocol == "uds":
+        return await unix_connect(route.uds, url, **options)
+    return await connect(url, **options)
+
+
+async def proxy_websocket(websocket: WebSocket, service: ServiceType, path: str):
+    """클라이언트 WebSocket 을 서비스 레플리카의 WebSocket 과 양방향으로 연결
+
+    - 업스트림 연결이 성공해야 클라이언트 핸드셰이크를 수락 (실패하면 수락 전에 닫아 403 으로 응답)
+    - 한쪽에서 받은 메시지를 다른 쪽에 보낸 뒤에 다음 메시지를 읽으므로 느린 쪽의 압력이 반대쪽으로 전달됨
+    - 양방향 모두 WS_IDLE_TIMEOUT 동안 메시지가 없으면 두 연결을 1001 로 닫음
+    """
+    if connect is None:
+        logger.error("websockets 패키지가 없어 WebSocket 프록시를 사용할 수 없습니다.")
+        await websocket.close(code=CLOSE_INTERNAL_ERROR)
+        return
+    replica = upstream_balancers[service].choose()
+    if replica is None:
+        await websocket.close(code=CLOSE_TRY_AGAIN_LATER)
+        return
+
+    replica.outstanding += 1
+    try:
+        try:
+            upstream = await _open_upstream(replica, websocket, path)
+        except Exception as e:
+            logger.warning(f"업스트림 WebSocket 연결 실패 ({service.value}/{path}): {type(e).__name__}: {e}")
+            await websocket.close(code=CLOSE_BAD_GATEWAY)
+            return
+        async with upstream:
+            await websocket.accept(subprotocol=upstream.subprotocol)
+            await _relay(websocket, upstream, f"{service.value}/{path}")
+    finally:
+        replica.outstanding -= 1
+
+
+async def _relay(websocket: WebSocket, upstream, name: str):
+    last_activity = time.monotonic()
+
+    async def client_to_upstream() -> int:
+        nonlocal last_activity
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                await upstream.close(_close_code(message.get("code")))
+                return _close_code(message.get("code"))
+            await upstream.send(message["text"] if message.get("text") is not None else message.get("bytes", b""))
+            last_activity = time.monotonic()
+
+    async def upstream_to_client() -> int:
+        nonlocal last_activity
+        try:
+            async for data in upstream:
+                if isinstance(data, str):
+                    await websocket.send_text(data)
+                else:
+                    await websocket.send_bytes(data)
+                last_activity = time.monotonic()
+        except ConnectionClosed:
+            pass
+        return _close_code(upstream.close_code)
+
+    async def idle_watchdog() -> int:
+        while True:
+            remaining = last_activity + WS_IDLE_TIMEOUT - time.monotonic()
+            if remaining <= 0:
+                logger.info(f"WebSocket 유휴 시간 초과로 종료 ({WS_IDLE_TIMEOUT}s): {name}")
+                return CLOSE_GOING_AWAY
+            await asyncio.sleep(remaining)
+
+    tasks = [asyncio.create_task(pump()) for pump in (client_to_upstream, upstream_to_client, idle_watchdog)]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    finished = done.pop()
+    code = finished.result() if not finished.cancelled() and finished.exception() is None else CLOSE_INTERNAL_ERROR
+    if finished is not tasks[0] and websocket.application_state == WebSocketState.CONNECTED:
+        try:
+            await websocket.close(code=code)
+        except RuntimeError:
+            pass
+    await upstream.close(code if code != CLOSE_INTERNAL_ERROR else 1000)
@@ -0,0 +1,118 @@
+from typing import Any, Dict, Optional
+import asyncio
+import json
+import logging
+import time
+
+import httpx
+from fastapi import HTTPException
+
+from app.domain.model.batch_schema import BATCH_MAX_TIMEOUT, BatchItem, BatchItemResult, BatchRequest, BatchResponse
+from app.domain.model.service_proxy_factory import get_proxy_factory
+from app.domain.model.service_type import SERVICE_ERROR_MAPPINGS
+from app.foundation.core.rate_limiter import rate_limiter
+from app.foundation.core.timeout_policy import DEADLINE_HEADER, client_budget
+
+logger = logging.getLogger("batch_executor")
+
+
+async def execute_batch(batch: BatchRequest, headers: Dict[str, str], client_id: str) -> BatchResponse:
+    """하위 요청을 동시에 실행하고 입력 순서대로 결과를 모아 반환
+
+    Args:
+        batch (BatchRequest): 배치 요청
+        headers (Dict[str, str]): 모든 하위 요청에 전달할 클라이언트 헤더 (인증 등)
+        client_id (str): 요청 제한에 사용할 클라이언트 식별자
+
+    Returns:
+        BatchResponse: 항목별 상태 코드와 본문 (실패한 항목이 있어도 나머지 결과는 그대로 반환)
+
+    Note:
+        마감 시간까지 끝나지 않은 항목은 취소하고 504 로 채운다.
+        각 항목은 배치의 남은 시간을 DEADLINE_HEADER 로 받아 라우트 타임아웃, 벌크헤드 대기,
+        업스트림에 전달하는 마감이 모두 배치 마감 시각에 끝나도록 한다.
+    """
+    timeout = min(batch.timeout or BATCH_MAX_TIMEOUT, BATCH_MAX_TIMEOUT)
+    started = time.monotonic()
+    expires_at = started + timeout
+    tasks = [asyncio.create_task(_execute_item(item, headers, client_id, expires_at)) for item in batch.requests]
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+    finally:
+        # 마감 초과 또는 클라이언트 연결 종료 시 남은 하위 요청 취소
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        logger.warning(f"배치 마감 시간 초과: {len(pending)}/{len(tasks)}개 취소 ({timeout}s)")
+
+    results = [
+        task.result() if task not in pending
+        else BatchItemResult(
+            id=item.id, service=item.service, status=504,
+            error=f"배치 마감 시간({timeout}s)을 초과했습니다.", elapsed_ms=round(timeout * 1000, 1)
+        )
+        for item, task in zip(batch.requests, tasks)
+    ]
+    succeeded = sum(1 for result in results if result.status < 400)
+    return BatchResponse(
+        results=results,
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        elapsed_ms=round((time.monotonic() - started) * 1000, 1),
+    )
+
+
+async def _execute_item(item: BatchItem, headers: Dict[str, str], client_id: str, expires_at: float) -> BatchItemResult:
+    """하위 요청 하나를 배치 마감 시각(expires_at, monotonic) 안에서 프록시로 실행 (예외는 항목 결과로 변환)"""
+    started = time.monotonic()
+
+    def result(status: int, body: Any = None, error: Optional[str] = None) -> BatchItemResult:
+        return BatchItemResult(
+            id=item.id, service=item.service, status=status, body=body, error=error,
+            elapsed_ms=round((time.monotonic() - started) * 1000, 1),
+        )
+
+    try:
+        # 배치로 묶어도 서비스별 요청 제한은 항목마다 적용
+        allowed, retry_after, _, _ = await rate_limiter.check(client_id, item.service)
+        if not allowed:
+            return result(429, error=f"요청 한도를 초과했습니다: {item.service.value} ({retry_after:.1f}s 후 재시도)")
+
+        factory = get_proxy_factory(item.service)
+        path = item.path.lstrip("/")
+        # 단건 프록시와 같은 경로 규칙 (POST 만 서비스 접두사를 붙임)
+        upstream_path = f"{item.service.value}/{path}" if item.method == "POST" else path
+        request_headers = {k: v for k, v in {**headers, **item.headers}.items() if k.lower() != DEADLINE_HEADER}
+        # 배치의 남은 시간을 항목의 예산으로 사용 (클라이언트가 더 짧은 예산을 보냈으면 그 값)
+        budget = expires_at - time.monotonic()
+        client_limit = client_budget({**headers, **item.headers})
+        if client_limit is not None:
+            budget = min(budget, client_limit)
+        request_headers[DEADLINE_HEADER] = str(max(1, int(budget * 1000)))
+        content = None
+        if item.body is not None:
+            content = json.dumps(item.body, ensure_ascii=False).encode("utf-8")
+            request_headers["content-type"] = "application/json"
+
+        response = await factory.request(item.method, upstream_path, headers=request_headers, content=content)
+        status_code = SERVICE_ERROR_MAPPINGS[item.service].get(response.status_code, response.status_code)
+        return result(status_code, body=_decode_body(response))
+    except HTTPException as e:
+        return result(e.status_code, error=str(e.detail))
+    except Exception as e:
+        logger.error(f"배치 항목 처리 오류 ({item.service.value}/{item.path}): {str(e)}")
+        return result(502, error=str(e))
+
+
+def _decode_body(response: httpx.Response) -> Any:
+    """JSON 이면 파싱한 값, 아니면 텍스트로 반환"""
+    if not response.content:
+        return None
+    if "json" in response.headers.get("content-type", ""):
+        try:
+            return response.json()
+        except ValueError:
+            pass
+    return response.text
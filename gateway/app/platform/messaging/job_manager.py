@@ -0,0 +1,121 @@
+from typing import Awaitable, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
+import asyncio
+import logging
+import os
+import time
+
+import httpx
+from fastapi import HTTPException
+
+from app.domain.model.job_schema import Job, JobStatus
+from app.domain.model.response_snapshot import ResponseSnapshot
+from app.domain.model.service_type import ServiceType
+from app.platform.messaging.job_store import MemoryJobStore, RedisJobStore
+
+logger = logging.getLogger("job_manager")
+
+# 작업 실행 함수 - 업스트림 타임아웃(초)을 받아 응답을 반환
+JobSender = Callable[[float], Awaitable[httpx.Response]]
+
+
+def prefers_async(headers: Mapping[str, str]) -> bool:
+    """Prefer 헤더에 respond-async 가 있는지 (RFC 7240)"""
+    prefer = headers.get("prefer", "")
+    return any(token.split("=")[0].strip().lower() == "respond-async" for token in prefer.split(","))
+
+
+def strip_prefer(
+    headers: Union[Mapping[str, str], Iterable[Tuple[bytes, bytes]]]
+) -> Union[Dict[str, str], list]:
+    """업스트림으로 보낼 헤더에서 Prefer 제거 (dict 또는 ASGI raw 헤더 목록)"""
+    if isinstance(headers, Mapping):
+        return {k: v for k, v in headers.items() if k.lower() != "prefer"}
+    return [(k, v) for k, v in headers if k.lower() != b"prefer"]
+
+
+class JobManager:
+    """오래 걸리는 업스트림 호출을 백그라운드에서 실행하고 상태/결과를 저장소에 기록
+
+    작업은 제출받은 게이트웨이 워커에서 실행되며, Redis 저장소를 쓰면 다른 워커에서도 상태를 조회할 수 있다.
+    """
+
+    def __init__(self, store, result_ttl: float = 3600.0, job_timeout: float = 600.0):
+        self.store = store
+        self.result_ttl = result_ttl
+        self.job_timeout = job_timeout
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    @classmethod
+    def from_env(cls) -> "JobManager":
+        """GATEWAY_JOB_BACKEND (memory|redis), GATEWAY_JOB_RESULT_TTL, GATEWAY_JOB_TIMEOUT"""
+        store = RedisJobStore() if os.getenv("GATEWAY_JOB_BACKEND", "memory").lower() == "redis" else MemoryJobStore()
+        return cls(
+            store,
+            result_ttl=float(os.getenv("GATEWAY_JOB_RESULT_TTL", "3600")),
+            job_timeout=float(os.getenv("GATEWAY_JOB_TIMEOUT", "600")),
+        )
+
+    @property
+    def running(self) -> int:
+        return len(self._tasks)
+
+    async def submit(self, service: ServiceType, method: str, path: str, send: JobSender) -> Job:
+        """작업을 등록하고 바로 반환 (실행은 백그라운드 태스크)"""
+        job = Job(service=service.value, method=method, path=path)
+        await self.store.save(job, self.job_timeout + self.result_ttl)
+        task = asyncio.create_task(self._run(job, send))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        logger.info(f"작업 등록: {job.id} ({method} {service.value}/{path})")
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return await self.store.get(job_id)
+
+    async def cancel(self, job_id: str) -> bool:
+        """이 워커에서 실행 중인 작업을 취소 (다른 워커의 작업이나 끝난 작업이면 False)"""
+        task = self._tasks.get(job_id)
+        if task is None:
+            return False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return True
+
+    async def shutdown(self):
+        """실행 중인 작업을 모두 취소 (취소 상태로 기록됨)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: Job, send: JobSender):
+        await self._update(job, JobStatus.RUNNING)
+        try:
+            response = await send(self.job_timeout)
+            snapshot = ResponseSnapshot.from_response(response, self.result_ttl)
+            status = JobStatus.SUCCEEDED if response.status_code < 400 else JobStatus.FAILED
+            await self._update(job, status, status_code=response.status_code, result=snapshot.dumps().decode("utf-8"))
+        except asyncio.CancelledError:
+            await self._update(job, JobStatus.CANCELLED, error="작업이 취소되었습니다.")
+            raise
+        except HTTPException as e:
+            await self._update(job, JobStatus.FAILED, status_code=e.status_code, error=str(e.detail))
+        except Exception as e:
+            logger.error(f"작업 실행 오류 ({job.id}): {str(e)}")
+            await self._update(job, JobStatus.FAILED, status_code=502, error=str(e))
+
+    async def _update(self, job: Job, status: JobStatus, **fields):
+        job.status = status
+        job.version += 1
+        job.updated_at = time.time()
+        for name, value in fields.items():
+            setattr(job, name, value)
+        ttl = self.result_ttl if status.finished else self.job_timeout + self.result_ttl
+        try:
+            await self.store.save(job, ttl)
+        except Exception as e:
+            logger.error(f"작업 상태 저장 실패 ({job.id}): {str(e)}")
+
+
+# ✅ 게이트웨이 비동기 작업 관리자
+job_manager = JobManager.from_env()
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+import time
+
+from app.domain.model.job_schema import Job
+from app.foundation.infrastructure.redis_client import get_redis
+
+logger = logging.getLogger("job_store")
+
+
+class MemoryJobStore:
+    """프로세스 내 작업 저장소 (TTL 만료, 최대 개수 초과 시 오래된 작업부터 삭제)"""
+
+    def __init__(self, max_jobs: int = 10_000):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Tuple[Job, float]]" = OrderedDict()
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+
+    async def save(self, job: Job, ttl: float):
+        self._jobs[job.id] = (job, time.monotonic() + ttl)
+        self._jobs.move_to_end(job.id)
+        while len(self._jobs) > self.max_jobs:
+            self._jobs.popitem(last=False)
+        for waiter in self._waiters.pop(job.id, []):
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            return None
+        job, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._jobs.pop(job_id, None)
+            return None
+        return job
+
+    async def wait_change(self, job_id: str, version: int, timeout: float) -> Optional[Job]:
+        """작업 버전이 version 보다 커질 때까지 최대 timeout 초 대기 후 현재 상태 반환"""
+        job = await self.get(job_id)
+        if job is None or job.version > version:
+            return job
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(job_id, []).append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            waiters = self._waiters.get(job_id, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    self._waiters.pop(job_id, None)
+        return await self.get(job_id)
+
+
+class RedisJobStore:
+    """Redis 작업 저장소 - 여러 게이트웨이 워커가 작업 상태를 공유 (변경 대기는 폴링)"""
+
+    def __init__(self, redis=None, namespace: str = "gateway:jobs:", poll_interval: float = 0.5):
+        self._redis = redis
+        self.namespace = namespace
+        self.poll_interval = poll_interval
+
+    @property
+    def redis(self):
+        return self._redis if self._redis is not None else get_redis()
+
+    async def save(self, job: Job, ttl: float):
+        await self.redis.set(self.namespace + job.id, job.dumps(), px=max(1, int(ttl * 1000)))
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        raw = await self.redis.get(self.namespace + job_id)
+        return Job.loads(raw) if raw is not None else None
+
+    async def wait_change(self, job_id: str, version: int, timeout: float) -> Optional[Job]:
+        deadline = time.monotonic() + timeout
+        while True:
+            job = await self.get(job_id)
+            if job is None or job.version > version or time.monotonic() >= deadline:
+                return job
+            await asyncio.sleep(min(self.poll_interval, max(0.0, deadline - time.monotonic())))
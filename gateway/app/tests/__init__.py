@@ -0,0 +1,3 @@
+"""
+게이트웨이 테스트
+"""
@@ -0,0 +1,53 @@
+"""
+게이트웨이 테스트 공통 설정
+- 서비스 URL 환경변수는 service_type 모듈 임포트 전에 설정되어야 함
+"""
+import os
+
+for _name, _url in {
+    "TITANIC_SERVICE_URL": "http://titanic:9001",
+    "CRIME_SERVICE_URL": "http://crime:9002",
+    "MATZIP_SERVICE_URL": "http://matzip:9003",
+    "NLP_SERVICE_URL": "http://nlp:9004",
+    "TF_SERVICE_URL": "http://tf:9005",
+    "CHAT_SERVICE_URL": "http://chat:9006",
+}.items():
+    os.environ.setdefault(_name, _url)
+# 관리 변경 API (PUT /admin/routing, DELETE /admin/cache 등) 를 토큰 없이 호출
+os.environ.setdefault("GATEWAY_ADMIN_INSECURE", "1")
+
+import httpx
+import pytest_asyncio
+
+from app.foundation.infrastructure.http_client_pool import upstream_pool
+
+
+class UpstreamStub:
+    """MockTransport 로 동작하는 가짜 업스트림 - 받은 요청을 기록하고 handler 의 응답을 반환"""
+
+    def __init__(self):
+        self.requests = []
+        self.handler = lambda request: httpx.Response(200, json={"ok": True})
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        self.requests.append(request)
+        response = self.handler(request)
+        if hasattr(response, "__await__"):
+            response = await response
+        return response
+
+
+@pytest_asyncio.fixture
+async def upstream():
+    stub = UpstreamStub()
+    await upstream_pool.startup(transport=httpx.MockTransport(stub))
+    yield stub
+    await upstream_pool.shutdown()
+
+
+@pytest_asyncio.fixture
+async def gateway_client():
+    from app.main import app
+    async with httpx.AsyncClient(app=app, base_url="http://gateway") as client:
+        yield client
@@ -0,0 +1,89 @@
+"""
+배치 프록시 테스트
+"""
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_concurrently_and_keeps_order(upstream, gateway_client):
+    async def handler(request):
+        await asyncio.sleep(0.1)
+        if request.url.host == "titanic":
+            return httpx.Response(200, json={"passengers": 891})
+        if request.url.host == "crime":
+            return httpx.Response(200, text="<html>map</html>", headers={"content-type": "text/html"})
+        return httpx.Response(200, json={"echo": json.loads(request.content)})
+
+    upstream.handler = handler
+    started = time.monotonic()
+    response = await gateway_client.post("/ai/v1/batch", json={"requests": [
+        {"id": "passengers", "service": "titanic", "path": "passengers"},
+        {"id": "map", "service": "crime", "path": "/map"},
+        {"id": "chat", "service": "chat", "method": "POST", "path": "chat", "body": {"message": "안녕"}},
+    ]})
+    elapsed = time.monotonic() - started
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["id"] for r in body["results"]] == ["passengers", "map", "chat"]
+    assert body["results"][0]["body"] == {"passengers": 891}
+    assert body["results"][1]["body"] == "<html>map</html>"
+    assert body["results"][2]["body"] == {"echo": {"message": "안녕"}}
+    assert body["succeeded"] == 3
+    assert elapsed < 0.25
+
+    chat_request = next(r for r in upstream.requests if r.url.host == "chat")
+    assert chat_request.url.path == "/chat/chat"
+    assert chat_request.headers["content-type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_partial_failures_and_deadline(upstream, gateway_client):
+    async def handler(request):
+        if request.url.host == "nlp":
+            await asyncio.sleep(1)
+        if request.url.host == "crime":
+            return httpx.Response(500, json={"detail": "boom"})
+        return httpx.Response(200, json={"ok": True})
+
+    upstream.handler = handler
+    response = await gateway_client.post("/ai/v1/batch", json={"timeout": 0.2, "requests": [
+        {"service": "titanic", "path": "passengers"},
+        {"service": "crime", "path": "map"},
+        {"service": "nlp", "path": "report"},
+    ]})
+
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [200, 500, 504]
+    assert results[1]["body"] == {"detail": "boom"}
+    assert results[2]["error"]
+    assert response.json()["failed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_items_inherit_remaining_batch_deadline(upstream, gateway_client):
+    upstream.handler = lambda request: httpx.Response(200, json={"ok": True})
+    # crime/map 라우트 타임아웃(120s) 대신 배치 마감(2s)이 업스트림 마감으로 전달됨
+    response = await gateway_client.post("/ai/v1/batch", json={"timeout": 2, "requests": [
+        {"service": "crime", "path": "crime/map"},
+        {"service": "titanic", "path": "titanic/passengers", "headers": {"X-Request-Timeout-Ms": "500"}},
+    ]})
+
+    assert response.json()["succeeded"] == 2
+    budgets = {r.url.host: int(r.headers["x-request-timeout-ms"]) for r in upstream.requests}
+    assert 1000 < budgets["crime"] <= 2000
+    assert budgets["titanic"] <= 500
+
+
+@pytest.mark.asyncio
+async def test_batch_validates_items(upstream, gateway_client):
+    invalid = await gateway_client.post("/ai/v1/batch", json={"requests": [{"service": "unknown", "path": "x"}]})
+    empty = await gateway_client.post("/ai/v1/batch", json={"requests": []})
+    assert invalid.status_code == 422
+    assert empty.status_code == 422
+    assert upstream.requests == []
@@ -0,0 +1,41 @@
+"""
+게이트웨이 벤치마크 도구 테스트
+"""
+import pytest
+
+from benchmarks.gateway_benchmark import compare_with_baseline, percentile, run_benchmark
+
+
+def test_percentile_nearest_rank():
+    values = [i / 1000 for i in range(1, 101)]
+    assert percentile(values, 0.50) == 0.050
+    assert percentile(values, 0.99) == 0.099
+    assert percentile([], 0.95) == 0.0
+
+
+def test_compare_with_baseline_flags_regressions():
+    baseline = {"results": [
+        {"scenario": "get", "concurrency": 8, "throughput_rps": 1000.0,
+         "overhead_ms": {"p50": 1.0, "p95": 2.0, "p99": 3.0}},
+    ]}
+    current = {"results": [
+        {"scenario": "get", "concurrency": 8, "throughput_rps": 800.0,
+         "overhead_ms": {"p50": 1.05, "p95": 3.0, "p99": 3.1}},
+        {"scenario": "upload", "concurrency": 8, "throughput_rps": 1.0, "overhead_ms": {"p50": 9.0}},
+    ]}
+
+    regressions = compare_with_baseline(current, baseline, tolerance=0.10)
+    assert {item["metric"] for item in regressions} == {"overhead_ms.p95", "throughput_rps"}
+
+
+@pytest.mark.asyncio
+async def test_run_benchmark_smoke():
+    report = await run_benchmark(["get", "post_json", "upload"], [1, 4], total=8, upload_size=1024, warmup=0)
+
+    assert [(r["scenario"], r["concurrency"]) for r in report["results"]] == [
+        ("get", 1), ("get", 4), ("post_json", 1), ("post_json", 4), ("upload", 1), ("upload", 4)
+    ]
+    for result in report["results"]:
+        assert result["succeeded"] == 8
+        assert result["errors"] == {}
+        assert result["overhead_ms"]["p50"] <= result["latency_ms"]["p50"]
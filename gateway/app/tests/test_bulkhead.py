@@ -0,0 +1,75 @@
+"""
+서비스별 벌크헤드(동시 실행 제한) 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.bulkhead import Bulkhead, BulkheadRejected, service_bulkheads
+
+
+@pytest.mark.asyncio
+async def test_queue_full_and_queue_timeout_are_rejected():
+    bulkhead = Bulkhead("chat", max_concurrent=1, max_queue=1, queue_timeout=0.05)
+    await bulkhead.acquire()
+    queued = asyncio.create_task(bulkhead.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(BulkheadRejected) as full:
+        await bulkhead.acquire()
+    assert full.value.reason == "queue_full"
+
+    with pytest.raises(BulkheadRejected) as timeout:
+        await queued
+    assert timeout.value.reason == "queue_timeout"
+    assert bulkhead.stats()["rejected"] == {"queue_full": 1, "queue_timeout": 1}
+    assert bulkhead.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_slots_are_handed_over_in_order_and_cancel_is_safe():
+    bulkhead = Bulkhead("nlp", max_concurrent=1, max_queue=5, queue_timeout=1)
+    order = []
+    await bulkhead.acquire()
+
+    async def worker(name):
+        async with bulkhead.slot():
+            order.append(name)
+
+    cancelled = asyncio.create_task(worker("cancelled"))
+    first = asyncio.create_task(worker("first"))
+    second = asyncio.create_task(worker("second"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    bulkhead.release()
+    await asyncio.gather(first, second)
+    assert order == ["first", "second"]
+    assert bulkhead.active == 0
+
+
+@pytest.mark.asyncio
+async def test_saturated_service_does_not_starve_other_routes(upstream, gateway_client, monkeypatch):
+    monkeypatch.setitem(service_bulkheads, ServiceType.CHAT, Bulkhead("chat", 1, 0, 0.1))
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.host == "chat":
+            await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    upstream.handler = handler
+    slow_chat = asyncio.create_task(gateway_client.post("/ai/v1/chat/chat", data={"json_data": "안녕"}))
+    await asyncio.sleep(0.02)
+
+    rejected = await gateway_client.post("/ai/v1/chat/chat", data={"json_data": "안녕"})
+    assert rejected.status_code == 429
+    assert rejected.headers["retry-after"] == "1"
+
+    fast = await gateway_client.get("/ai/v1/titanic/passengers")
+    assert fast.status_code == 200
+
+    release.set()
+    assert (await slow_chat).status_code == 200
@@ -0,0 +1,92 @@
+"""
+서킷 브레이커 및 레플리카 격리 테스트
+"""
+import time
+
+import httpx
+import pytest
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.circuit_breaker import BreakerSettings, BreakerState, CircuitBreaker, service_breakers
+from app.foundation.core.load_balancer import LoadBalancer, Replica, upstream_balancers
+
+SETTINGS = BreakerSettings(min_requests=4, error_rate=0.5, slow_call_seconds=1.0, open_seconds=0.05, half_open_probes=2)
+
+
+def test_opens_on_error_rate_and_recovers_through_half_open():
+    breaker = CircuitBreaker("nlp", SETTINGS)
+    for success in (True, False, True, False):
+        assert breaker.try_acquire()
+        breaker.record(success, 0.01)
+    assert breaker.state == BreakerState.OPEN
+    assert not breaker.try_acquire()
+
+    time.sleep(0.06)
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert breaker.try_acquire() and breaker.try_acquire()
+    assert not breaker.try_acquire()
+    breaker.record(True, 0.01)
+    breaker.record(True, 0.01)
+    assert breaker.state == BreakerState.CLOSED
+
+
+def test_slow_calls_and_failed_probe_reopen():
+    breaker = CircuitBreaker("chat", BreakerSettings(min_requests=2, slow_call_rate=1.0, slow_call_seconds=0.5, open_seconds=0.01))
+    breaker.record(True, 0.6)
+    breaker.record(True, 0.7)
+    assert breaker.state == BreakerState.OPEN
+    time.sleep(0.02)
+    assert breaker.try_acquire()
+    breaker.record(False, 0.01)
+    assert breaker.state == BreakerState.OPEN
+
+
+def test_slow_call_threshold_follows_route_timeout():
+    breaker = CircuitBreaker("crime", BreakerSettings(min_requests=2, slow_call_rate=1.0, slow_call_seconds=0.5, open_seconds=0.01))
+    # 라우트 타임아웃이 긴(배치) 라우트는 타임아웃의 80% 전까지 느린 호출이 아님
+    assert breaker.slow_call_threshold(120) == 96
+    assert breaker.slow_call_threshold(0.1) == 0.5
+    breaker.record(True, 0.6, route_timeout=2)
+    breaker.record(True, 0.7, route_timeout=2)
+    assert breaker.state == BreakerState.CLOSED
+
+    breaker = CircuitBreaker("crime", breaker.settings)
+    breaker.record(True, 0.6)
+    breaker.record(True, 0.7)
+    assert breaker.state == BreakerState.OPEN
+    time.sleep(0.02)
+    # 반개방 탐색 요청이 오래 걸려도 라우트 타임아웃 안이면 다시 차단하지 않음
+    assert breaker.try_acquire()
+    breaker.record(True, 0.9, route_timeout=2)
+    assert breaker.state == BreakerState.HALF_OPEN
+
+
+def test_balancer_skips_ejected_replica():
+    healthy, ejected = Replica("http://a", breaker_settings=SETTINGS), Replica("http://b", breaker_settings=SETTINGS)
+    for _ in range(4):
+        ejected.breaker.record(False, 0.01)
+    balancer = LoadBalancer([healthy, ejected])
+    assert {balancer.choose().url for _ in range(10)} == {"http://a"}
+
+
+@pytest.mark.asyncio
+async def test_open_service_breaker_fails_fast_without_upstream(upstream, gateway_client, monkeypatch):
+    settings = BreakerSettings(min_requests=2, open_seconds=30)
+    monkeypatch.setitem(service_breakers, ServiceType.TF, CircuitBreaker("tf", settings))
+    monkeypatch.setitem(
+        upstream_balancers, ServiceType.TF, LoadBalancer([Replica("http://tf:9005", breaker_settings=settings)])
+    )
+    upstream.handler = lambda request: httpx.Response(503, text="restarting")
+
+    for _ in range(2):
+        await gateway_client.post("/ai/v1/tf/mosaic", data={"json_data": "a.png"})
+    assert len(upstream.requests) == 2
+
+    response = await gateway_client.post("/ai/v1/tf/mosaic", data={"json_data": "a.png"})
+    assert response.status_code == 503
+    assert int(response.headers["retry-after"]) > 0
+    assert len(upstream.requests) == 2
+
+    status = (await gateway_client.get("/admin/upstreams")).json()
+    assert status["tf"]["breaker"]["state"] == "open"
+    assert status["tf"]["replicas"][0]["ejected"] is True
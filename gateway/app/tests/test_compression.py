@@ -0,0 +1,86 @@
+"""
+응답 압축 테스트
+"""
+import gzip
+import zlib
+
+import httpx
+import pytest
+
+from app.domain.model.service_type import SERVICE_RESPONSE_MODES, ResponseMode, ServiceType
+from app.platform.adapters.compression_middleware import choose_encoding
+
+DISTRICTS = {"districts": [{"name": f"자치구{i}", "correlation": 0.5} for i in range(200)]}
+
+
+def test_choose_encoding_respects_q_values():
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("gzip, br;q=0.5") == "gzip"
+    assert choose_encoding("br", brotli_available=False) is None
+    assert choose_encoding("identity, gzip;q=0") is None
+    assert choose_encoding("*") == "br"
+
+
+@pytest.mark.asyncio
+async def test_large_json_is_compressed_and_small_is_not(upstream, gateway_client):
+    upstream.handler = lambda request: httpx.Response(200, json=DISTRICTS)
+    response = await gateway_client.get("/ai/v1/nlp/report", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.num_bytes_downloaded < len(response.content)
+    assert response.json() == DISTRICTS
+
+    brotli_response = await gateway_client.get("/ai/v1/nlp/report", headers={"accept-encoding": "br, gzip"})
+    assert brotli_response.headers["content-encoding"] == "br"
+    assert brotli_response.json() == DISTRICTS
+
+    upstream.handler = lambda request: httpx.Response(200, json={"ok": True})
+    small = await gateway_client.get("/ai/v1/nlp/report", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+@pytest.mark.asyncio
+async def test_precompressed_upstream_body_is_passed_through(upstream, gateway_client, monkeypatch):
+    monkeypatch.setitem(SERVICE_RESPONSE_MODES, ServiceType.NLP, ResponseMode.PASSTHROUGH)
+    html = ("<html>" + "<div>범죄 지도</div>" * 500 + "</html>").encode("utf-8")
+    compressed = gzip.compress(html)
+
+    async def body():
+        yield compressed
+
+    upstream.handler = lambda request: httpx.Response(
+        200, content=body(), headers={"content-type": "text/html", "content-encoding": "gzip"}
+    )
+
+    response = await gateway_client.get("/ai/v1/nlp/report", headers={"accept-encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.num_bytes_downloaded == len(compressed)
+    assert response.content == html
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_per_chunk(upstream, gateway_client, monkeypatch):
+    monkeypatch.setitem(SERVICE_RESPONSE_MODES, ServiceType.NLP, ResponseMode.STREAM)
+    chunks = [("line %d\n" % i).encode() * 50 for i in range(20)]
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    upstream.handler = lambda request: httpx.Response(200, content=body(), headers={"content-type": "text/plain"})
+    decoder = zlib.decompressobj(31)
+    received = b""
+    async with gateway_client.stream("GET", "/ai/v1/nlp/report", headers={"accept-encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        async for raw in response.aiter_raw():
+            received += decoder.decompress(raw)
+    assert received == b"".join(chunks)
+
+
+@pytest.mark.asyncio
+async def test_binary_content_types_are_not_compressed(upstream, gateway_client, monkeypatch):
+    monkeypatch.setitem(SERVICE_RESPONSE_MODES, ServiceType.NLP, ResponseMode.PASSTHROUGH)
+    upstream.handler = lambda request: httpx.Response(200, content=b"\x89PNG" * 1000, headers={"content-type": "image/png"})
+    response = await gateway_client.get("/ai/v1/nlp/report", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert len(response.content) == 4000
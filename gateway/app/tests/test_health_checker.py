@@ -0,0 +1,89 @@
+"""
+액티브 헬스체크 및 준비 상태 엔드포인트 테스트
+"""
+import httpx
+import pytest
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core import load_balancer
+from app.foundation.core.load_balancer import HealthState, LoadBalancer, Replica, upstream_balancers
+from app.foundation.infrastructure.health_checker import HealthChecker
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    nlp = [Replica("http://nlp-1:9004"), Replica("http://nlp-2:9004")]
+    chat = [Replica("http://chat-1:9006")]
+    monkeypatch.setitem(upstream_balancers, ServiceType.NLP, LoadBalancer(nlp))
+    monkeypatch.setitem(upstream_balancers, ServiceType.CHAT, LoadBalancer(chat))
+    monkeypatch.setenv("GATEWAY_READY_SERVICES", "nlp,chat")
+    return nlp, chat
+
+
+@pytest.mark.asyncio
+async def test_probe_marks_down_warming_and_unreachable_replicas(upstream, replicas):
+    nlp, chat = replicas
+
+    def handler(request):
+        if request.url.host == "chat-1":
+            raise httpx.ConnectError("model loading")
+        if request.url.host == "nlp-2":
+            return httpx.Response(200, json={"status": "loading"})
+        return httpx.Response(200, json={"status": "online", "service": "NLP Service"})
+
+    upstream.handler = handler
+    checker = HealthChecker(unhealthy_threshold=1, health_paths={ServiceType.NLP: "/"})
+    await checker.check_replica(ServiceType.NLP, nlp[0])
+    await checker.check_replica(ServiceType.NLP, nlp[1])
+    await checker.check_replica(ServiceType.CHAT, chat[0])
+
+    assert [r.health for r in nlp] == [HealthState.UP, HealthState.DOWN]
+    assert chat[0].health == HealthState.DOWN
+    assert {upstream_balancers[ServiceType.NLP].choose().url for _ in range(10)} == {"http://nlp-1:9004"}
+    assert upstream_balancers[ServiceType.CHAT].choose() is None
+
+
+@pytest.mark.asyncio
+async def test_unprobed_replicas_wait_for_first_successful_probe(upstream, replicas, monkeypatch):
+    nlp, chat = replicas
+    monkeypatch.setattr(load_balancer, "_probe_required", True)
+
+    def handler(request):
+        if request.url.host == "chat-1":
+            raise httpx.ConnectError("model loading")
+        return httpx.Response(200, json={"status": "online"})
+
+    upstream.handler = handler
+    assert upstream_balancers[ServiceType.NLP].choose() is None
+
+    checker = HealthChecker(unhealthy_threshold=2)
+    await checker.check_replica(ServiceType.NLP, nlp[0])
+    await checker.check_replica(ServiceType.CHAT, chat[0])
+
+    assert {upstream_balancers[ServiceType.NLP].choose().url for _ in range(10)} == {"http://nlp-1:9004"}
+    # 한 번 실패해 아직 다운은 아니지만 확인된 적이 없으므로 라우팅하지 않음
+    assert chat[0].health == HealthState.UNKNOWN
+    assert upstream_balancers[ServiceType.CHAT].choose() is None
+
+
+@pytest.mark.asyncio
+async def test_recovered_replica_slow_starts():
+    replica = Replica("http://nlp-1:9004")
+    replica.mark_health(HealthState.DOWN)
+    replica.mark_health(HealthState.UP)
+    assert replica.effective_weight(slow_start=30) < replica.weight
+
+
+@pytest.mark.asyncio
+async def test_ready_endpoint_aggregates_upstream_state(gateway_client, replicas):
+    nlp, chat = replicas
+    assert (await gateway_client.get("/health/live")).json() == {"status": "alive"}
+
+    nlp[0].mark_health(HealthState.UP)
+    chat[0].mark_health(HealthState.DOWN)
+    response = await gateway_client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["services"]["nlp"]["up"] == 1
+
+    chat[0].mark_health(HealthState.UP)
+    assert (await gateway_client.get("/health/ready")).status_code == 200
@@ -0,0 +1,56 @@
+"""
+업스트림 커넥션 풀 테스트
+"""
+import httpx
+import pytest
+
+from app.domain.model.service_proxy_factory import get_proxy_factory
+from app.domain.model.service_type import ServiceType
+from app.foundation.infrastructure.http_client_pool import PoolSettings, UpstreamClientPool, upstream_pool
+
+
+@pytest.mark.asyncio
+async def test_one_client_per_service_is_reused():
+    pool = UpstreamClientPool()
+    await pool.startup()
+    try:
+        client = pool.get(ServiceType.NLP)
+        assert pool.get(ServiceType.NLP) is client
+        assert pool.get(ServiceType.CRIME) is not client
+    finally:
+        await pool.shutdown()
+    assert client.is_closed
+    assert not pool.started
+
+
+def test_pool_settings_from_env(monkeypatch):
+    monkeypatch.setenv("GATEWAY_POOL_MAX_CONNECTIONS", "50")
+    monkeypatch.setenv("CHAT_POOL_MAX_KEEPALIVE", "3")
+    settings = PoolSettings.from_env(ServiceType.CHAT)
+    assert settings.max_connections == 50
+    assert settings.max_keepalive_connections == 3
+    assert PoolSettings.from_env(ServiceType.NLP).max_keepalive_connections == 20
+
+
+@pytest.mark.asyncio
+async def test_factory_uses_pooled_client():
+    seen = []
+
+    def handler(request: httpx.Request):
+        seen.append((request.method, str(request.url), request.headers.get("x-test")))
+        return httpx.Response(200, json={"ok": True})
+
+    await upstream_pool.startup(transport=httpx.MockTransport(handler))
+    try:
+        factory = get_proxy_factory(ServiceType.TITANIC)
+        assert get_proxy_factory(ServiceType.TITANIC) is factory
+        for _ in range(2):
+            response = await factory.request(
+                method="GET",
+                path="titanic/passengers",
+                headers=[(b"host", b"gateway"), (b"x-test", b"1")],
+            )
+            assert response.json() == {"ok": True}
+    finally:
+        await upstream_pool.shutdown()
+    assert seen == [("GET", "http://titanic:9001/titanic/passengers", "1")] * 2
@@ -0,0 +1,145 @@
+"""
+Idempotency-Key POST 저장/재사용 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.domain.model.response_snapshot import ResponseSnapshot
+from app.foundation.infrastructure import idempotency_store as store_module
+from app.foundation.infrastructure.idempotency_store import IdempotencyStore
+from app.foundation.infrastructure.response_cache import MemoryCacheBackend, RedisCacheBackend
+from app.platform.adapters import multipart_spool
+from app.platform.adapters.multipart_spool import UploadMemoryBudget
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = IdempotencyStore(MemoryCacheBackend())
+    monkeypatch.setattr(store_module, "idempotency_store", store)
+    import app.main
+    monkeypatch.setattr(app.main, "idempotency_store", store)
+    return store
+
+
+def _post(client, key, message="안녕"):
+    return client.post("/ai/v1/chat/chat", data={"json_data": message}, headers={"Idempotency-Key": key})
+
+
+@pytest.mark.asyncio
+async def test_retry_with_same_key_gets_stored_response(upstream, gateway_client, store):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"response": f"응답 {len(calls)}"})
+
+    upstream.handler = handler
+    first = await _post(gateway_client, "order-1")
+    retry = await _post(gateway_client, "order-1")
+    other = await _post(gateway_client, "order-2")
+
+    assert len(calls) == 2
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    assert other.json() != first.json()
+    assert store.stats()["stored"] == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_wait_for_in_flight_result(upstream, gateway_client, store):
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200, json={"response": "한 번만"})
+
+    upstream.handler = slow
+    calls = [asyncio.create_task(_post(gateway_client, "same")) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    release.set()
+    responses = await asyncio.gather(*calls)
+
+    assert len(upstream.requests) == 1
+    assert [r.status_code for r in responses] == [200] * 3
+    assert sum(r.headers.get("idempotent-replayed") == "true" for r in responses) == 2
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_not_stored(upstream, gateway_client, store):
+    statuses = [503, 200]
+    upstream.handler = lambda request: httpx.Response(statuses.pop(0), json={"ok": not statuses})
+
+    failed = await _post(gateway_client, "flaky")
+    succeeded = await _post(gateway_client, "flaky")
+    assert failed.status_code == 503
+    assert succeeded.status_code == 200
+    assert len(upstream.requests) == 2
+
+    invalid = await _post(gateway_client, "x" * 300)
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_reusing_key_with_different_body_is_rejected(upstream, gateway_client, store):
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200, json={"response": "ok"})
+
+    upstream.handler = slow
+    first = asyncio.create_task(_post(gateway_client, "pay-1", "1000원 결제"))
+    await asyncio.sleep(0.02)
+    # 진행 중인 요청과 본문이 다르면 합류하지 않고 422
+    concurrent = await _post(gateway_client, "pay-1", "9000원 결제")
+    release.set()
+    assert (await first).status_code == 200
+
+    later = await _post(gateway_client, "pay-1", "9000원 결제")
+    same = await _post(gateway_client, "pay-1", "1000원 결제")
+    assert concurrent.status_code == 422 and later.status_code == 422
+    assert same.headers["idempotent-replayed"] == "true"
+    assert len(upstream.requests) == 1
+    assert store.stats()["mismatched"] == 2
+
+
+@pytest.mark.asyncio
+async def test_spooled_upload_is_closed_when_key_is_invalid(upstream, gateway_client, store, monkeypatch):
+    budget = UploadMemoryBudget()
+    monkeypatch.setattr(multipart_spool, "upload_budget", budget)
+    response = await gateway_client.post(
+        "/ai/v1/tf/mosaic", files={"file": ("a.png", b"x" * 1024, "image/png")}, headers={"Idempotency-Key": ""}
+    )
+    assert response.status_code == 400
+    assert budget.reserved == 0
+    assert upstream.requests == []
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_runs_duplicates_once_across_workers():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis()
+    workers = [IdempotencyStore(RedisCacheBackend(redis=redis, namespace="test:idem:"), poll_interval=0.01) for _ in range(2)]
+    release = asyncio.Event()
+    calls = 0
+
+    async def send():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return ResponseSnapshot.from_response(httpx.Response(201, content=b"created"))
+
+    first = asyncio.create_task(workers[0].execute("chat/chat|ip:1|k", send))
+    await asyncio.sleep(0.02)
+    second = asyncio.create_task(workers[1].execute("chat/chat|ip:1|k", send))
+    await asyncio.sleep(0.05)
+    release.set()
+
+    (a, replayed_a), (b, replayed_b) = await asyncio.gather(first, second)
+    assert calls == 1
+    assert (a.body, b.body) == (b"created", b"created")
+    assert (replayed_a, replayed_b) == (False, True)
+    assert not await redis.exists("test:idem:lock:chat/chat|ip:1|k")
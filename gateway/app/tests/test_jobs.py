@@ -0,0 +1,151 @@
+"""
+비동기 작업 API 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.domain.model.job_schema import Job, JobStatus
+from app.platform.messaging.job_manager import prefers_async, strip_prefer
+from app.platform.messaging.job_store import MemoryJobStore, RedisJobStore
+
+
+async def _wait_finished(client, job_id, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        status = (await client.get(f"/ai/v1/jobs/{job_id}")).json()
+        if status["status"] in ("succeeded", "failed", "cancelled"):
+            return status
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.02)
+
+
+def test_prefer_header_parsing():
+    assert prefers_async({"prefer": "respond-async, wait=10"})
+    assert not prefers_async({"prefer": "return=minimal"})
+    assert not prefers_async({})
+    assert strip_prefer({"Prefer": "respond-async", "x-a": "1"}) == {"x-a": "1"}
+    assert strip_prefer([(b"prefer", b"respond-async"), (b"x-a", b"1")]) == [(b"x-a", b"1")]
+
+
+@pytest.mark.asyncio
+async def test_prefer_respond_async_returns_202_and_result(upstream, gateway_client):
+    async def handler(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, text="<html>report</html>", headers={"content-type": "text/html"})
+
+    upstream.handler = handler
+    response = await gateway_client.get("/ai/v1/crime/map", headers={"Prefer": "respond-async"})
+
+    assert response.status_code == 202
+    assert response.headers["preference-applied"] == "respond-async"
+    job = response.json()
+    assert response.headers["location"] == f"/ai/v1/jobs/{job['job_id']}"
+    assert job["status"] in ("pending", "running")
+
+    pending = await gateway_client.get(f"/ai/v1/jobs/{job['job_id']}/result")
+    assert pending.status_code == 202
+
+    status = await _wait_finished(gateway_client, job["job_id"])
+    assert status["status"] == "succeeded"
+    assert status["status_code"] == 200
+
+    result = await gateway_client.get(status["result_url"])
+    assert result.status_code == 200
+    # 동기 요청과 같은 서비스 응답 모드(crime 은 envelope)로 재생
+    assert result.json()["raw_response"] == "<html>report</html>"
+    assert "prefer" not in upstream.requests[0].headers
+
+
+@pytest.mark.asyncio
+async def test_submit_job_route_and_failure(upstream, gateway_client):
+    def handler(request):
+        if request.url.host == "chat":
+            return httpx.Response(200, json={"echo": request.read().decode()})
+        return httpx.Response(500, json={"detail": "boom"})
+
+    upstream.handler = handler
+    response = await gateway_client.post("/ai/v1/jobs", json={
+        "service": "chat", "method": "POST", "path": "chat", "body": {"message": "안녕"}
+    })
+    assert response.status_code == 202
+    status = await _wait_finished(gateway_client, response.json()["job_id"])
+    assert status["status"] == "succeeded"
+    chat_request = upstream.requests[0]
+    assert chat_request.url.path == "/chat/chat"
+    assert chat_request.headers["content-type"] == "application/json"
+
+    failed = await gateway_client.post("/ai/v1/jobs", json={"service": "titanic", "path": "passengers"})
+    status = await _wait_finished(gateway_client, failed.json()["job_id"])
+    assert status["status"] == "failed"
+    assert status["status_code"] == 500
+
+    missing = await gateway_client.get("/ai/v1/jobs/unknown")
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_job_events_stream_until_finished(upstream, gateway_client):
+    async def handler(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json={"ok": True})
+
+    upstream.handler = handler
+    job_id = (await gateway_client.post("/ai/v1/jobs", json={"service": "nlp", "path": "report"})).json()["job_id"]
+
+    events = []
+    async with gateway_client.stream("GET", f"/ai/v1/jobs/{job_id}/events") as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        async for line in response.aiter_lines():
+            if line.startswith("data: "):
+                events.append(line)
+    assert '"status": "succeeded"' in events[-1]
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_job(upstream, gateway_client):
+    async def handler(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={"ok": True})
+
+    upstream.handler = handler
+    job_id = (await gateway_client.post("/ai/v1/jobs", json={"service": "tf", "path": "train"})).json()["job_id"]
+    await asyncio.sleep(0.05)
+
+    response = await gateway_client.delete(f"/ai/v1/jobs/{job_id}")
+    assert response.status_code == 204
+    status = (await gateway_client.get(f"/ai/v1/jobs/{job_id}")).json()
+    assert status["status"] == "cancelled"
+
+    again = await gateway_client.delete(f"/ai/v1/jobs/{job_id}")
+    assert again.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_memory_store_expires_and_wakes_waiters():
+    store = MemoryJobStore()
+    job = Job(service="nlp", method="GET", path="report")
+    await store.save(job, ttl=10)
+
+    waiter = asyncio.create_task(store.wait_change(job.id, job.version, timeout=1))
+    await asyncio.sleep(0)
+    job.version += 1
+    await store.save(job, ttl=0.05)
+    assert (await waiter).version == 1
+
+    await asyncio.sleep(0.06)
+    assert await store.get(job.id) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_store_round_trip():
+    fakeredis = pytest.importorskip("fakeredis")
+    store = RedisJobStore(fakeredis.FakeAsyncRedis(), poll_interval=0.01)
+    job = Job(service="titanic", method="GET", path="passengers", status=JobStatus.SUCCEEDED, result='{"a": 1}')
+    await store.save(job, ttl=10)
+
+    loaded = await store.get(job.id)
+    assert loaded == job
+    assert loaded.public()["result_url"].endswith("/result")
+    assert (await store.wait_change(job.id, job.version, timeout=0.05)).version == job.version
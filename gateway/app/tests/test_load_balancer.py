@@ -0,0 +1,69 @@
+"""
+레플리카 부하 분산 테스트
+"""
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from app.domain.model.service_proxy_factory import ServiceProxyFactory
+from app.domain.model.service_type import ServiceType, parse_replicas
+from app.foundation.core.load_balancer import POWER_OF_TWO, LoadBalancer, Replica, upstream_balancers
+
+
+def test_parse_replicas_with_weights():
+    assert parse_replicas("http://nlp-1:9004/;weight=2, http://nlp-2:9004") == [
+        ("http://nlp-1:9004", 2.0),
+        ("http://nlp-2:9004", 1.0),
+    ]
+    assert parse_replicas(None) == []
+
+
+def test_least_outstanding_respects_load_and_weight():
+    busy, idle = Replica("http://a"), Replica("http://b")
+    busy.outstanding = 3
+    balancer = LoadBalancer([busy, idle])
+    assert balancer.choose() is idle
+
+    heavy = Replica("http://c", weight=4)
+    heavy.outstanding = 2
+    idle.outstanding = 1
+    balancer = LoadBalancer([idle, heavy])
+    assert balancer.choose() is heavy
+    assert balancer.choose(exclude=["http://c"]) is idle
+
+
+def test_p2c_never_picks_the_more_loaded_of_two():
+    light, loaded = Replica("http://a"), Replica("http://b")
+    loaded.outstanding = 5
+    balancer = LoadBalancer([light, loaded], strategy=POWER_OF_TWO)
+    assert {balancer.choose().url for _ in range(20)} == {"http://a"}
+
+
+def test_new_replica_slow_starts():
+    balancer = LoadBalancer([Replica("http://a")], slow_start=60)
+    new = balancer.add_replica("http://b")
+    assert new.effective_weight(balancer.slow_start) < 0.2
+    picks = Counter()
+    for _ in range(10):
+        replica = balancer.choose()
+        replica.outstanding += 1
+        picks[replica.url] += 1
+    assert picks["http://a"] > picks["http://b"]
+
+
+@pytest.mark.asyncio
+async def test_factory_spreads_concurrent_requests_across_replicas(upstream, monkeypatch):
+    monkeypatch.setitem(
+        upstream_balancers, ServiceType.CHAT, LoadBalancer([Replica("http://chat-1:9006"), Replica("http://chat-2:9006")])
+    )
+
+    async def slow(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"response": "안녕하세요"})
+
+    upstream.handler = slow
+    factory = ServiceProxyFactory(ServiceType.CHAT)
+    await asyncio.gather(*[factory.request("POST", "chat/chat", data={"message": "hi"}) for _ in range(4)])
+    assert Counter(request.url.host for request in upstream.requests) == {"chat-1": 2, "chat-2": 2}
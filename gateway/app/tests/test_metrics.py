@@ -0,0 +1,63 @@
+"""
+Prometheus 메트릭 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.foundation.infrastructure.http_client_pool import UpstreamClientPool
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_split_upstream_and_overhead(upstream, gateway_client):
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"report": "ok"})
+
+    upstream.handler = handler
+    labels = {"service": "nlp", "route": "nlp/*"}
+    before = _sample("gateway_requests_total", method="GET", status="200", **labels)
+    upstream_before = _sample("gateway_upstream_duration_seconds_sum", **labels)
+
+    response = await gateway_client.get("/ai/v1/nlp/report")
+    assert response.status_code == 200
+
+    assert _sample("gateway_requests_total", method="GET", status="200", **labels) == before + 1
+    assert _sample("gateway_upstream_duration_seconds_sum", **labels) - upstream_before >= 0.05
+    assert _sample("gateway_overhead_duration_seconds_count", **labels) >= 1
+    assert _sample("gateway_response_size_bytes_sum", **labels) >= len(response.content)
+    assert _sample("gateway_in_flight_requests", service="nlp") == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_route_templates_and_state(upstream, gateway_client):
+    await gateway_client.get("/ai/v1/crime/map/circle-marker")
+    await gateway_client.get("/ai/v1/nlp/nlp/generate-wordcloud")
+    body = (await gateway_client.get("/metrics")).text
+
+    assert 'route="crime/map"' in body
+    assert 'route="nlp/generate-wordcloud"' in body
+    assert "circle-marker" not in body
+    assert 'gateway_bulkhead_requests{service="crime",state="active"}' in body
+    assert 'gateway_circuit_breaker_state{service="crime",state="closed"} 1.0' in body
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_read_connection_pool_state():
+    pool = UpstreamClientPool()
+    await pool.startup()
+    try:
+        assert pool.stats()["crime"] == {
+            "active_connections": 0,
+            "idle_connections": 0,
+            "active_requests": 0,
+            "queued_requests": 0,
+        }
+    finally:
+        await pool.shutdown()
@@ -0,0 +1,136 @@
+"""
+멀티파트 업로드 스풀링, 크기 제한, 메모리 예산 테스트
+"""
+import httpx
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.domain.model.service_type import SERVICE_RESPONSE_MODES, SERVICE_UPLOAD_LIMITS, ResponseMode, ServiceType
+from app.platform.adapters import multipart_spool
+from app.platform.adapters.multipart_spool import SpooledUpload, UploadMemoryBudget, read_form
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    budget = UploadMemoryBudget(limit=4 * 1024 * 1024)
+    monkeypatch.setattr(multipart_spool, "upload_budget", budget)
+    return budget
+
+
+def _chunked_request(body: bytes, content_type: str, chunk_size: int = 1024) -> Request:
+    """Content-Length 없이 본문을 조각으로 보내는 요청"""
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+    async def receive():
+        chunk = chunks.pop(0) if chunks else b""
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": [(b"content-type", content_type.encode())]}
+    return Request(scope, receive)
+
+
+def _multipart(payload: bytes) -> httpx.Request:
+    return httpx.Request("POST", "http://x", files={"file": ("big.bin", payload, "application/octet-stream")},
+                         data={"json_data": "{\"filename\": \"big.bin\"}"})
+
+
+@pytest.mark.asyncio
+async def test_large_upload_is_spooled_and_forwarded_intact(upstream, gateway_client, budget):
+    payload = bytes(range(256)) * 12 * 1024   # 3MB - 기본 임계값(1MB)을 넘음
+    response = await gateway_client.post(
+        "/ai/v1/tf/mosaic",
+        files={"file": ("big.bin", payload, "application/octet-stream")},
+        data={"json_data": "{\"filename\": \"big.bin\"}"},
+    )
+
+    assert response.status_code == 200
+    forwarded = upstream.requests[-1]
+    assert payload in forwarded.content
+    assert b'name="filename"' in forwarded.content
+    assert budget.spooled_to_disk == 1
+    assert budget.reserved == 0
+
+
+@pytest.mark.asyncio
+async def test_upload_over_service_limit_is_rejected_before_upstream(upstream, gateway_client, budget, monkeypatch):
+    monkeypatch.setitem(SERVICE_UPLOAD_LIMITS, ServiceType.TF, 1024)
+    response = await gateway_client.post("/ai/v1/tf/mosaic", files={"file": ("big.bin", b"x" * 4096, "image/png")})
+
+    assert response.status_code == 413
+    assert upstream.requests == []
+    assert budget.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_limit_is_enforced_while_streaming_without_content_length(budget):
+    request = _multipart(b"x" * 64 * 1024)
+    chunked = _chunked_request(request.read(), request.headers["content-type"])
+
+    with pytest.raises(HTTPException) as error:
+        await read_form(chunked, limit=16 * 1024, threshold=1024)
+    assert error.value.status_code == 413
+    assert budget.reserved == 0
+
+    request = _multipart(b"y" * 8 * 1024)
+    form = await read_form(_chunked_request(request.read(), request.headers["content-type"]), limit=16 * 1024, threshold=1024)
+    upload = form.files["file"]
+    assert form.fields["json_data"] == "{\"filename\": \"big.bin\"}"
+    assert (upload.filename, upload.size, upload.in_memory) == ("big.bin", 8 * 1024, False)
+    upload.file.seek(0)
+    assert upload.file.read() == b"y" * 8 * 1024
+    form.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_sends_concurrent_uploads_to_disk():
+    budget = UploadMemoryBudget(limit=1024)
+    first = SpooledUpload("a", None, budget, threshold=1024)
+    second = SpooledUpload("b", None, budget, threshold=1024)
+
+    await first.write(b"a" * 100)
+    await second.write(b"b" * 100)
+    assert first.in_memory and not second.in_memory
+    assert budget.stats()["reserved_bytes"] == 1024
+
+    first.close()
+    second.close()
+    assert budget.stats() == {"limit_bytes": 1024, "reserved_bytes": 0, "spooled_to_disk": 1, "rejected": 0}
+
+
+@pytest.mark.asyncio
+async def test_small_upload_stays_in_memory_through_upstream_request(upstream, gateway_client, budget):
+    payload = b"p" * 100 * 1024
+    reserved_during_send = []
+
+    def handler(request):
+        reserved_during_send.append(budget.reserved)
+        return httpx.Response(200, json={"ok": True})
+
+    upstream.handler = handler
+    response = await gateway_client.post("/ai/v1/tf/mosaic", files={"file": ("small.png", payload, "image/png")})
+
+    assert response.status_code == 200
+    assert payload in upstream.requests[-1].content
+    # 업스트림 전송 중에도 메모리 예약이 유지됨 (디스크로 옮겨졌다면 예약이 반환됨)
+    assert reserved_during_send == [multipart_spool.SPOOL_THRESHOLD]
+    assert budget.spooled_to_disk == 0
+    assert budget.reserved == 0
+
+
+@pytest.mark.asyncio
+async def test_chunked_raw_body_is_capped(upstream, gateway_client, budget, monkeypatch):
+    monkeypatch.setitem(SERVICE_UPLOAD_LIMITS, ServiceType.CRIME, 1024)
+
+    async def chunks():
+        for _ in range(8):
+            yield b"{" * 256
+
+    monkeypatch.setitem(SERVICE_RESPONSE_MODES, ServiceType.CRIME, ResponseMode.PASSTHROUGH)
+    for method, prefer in (("PUT", {"prefer": "respond-async"}), ("PUT", {}), ("POST", {})):
+        response = await gateway_client.request(method, "/ai/v1/crime/update", content=chunks(),
+                                                headers={"content-type": "application/json", **prefer})
+        assert response.status_code == 413
+    # 스트리밍 전달(POST)은 업스트림으로 보내는 도중에 끊김
+    assert all(request.method == "POST" for request in upstream.requests)
+    assert budget.rejected == 3
@@ -0,0 +1,110 @@
+"""
+우선순위 클래스 분류와 벌크헤드 가중 공정 스케줄링 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.domain.model.route_policy import RoutePolicy, match_route_policy
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.bulkhead import Bulkhead, BulkheadRejected, service_bulkheads
+from app.foundation.core.priority import PrioritySettings, classify
+
+
+def test_classify_by_client_route_and_header():
+    settings = PrioritySettings(clients={"key:abc": "batch"})
+    route = RoutePolicy(route="titanic/*")
+
+    assert classify(ServiceType.CHAT, route, {}, settings=settings) == "interactive"
+    assert classify(ServiceType.CRIME, match_route_policy(ServiceType.CRIME, "map"), {}, settings=settings) == "batch"
+    assert classify(ServiceType.CHAT, route, {}, client_id="key:abc", settings=settings) == "batch"
+    # 헤더로는 낮추기만 가능
+    assert classify(ServiceType.TITANIC, route, {"X-Priority": "batch"}, settings=settings) == "batch"
+    assert classify(ServiceType.CRIME, RoutePolicy(route="crime/map", priority="batch"), {"X-Priority": "interactive"}, settings=settings) == "batch"
+    assert classify(ServiceType.CHAT, route, {}, ceiling="batch", settings=settings) == "batch"
+
+
+async def _fill_queue(bulkhead, arrivals):
+    """슬롯 하나를 점유한 뒤 arrivals 순서대로 대기시키고, 슬롯을 넘겨받은 순서를 반환"""
+    await bulkhead.acquire()
+    order = []
+
+    async def worker(priority, name):
+        async with bulkhead.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    tasks = []
+    for priority, name in arrivals:
+        tasks.append(asyncio.create_task(worker(priority, name)))
+        await asyncio.sleep(0)
+    bulkhead.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_slots_are_dispatched_by_class_weight():
+    bulkhead = Bulkhead("crime", 1, 100, 5, weights={"interactive": 3, "default": 1, "batch": 1}, max_wait=60)
+    arrivals = [("batch", f"b{i}") for i in range(6)] + [("interactive", f"i{i}") for i in range(6)]
+    order = await _fill_queue(bulkhead, arrivals)
+
+    # 먼저 도착한 batch 요청이 많아도 interactive 가 가중치 비율(3:1)대로 슬롯을 받고, 클래스 안에서는 FIFO
+    assert order == ["i0", "b0", "i1", "i2", "i3", "b1", "i4", "i5", "b2", "b3", "b4", "b5"]
+    stats = bulkhead.stats()["classes"]
+    assert stats["interactive"]["admitted"] == 6
+    assert stats["batch"]["admitted"] == 6
+
+
+@pytest.mark.asyncio
+async def test_long_waiting_low_class_is_not_starved():
+    bulkhead = Bulkhead("crime", 1, 100, 5, weights={"interactive": 1000, "default": 1, "batch": 1}, max_wait=0)
+    order = await _fill_queue(bulkhead, [("batch", "b0"), ("interactive", "i0"), ("interactive", "i1")])
+    # max_wait 를 넘긴 대기자는 도착 순서대로 실행
+    assert order == ["b0", "i0", "i1"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_lower_class_waiter():
+    bulkhead = Bulkhead("nlp", 1, 1, 5)
+    await bulkhead.acquire()
+    batch = asyncio.create_task(bulkhead.acquire("batch"))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(bulkhead.acquire("interactive"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(BulkheadRejected):
+        await batch
+    with pytest.raises(BulkheadRejected):
+        await bulkhead.acquire("batch")
+    bulkhead.release()
+    await interactive
+    assert bulkhead.stats()["classes"]["batch"]["rejected"]["queue_full"] == 2
+    assert bulkhead.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_priority_is_forwarded_and_exposed_as_metrics(upstream, gateway_client, monkeypatch):
+    monkeypatch.setitem(service_bulkheads, ServiceType.CRIME, Bulkhead("crime", 4, 4, 1))
+    upstream.handler = lambda request: httpx.Response(200, json={"ok": True})
+
+    await gateway_client.get("/ai/v1/crime/map")
+    assert upstream.requests[-1].headers["x-priority"] == "batch"
+    await gateway_client.post("/ai/v1/chat/chat", data={"json_data": "안녕"})
+    assert upstream.requests[-1].headers["x-priority"] == "interactive"
+
+    body = (await gateway_client.get("/metrics")).text
+    assert 'gateway_bulkhead_class_admitted_total{priority="batch",service="crime"} 1.0' in body
+
+
+@pytest.mark.asyncio
+async def test_unknown_priority_falls_back_to_default_class():
+    bulkhead = Bulkhead("crime", 1, 4, 5)
+    async with bulkhead.slot("urgent"):
+        waiter = asyncio.create_task(bulkhead.acquire("urgent"))
+        await asyncio.sleep(0)
+        assert bulkhead.stats()["classes"]["default"]["queued"] == 1
+    await waiter
+    bulkhead.release()
+    assert bulkhead.stats()["classes"]["default"]["admitted"] == 2
@@ -0,0 +1,76 @@
+"""
+토큰 버킷 요청 제한 테스트
+"""
+import pytest
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.rate_limiter import (
+    MemoryTokenBucketBackend,
+    RateLimit,
+    RateLimiter,
+    RedisTokenBucketBackend,
+    rate_limiter,
+)
+
+
+def test_rate_limit_parse():
+    assert RateLimit.parse("5/10") == RateLimit(rate=5.0, burst=10)
+    assert RateLimit.parse("0.5") == RateLimit(rate=0.5, burst=1)
+    assert RateLimit.parse("") is None
+
+
+@pytest.mark.asyncio
+async def test_memory_bucket_allows_burst_then_refills(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.foundation.core.rate_limiter.time.monotonic", lambda: now[0])
+    backend = MemoryTokenBucketBackend()
+    limit = RateLimit(rate=2, burst=3)
+
+    results = [(await backend.consume("nlp:ip:1", limit))[0] for _ in range(4)]
+    assert results == [True, True, True, False]
+    allowed, retry_after, _ = await backend.consume("nlp:ip:1", limit)
+    assert not allowed and retry_after == pytest.approx(0.5)
+
+    now[0] += 0.5
+    assert (await backend.consume("nlp:ip:1", limit))[0]
+    # 다른 클라이언트는 별도 버킷
+    assert (await backend.consume("nlp:ip:2", limit))[0]
+
+
+@pytest.mark.asyncio
+async def test_redis_bucket_is_shared_between_limiters():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    redis = fakeredis.FakeAsyncRedis()
+    limit = RateLimit(rate=0.01, burst=2)
+    first = RateLimiter(RedisTokenBucketBackend(redis=redis), limit, {})
+    second = RateLimiter(RedisTokenBucketBackend(redis=redis), limit, {})
+
+    assert (await first.check("ip:1", ServiceType.CHAT))[0]
+    assert (await second.check("ip:1", ServiceType.CHAT))[0]
+    allowed, retry_after, _, _ = await first.check("ip:1", ServiceType.CHAT)
+    assert not allowed and retry_after > 0
+    assert (await second.check("ip:1", ServiceType.NLP))[0]
+
+
+@pytest.mark.asyncio
+async def test_rejected_requests_never_reach_upstream(upstream, gateway_client, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "backend", MemoryTokenBucketBackend())
+    monkeypatch.setattr(rate_limiter, "service_limits", {ServiceType.CHAT: RateLimit(rate=0.01, burst=2)})
+
+    statuses = [
+        (await gateway_client.post("/ai/v1/chat/chat", data={"filename": "안녕"}, headers={"x-api-key": "a"})).status_code
+        for _ in range(3)
+    ]
+    assert statuses == [200, 200, 429]
+    assert len(upstream.requests) == 2
+
+    rejected = await gateway_client.post("/ai/v1/chat/chat", data={"filename": "안녕"}, headers={"x-api-key": "a"})
+    assert rejected.status_code == 429
+    assert int(rejected.headers["retry-after"]) >= 1
+    assert "error" in rejected.json()
+
+    # 다른 API 키와 제한이 없는 서비스는 영향 없음
+    assert (await gateway_client.post("/ai/v1/chat/chat", data={"filename": "안녕"}, headers={"x-api-key": "b"})).status_code == 200
+    assert (await gateway_client.get("/ai/v1/nlp/report")).status_code == 200
+    assert len(upstream.requests) == 4
@@ -0,0 +1,149 @@
+"""
+GET 응답 캐시 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.domain.model.response_snapshot import ResponseSnapshot
+from app.domain.model import route_policy
+from app.domain.model.route_policy import RoutePolicy, match_route_policy, route_matcher
+from app.domain.model.service_type import ServiceType
+from app.foundation.infrastructure.response_cache import MemoryCacheBackend, RedisCacheBackend, response_cache
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def empty_cache():
+    await response_cache.purge()
+    yield
+    await response_cache.purge()
+
+
+def test_route_policy_longest_prefix_match():
+    assert match_route_policy(ServiceType.CRIME, "map/circle-marker").route == "crime/map"
+    assert match_route_policy(ServiceType.NLP, "generate-wordcloud").cache_ttl == 600
+    assert match_route_policy(ServiceType.TITANIC, "passengers").cache_ttl == 0
+    assert match_route_policy(ServiceType.TITANIC, "health") == RoutePolicy(route="titanic/*")
+    # 실제 백엔드 경로는 서비스 이름으로 시작 (/ai/v1/crime/crime/map)
+    assert match_route_policy(ServiceType.CRIME, "crime/map").route == "crime/map"
+    assert match_route_policy(ServiceType.NLP, "/nlp/generate-wordcloud").cache_ttl == 600
+
+
+@pytest.mark.asyncio
+async def test_real_backend_paths_are_cached_and_coalesced(upstream, gateway_client):
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200, json={"message": "워드클라우드"})
+
+    upstream.handler = slow
+    calls = [asyncio.create_task(gateway_client.get("/ai/v1/nlp/nlp/generate-wordcloud")) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    release.set()
+    assert [r.status_code for r in await asyncio.gather(*calls)] == [200] * 3
+
+    cached = await gateway_client.get("/ai/v1/nlp/nlp/generate-wordcloud")
+    assert cached.headers["x-cache"] == "HIT"
+    assert len(upstream.requests) == 1
+    assert upstream.requests[0].url.path == "/nlp/generate-wordcloud"
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_vary_and_conditional_request(upstream, gateway_client):
+    upstream.handler = lambda request: httpx.Response(200, json={"message": "지도 완성"})
+
+    first = await gateway_client.get("/ai/v1/crime/map")
+    second = await gateway_client.get("/ai/v1/crime/map")
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == {"message": "지도 완성"}
+    assert len(upstream.requests) == 1
+
+    other = await gateway_client.get("/ai/v1/crime/map", headers={"accept": "text/html"})
+    assert other.headers["x-cache"] == "MISS"
+    assert len(upstream.requests) == 2
+
+    not_modified = await gateway_client.get("/ai/v1/crime/map", headers={"if-none-match": first.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_with_upstream_etag(upstream, gateway_client, monkeypatch):
+    monkeypatch.setattr(route_policy, "_matcher", route_matcher().with_policies(RoutePolicy(route="crime/map", cache_ttl=0.05)))
+
+    def handler(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, json={"version": 1}, headers={"etag": '"v1"'})
+
+    upstream.handler = handler
+    assert (await gateway_client.get("/ai/v1/crime/map")).headers["x-cache"] == "MISS"
+    await asyncio.sleep(0.1)
+    revalidated = await gateway_client.get("/ai/v1/crime/map")
+    assert revalidated.headers["x-cache"] == "REVALIDATED"
+    assert revalidated.json() == {"version": 1}
+    assert upstream.requests[-1].headers["if-none-match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached_and_admin_purge(upstream, gateway_client):
+    upstream.handler = lambda request: httpx.Response(500, text="fail")
+    await gateway_client.get("/ai/v1/nlp/generate-wordcloud")
+    upstream.handler = lambda request: httpx.Response(200, json={"ok": True})
+    assert (await gateway_client.get("/ai/v1/nlp/generate-wordcloud")).headers["x-cache"] == "MISS"
+
+    purged = await gateway_client.delete("/admin/cache", params={"service": "nlp"})
+    assert purged.json()["purged"] == 1
+    assert (await gateway_client.get("/ai/v1/nlp/generate-wordcloud")).headers["x-cache"] == "MISS"
+
+
+@pytest.mark.asyncio
+async def test_admin_purge_by_service_and_path_matches_real_backend_path(upstream, gateway_client):
+    upstream.handler = lambda request: httpx.Response(200, json={"ok": True})
+    await gateway_client.get("/ai/v1/crime/crime/map")
+    await gateway_client.get("/ai/v1/crime/crime/preprocess")
+    assert (await gateway_client.get("/ai/v1/crime/map")).headers["x-cache"] == "HIT"
+
+    purged = await gateway_client.delete("/admin/cache", params={"service": "crime", "path": "map"})
+    assert purged.json()["prefix"] == "crime/map"
+    assert purged.json()["purged"] == 1
+    assert (await gateway_client.get("/ai/v1/crime/crime/map")).headers["x-cache"] == "MISS"
+    assert (await gateway_client.get("/ai/v1/crime/crime/preprocess")).headers["x-cache"] == "HIT"
+
+    purged = await gateway_client.delete("/admin/cache", params={"service": "crime"})
+    assert (purged.json()["prefix"], purged.json()["purged"]) == ("crime/", 2)
+    assert (await gateway_client.delete("/admin/cache", params={"service": "unknown"})).status_code == 400
+
+
+def _snapshot(body: bytes) -> ResponseSnapshot:
+    return ResponseSnapshot.from_response(httpx.Response(200, content=body), ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2, max_bytes=1024)
+    await backend.set("a", _snapshot(b"a"), 60)
+    await backend.set("b", _snapshot(b"b"), 60)
+    await backend.get("a")
+    await backend.set("c", _snapshot(b"c"), 60)
+    assert await backend.get("b") is None
+    assert (await backend.get("a")).body == b"a"
+
+    await backend.set("big", _snapshot(b"x" * 1024), 60)
+    assert await backend.get("a") is None
+    assert await backend.get("big") is not None
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_with_local_fake():
+    fakeredis = pytest.importorskip("fakeredis")
+    backend = RedisCacheBackend(redis=fakeredis.FakeAsyncRedis())
+    snapshot = _snapshot(b'{"districts": []}')
+    await backend.set("crime/map?|accept=", snapshot, 60)
+    assert await backend.get("crime/map?|accept=") == snapshot
+    assert await backend.purge("crime/") == 1
+    assert await backend.get("crime/map?|accept=") is None
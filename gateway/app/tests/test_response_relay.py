@@ -0,0 +1,98 @@
+"""
+응답 중계 방식 테스트
+"""
+import gzip
+
+import httpx
+import pytest
+
+from app.domain.model.service_type import ResponseMode, ServiceType, SERVICE_ERROR_MAPPINGS, SERVICE_RESPONSE_MODES
+
+
+@pytest.fixture
+def stream_mode(monkeypatch):
+    monkeypatch.setitem(SERVICE_RESPONSE_MODES, ServiceType.CRIME, ResponseMode.STREAM)
+    monkeypatch.setitem(SERVICE_RESPONSE_MODES, ServiceType.TF, ResponseMode.STREAM)
+
+
+@pytest.mark.asyncio
+async def test_envelope_mode_rewraps_errors(upstream, gateway_client):
+    upstream.handler = lambda request: httpx.Response(500, text="boom")
+    response = await gateway_client.get("/ai/v1/titanic/passengers")
+    assert response.status_code == 500
+    assert response.json() == {"error": "서비스 오류: HTTP 500", "details": "boom"}
+
+
+@pytest.mark.asyncio
+async def test_stream_mode_relays_body_status_and_content_type(upstream, gateway_client, stream_mode):
+    html = "<html>" + "x" * 200_000 + "</html>"
+    upstream.handler = lambda request: httpx.Response(
+        201, content=html.encode(), headers={"content-type": "text/html; charset=utf-8"}
+    )
+    response = await gateway_client.get("/ai/v1/crime/map")
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.text == html
+
+
+@pytest.mark.asyncio
+async def test_stream_mode_pipes_upload_and_json_bodies(upstream, gateway_client, stream_mode):
+    payload = b"\x89PNG" + b"0" * 100_000
+    response = await gateway_client.post(
+        "/ai/v1/tf/upload", files={"file": ("face.png", payload, "image/png")}
+    )
+    assert response.status_code == 200
+    forwarded = upstream.requests[-1]
+    assert forwarded.headers["content-type"].startswith("multipart/form-data")
+    assert payload in forwarded.content
+
+    body = '{"districts": ["강남구"]}'.encode()
+    response = await gateway_client.post(
+        "/ai/v1/crime/correlation", content=body, headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 200
+    forwarded = upstream.requests[-1]
+    assert forwarded.headers["content-type"] == "application/json"
+    assert forwarded.content == body
+
+
+@pytest.fixture
+def passthrough_mode(monkeypatch):
+    monkeypatch.setitem(SERVICE_RESPONSE_MODES, ServiceType.NLP, ResponseMode.PASSTHROUGH)
+    monkeypatch.setitem(SERVICE_ERROR_MAPPINGS, ServiceType.NLP, {500: 502})
+
+
+@pytest.mark.asyncio
+async def test_passthrough_forwards_raw_bytes_and_headers(upstream, gateway_client, passthrough_mode):
+    body = gzip.compress(b'{"districts": []}')
+    upstream.handler = lambda request: httpx.Response(
+        200,
+        stream=httpx.ByteStream(body),
+        headers=[
+            ("content-type", "application/json"),
+            ("content-encoding", "gzip"),
+            ("content-length", str(len(body))),
+            ("set-cookie", "a=1"),
+            ("set-cookie", "b=2"),
+            ("connection", "keep-alive"),
+        ],
+    )
+    response = await gateway_client.get("/ai/v1/nlp/report")
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers.get_list("set-cookie") == ["a=1", "b=2"]
+    assert "connection" not in response.headers
+    assert response.json() == {"districts": []}
+
+
+@pytest.mark.asyncio
+async def test_passthrough_rewrites_only_mapped_errors(upstream, gateway_client, passthrough_mode):
+    upstream.handler = lambda request: httpx.Response(500, text="traceback...")
+    response = await gateway_client.get("/ai/v1/nlp/report")
+    assert response.status_code == 502
+    assert response.json()["details"] == "traceback..."
+
+    upstream.handler = lambda request: httpx.Response(404, content=b"\x89PNG", headers={"content-type": "image/png"})
+    response = await gateway_client.get("/ai/v1/nlp/output/wordcloud.png")
+    assert response.status_code == 404
+    assert response.content == b"\x89PNG"
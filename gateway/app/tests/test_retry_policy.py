@@ -0,0 +1,91 @@
+"""
+재시도 예산 및 헤지 요청 테스트
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.load_balancer import LoadBalancer, Replica, upstream_balancers
+from app.foundation.core.retry_policy import RetryBudget, RetryPolicy, RetrySettings, service_retry_policies
+
+
+def _policy(monkeypatch, service_type, **settings):
+    policy = RetryPolicy(RetrySettings(base_delay=0.001, **settings))
+    monkeypatch.setitem(service_retry_policies, service_type, policy)
+    return policy
+
+
+def test_retry_budget_caps_retries_to_ratio_of_traffic():
+    budget = RetryBudget(ratio=0.5, min_per_second=0, window=10)
+    for _ in range(4):
+        budget.record_request()
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+    assert budget.rejected == 1
+
+
+def test_backoff_uses_full_jitter_with_cap():
+    policy = RetryPolicy(RetrySettings(base_delay=0.1, max_delay=0.3))
+    delays = [policy.backoff(5) for _ in range(50)]
+    assert all(0 <= delay <= 0.3 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_idempotent_get_is_retried_on_transient_errors(upstream, gateway_client, monkeypatch):
+    policy = _policy(monkeypatch, ServiceType.TITANIC)
+    outcomes = ["error", 503, 200]
+
+    def handler(request):
+        outcome = outcomes.pop(0)
+        if outcome == "error":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(outcome, json={"attempt": 3 - len(outcomes)})
+
+    upstream.handler = handler
+    response = await gateway_client.get("/ai/v1/titanic/passengers")
+    assert response.status_code == 200
+    assert len(upstream.requests) == 3
+    assert policy.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_post_and_exhausted_budget_are_not_retried(upstream, gateway_client, monkeypatch):
+    _policy(monkeypatch, ServiceType.CHAT)
+    _policy(monkeypatch, ServiceType.TITANIC, budget_ratio=0.0, budget_min_per_second=0.0)
+
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    upstream.handler = handler
+    post = await gateway_client.post("/ai/v1/chat/chat", data={"filename": "안녕"})
+    get = await gateway_client.get("/ai/v1/titanic/passengers")
+    assert post.status_code == 503
+    assert get.status_code == 503
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_to_another_replica(upstream, gateway_client, monkeypatch):
+    policy = _policy(monkeypatch, ServiceType.NLP, hedge=True, hedge_min_samples=1)
+    policy.latency.record(0.02)
+    monkeypatch.setitem(upstream_balancers, ServiceType.NLP, LoadBalancer([
+        Replica("http://nlp-1:9004"), Replica("http://nlp-2:9004"),
+    ]))
+
+    async def handler(request):
+        if len(upstream.requests) == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={"host": request.url.host})
+
+    upstream.handler = handler
+    started = time.monotonic()
+    response = await gateway_client.get("/ai/v1/nlp/report")
+    assert time.monotonic() - started < 0.5
+    assert response.status_code == 200
+    assert {r.url.host for r in upstream.requests} == {"nlp-1", "nlp-2"}
+    assert response.json()["host"] == upstream.requests[1].url.host
+    assert (policy.hedges, policy.hedge_wins) == (1, 1)
+    assert all(replica.outstanding == 0 for replica in upstream_balancers[ServiceType.NLP].replicas)
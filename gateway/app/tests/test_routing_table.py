@@ -0,0 +1,140 @@
+"""
+라우팅 테이블 교체(핫 리로드)와 레플리카 드레이닝 테스트
+"""
+import asyncio
+import json
+from collections import Counter
+
+import httpx
+import pytest
+
+from app.domain.model.route_policy import RouteMatcher, RoutePolicy
+from app.domain.model.routing_table import RoutingTable, current_routing_table, install_routing_table
+from app.domain.model.service_type import ServiceType
+from app.foundation.core.load_balancer import LoadBalancer, Replica, upstream_balancers
+from app.foundation.infrastructure.routing_manager import RoutingManager
+
+
+@pytest.fixture
+def restore_routing(monkeypatch):
+    monkeypatch.setitem(upstream_balancers, ServiceType.CHAT, LoadBalancer([Replica("http://chat-1:9006")], slow_start=0))
+    previous = current_routing_table()
+    yield
+    install_routing_table(previous)
+
+
+def test_route_matcher_uses_longest_segment_prefix():
+    matcher = RouteMatcher({
+        "crime": RoutePolicy(route="crime", cache_ttl=1),
+        "crime/map": RoutePolicy(route="crime/map", cache_ttl=2),
+    })
+    assert matcher.match(ServiceType.CRIME, "map/circle-marker").cache_ttl == 2
+    assert matcher.match(ServiceType.CRIME, "mapper").cache_ttl == 1
+    assert matcher.match(ServiceType.NLP, "anything") == RoutePolicy(route="nlp/*")
+
+
+def test_invalid_config_is_rejected():
+    for config in (
+        {"services": {"unknown": "http://x"}},
+        {"services": {"chat": "ftp://chat"}},
+        {"routes": {"crime/map": {"ttl": 1}}},
+        {"replicas": {}},
+        {"services": {"chat": "http://chat:9006;weight=0"}},
+        {"routes": {"crime/map": {"priority": "urgent"}}},
+        {"routes": {"crime/map": {"cache_ttl": "60"}}},
+        {"routes": {"crime/map": {"cache_ttl": -1}}},
+        {"routes": {"crime/map": {"timeout": 0}}},
+        {"routes": {"crime/map": {"coalesce": "yes"}}},
+    ):
+        with pytest.raises(ValueError):
+            RoutingTable.from_config(config, source="test")
+
+
+def test_update_replicas_keeps_state_and_drains_removed():
+    kept, gone = Replica("http://a"), Replica("http://b")
+    kept.outstanding, gone.outstanding = 1, 2
+    balancer = LoadBalancer([kept, gone])
+
+    added, removed = balancer.update_replicas([("http://a", 3.0), ("http://c", 1.0)])
+    assert [r.url for r in added] == ["http://c"] and removed == ["http://b"]
+    assert balancer.replicas[0] is kept and kept.weight == 3.0
+    assert gone.draining and not gone.routable and balancer.draining == [gone]
+
+    gone.outstanding = 0
+    assert balancer.reap() == 0
+    assert [r["url"] for r in balancer.stats()] == ["http://a", "http://c"]
+
+
+@pytest.mark.asyncio
+async def test_admin_swap_adds_replica_and_drains_in_flight(upstream, gateway_client, restore_routing):
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.path == "/chat/slow":
+            await release.wait()
+        return httpx.Response(200, json={"host": request.url.host})
+
+    upstream.handler = handler
+    in_flight = asyncio.create_task(gateway_client.post("/ai/v1/chat/slow", data={"json_data": "안녕"}))
+    await asyncio.sleep(0.02)
+
+    swapped = await gateway_client.put("/admin/routing", json={
+        "services": {"chat": ["http://chat-2:9006"]},
+        "routes": {"chat/slow": {"timeout": 7}},
+    })
+    assert swapped.status_code == 200
+    assert swapped.json()["added"] == {"chat": ["http://chat-2:9006"]}
+    assert swapped.json()["removed"] == {"chat": ["http://chat-1:9006"]}
+
+    routing = (await gateway_client.get("/admin/routing")).json()
+    assert routing["routes"]["chat/slow"]["timeout"] == 7
+    upstreams = (await gateway_client.get("/admin/upstreams")).json()
+    assert {r["url"]: r["draining"] for r in upstreams["chat"]["replicas"]} == {
+        "http://chat-2:9006": False, "http://chat-1:9006": True,
+    }
+
+    await gateway_client.post("/ai/v1/chat/chat", data={"json_data": "안녕"})
+    release.set()
+    assert (await in_flight).status_code == 200
+    assert Counter(r.url.host for r in upstream.requests if r.url.path == "/chat/chat") == {"chat-2": 1}
+    assert upstream_balancers[ServiceType.CHAT].reap() == 0
+
+    version = current_routing_table().version
+    for config in ({"services": {"chat": 1}}, {"routes": {"chat/chat": {"priority": "urgent"}}}):
+        invalid = await gateway_client.put("/admin/routing", json=config)
+        assert invalid.status_code == 400
+    assert current_routing_table().version == version
+
+
+@pytest.mark.asyncio
+async def test_admin_changes_require_token_or_explicit_opt_in(gateway_client, restore_routing, monkeypatch):
+    from app.api import admin_router
+
+    monkeypatch.setattr(admin_router, "ADMIN_INSECURE", False)
+    assert (await gateway_client.put("/admin/routing", json={})).status_code == 403
+    assert (await gateway_client.delete("/admin/cache")).status_code == 403
+    assert (await gateway_client.get("/admin/routing")).status_code == 200
+
+    monkeypatch.setattr(admin_router, "ADMIN_TOKEN", "secret")
+    assert (await gateway_client.get("/admin/routing")).status_code == 403
+    assert (await gateway_client.get("/admin/routing", headers={"X-Admin-Token": "secreT"})).status_code == 403
+    allowed = await gateway_client.put("/admin/routing", json={}, headers={"X-Admin-Token": "secret"})
+    assert allowed.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_routing_file_reload(tmp_path, restore_routing):
+    path = tmp_path / "routing.json"
+    path.write_text(json.dumps({"services": {"chat": "http://chat-1:9006,http://chat-3:9006;weight=2"}}))
+    manager = RoutingManager(path=str(path))
+
+    summary = await manager.reload()
+    assert summary["added"] == {"chat": ["http://chat-3:9006"]}
+    assert current_routing_table().source == str(path)
+    assert (await manager.reload())["version"] == summary["version"]
+
+    path.write_text("{not json")
+    with pytest.raises(ValueError):
+        await manager.reload()
+    assert current_routing_table().version == summary["version"]
+    await manager.stop()
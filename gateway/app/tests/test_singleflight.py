@@ -0,0 +1,78 @@
+"""
+동일 요청 병합(singleflight) 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.domain.model import route_policy
+from app.domain.model.route_policy import RoutePolicy, route_matcher
+from app.foundation.core.singleflight import SingleFlight, request_coalescer
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_upstream_call(upstream, gateway_client, monkeypatch):
+    monkeypatch.setattr(route_policy, "_matcher", route_matcher().with_policies(RoutePolicy(route="crime/map", coalesce=True)))
+    release = asyncio.Event()
+
+    async def slow(request):
+        await release.wait()
+        return httpx.Response(200, json={"message": "circle marker"})
+
+    upstream.handler = slow
+    before = request_coalescer.stats()
+    calls = [asyncio.create_task(gateway_client.get("/ai/v1/crime/map/circle-marker")) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    release.set()
+    responses = await asyncio.gather(*calls)
+
+    assert [r.json() for r in responses] == [{"message": "circle marker"}] * 5
+    assert len(upstream.requests) == 1
+    stats = request_coalescer.stats()
+    assert stats["executions"] - before["executions"] == 1
+    assert stats["coalesced_waiters"] - before["coalesced_waiters"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await second == ("done", True)
+    assert first.cancelled()
+    assert runs == [1]
+
+
+@pytest.mark.asyncio
+async def test_last_waiter_cancel_cancels_shared_call():
+    flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiter = asyncio.create_task(flight.do("k", work))
+    await started.wait()
+    waiter.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert flight.stats()["cancelled"] == 1
+    assert flight.stats()["inflight_keys"] == 0
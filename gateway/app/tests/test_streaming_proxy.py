@@ -0,0 +1,163 @@
+"""
+SSE 중계와 WebSocket 프록시 테스트
+"""
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.domain.model.service_type import ResponseMode, ServiceType
+from app.foundation.core.load_balancer import Replica, upstream_balancers
+from app.platform.adapters import websocket_proxy
+from app.platform.adapters.response_relay import relay_response
+
+websockets_server = pytest.importorskip("websockets.asyncio.server")
+
+
+def _event_stream(events, delay):
+    async def body():
+        for event in events:
+            await asyncio.sleep(delay)
+            yield event
+    return httpx.Response(
+        200, headers={"content-type": "text/event-stream; charset=utf-8"}, content=body(),
+        request=httpx.Request("GET", "http://nlp:9004/nlp/progress"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_stream_relayed_chunk_by_chunk():
+    events = [f"event: progress\ndata: {p}\n\n".encode() for p in (10, 50, 100)]
+    relayed = await relay_response(_event_stream(events, 0.05), ResponseMode.ENVELOPE)
+
+    assert relayed.headers["content-type"].startswith("text/event-stream")
+    assert relayed.headers["cache-control"] == "no-cache"
+    started = time.monotonic()
+    arrivals, received = [], []
+    async for chunk in relayed.body_iterator:
+        arrivals.append(time.monotonic() - started)
+        received.append(chunk)
+    assert received == events
+    # 첫 이벤트는 스트림이 끝나기 전에 도착해야 함
+    assert arrivals[0] < 0.1 and arrivals[-1] >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_event_stream_closes_when_upstream_idle(monkeypatch):
+    monkeypatch.setattr("app.platform.adapters.response_relay.SSE_IDLE_TIMEOUT", 0.1)
+    events = [b"data: 1\n\n", b"data: 2\n\n"]
+    relayed = await relay_response(_event_stream(events, 0.3), ResponseMode.STREAM)
+
+    started = time.monotonic()
+    received = [chunk async for chunk in relayed.body_iterator]
+    assert received == []
+    assert time.monotonic() - started < 0.25
+
+
+@pytest.mark.asyncio
+async def test_gateway_streams_sse_even_in_envelope_mode(upstream, gateway_client):
+    upstream.handler = lambda request: _event_stream([b"data: hello\n\n"], 0)
+    response = await gateway_client.get("/ai/v1/titanic/events", headers={"accept": "text/event-stream"})
+
+    assert response.status_code == 200
+    assert response.text == "data: hello\n\n"
+    assert response.headers["x-accel-buffering"] == "no"
+
+
+class UpstreamWebSocketServer:
+    """별도 스레드의 이벤트 루프에서 동작하는 업스트림 WebSocket 서버"""
+
+    def __init__(self, handler, subprotocols=None):
+        self.handler = handler
+        self.subprotocols = subprotocols
+        self.port = None
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._stop = None
+
+    def __enter__(self):
+        threading.Thread(target=self._loop.run_until_complete, args=(self._serve(),), daemon=True).start()
+        self._ready.wait(5)
+        return self
+
+    def __exit__(self, *exc):
+        self._loop.call_soon_threadsafe(self._stop.set_result, None)
+
+    async def _serve(self):
+        self._stop = asyncio.get_running_loop().create_future()
+        async with websockets_server.serve(self.handler, "127.0.0.1", 0, subprotocols=self.subprotocols) as server:
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await self._stop
+
+
+@pytest.fixture
+def chat_replica(monkeypatch):
+    def use(port):
+        monkeypatch.setattr(upstream_balancers[ServiceType.CHAT], "replicas", [Replica(f"http://127.0.0.1:{port}")])
+    return use
+
+
+def test_websocket_proxy_relays_both_directions(chat_replica):
+    seen = {}
+
+    async def echo(connection):
+        seen["path"] = connection.request.path
+        seen["authorization"] = connection.request.headers.get("authorization")
+        async for message in connection:
+            await connection.send(f"echo:{message}" if isinstance(message, str) else message[::-1])
+
+    from app.main import app
+    with UpstreamWebSocketServer(echo, subprotocols=["chat.v1"]) as server:
+        chat_replica(server.port)
+        client = TestClient(app)
+        with client.websocket_connect(
+            "/ai/v1/chat/ws/stream?room=1", subprotocols=["chat.v1"], headers={"authorization": "Bearer t"}
+        ) as ws:
+            assert ws.accepted_subprotocol == "chat.v1"
+            ws.send_text("안녕")
+            assert ws.receive_text() == "echo:안녕"
+            ws.send_bytes(b"\x01\x02")
+            assert ws.receive_bytes() == b"\x02\x01"
+
+    assert seen == {"path": "/ws/stream?room=1", "authorization": "Bearer t"}
+
+
+def test_websocket_proxy_propagates_close_and_idle_timeout(chat_replica, monkeypatch):
+    async def handler(connection):
+        message = await connection.recv()
+        if message == "bye":
+            await connection.close(4000, "done")
+        else:
+            await asyncio.sleep(5)
+
+    from app.main import app
+    with UpstreamWebSocketServer(handler) as server:
+        chat_replica(server.port)
+        client = TestClient(app)
+        with client.websocket_connect("/ai/v1/chat/ws") as ws:
+            ws.send_text("bye")
+            with pytest.raises(WebSocketDisconnect) as closed:
+                ws.receive_text()
+            assert closed.value.code == 4000
+
+        monkeypatch.setattr(websocket_proxy, "WS_IDLE_TIMEOUT", 0.2)
+        with client.websocket_connect("/ai/v1/chat/ws") as ws:
+            ws.send_text("wait")
+            with pytest.raises(WebSocketDisconnect) as closed:
+                ws.receive_text()
+            assert closed.value.code == 1001
+
+
+def test_websocket_rejected_when_upstream_unreachable(chat_replica):
+    chat_replica(1)
+    from app.main import app
+    client = TestClient(app)
+    with pytest.raises(WebSocketDisconnect) as rejected:
+        with client.websocket_connect("/ai/v1/chat/ws"):
+            pass
+    assert rejected.value.code == 1014
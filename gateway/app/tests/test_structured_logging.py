@@ -0,0 +1,79 @@
+"""
+구조화 로깅 테스트
+"""
+import io
+import json
+import logging
+
+import pytest
+
+from app.foundation.core.structured_logging import (
+    ContextQueueHandler, DebugSamplingFilter, configure_logging, parse_levels, shutdown_logging
+)
+from app.foundation.core.tracing import tracer
+
+
+@pytest.fixture
+def log_output(monkeypatch):
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    stream = io.StringIO()
+
+    def lines():
+        shutdown_logging()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    monkeypatch.setenv("LOG_LEVELS", "structured_test.quiet=WARNING")
+    monkeypatch.setenv("LOG_DEBUG_SAMPLE_RATE", "1")
+    configure_logging("gateway-test", stream=stream)
+    yield lines
+    shutdown_logging()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+    logging.getLogger("structured_test.quiet").setLevel(logging.NOTSET)
+
+
+def test_json_records_include_trace_and_extra_fields(log_output):
+    logger = logging.getLogger("structured_test")
+    with tracer.span("work") as span:
+        logger.info("처리 %s", "완료", extra={"path": "passengers"})
+    logging.getLogger("structured_test.quiet").info("숨김")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("실패")
+
+    records = log_output()
+    assert len(records) == 2
+    assert records[0]["message"] == "처리 완료"
+    assert records[0]["service"] == "gateway-test"
+    assert records[0]["path"] == "passengers"
+    assert records[0]["trace_id"] == span.context.trace_id
+    assert "ValueError: boom" in records[1]["exc_info"]
+
+
+def test_configure_replaces_previous_queue_handler(log_output):
+    configure_logging("gateway-test", stream=io.StringIO())
+    handlers = [h for h in logging.getLogger().handlers if isinstance(h, ContextQueueHandler)]
+    assert len(handlers) == 1
+
+
+def test_debug_sampling_follows_trace_id():
+    sampler = DebugSamplingFilter(0.5)
+    record = logging.LogRecord("x", logging.DEBUG, "", 0, "debug", (), None)
+    info = logging.LogRecord("x", logging.INFO, "", 0, "info", (), None)
+
+    decisions = set()
+    for _ in range(50):
+        with tracer.span("request") as span:
+            decision = sampler.filter(record)
+            assert decision == (int(span.context.trace_id[:8], 16) < sampler.threshold)
+            assert sampler.filter(info)
+            decisions.add(decision)
+    assert decisions == {True, False}
+    # 요청 밖 DEBUG 는 샘플링하지 않음
+    assert sampler.filter(record)
+
+
+def test_parse_levels():
+    assert parse_levels("service_proxy=debug, httpx=WARNING,,bad") == {"service_proxy": "DEBUG", "httpx": "WARNING"}
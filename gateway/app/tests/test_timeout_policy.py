@@ -0,0 +1,94 @@
+"""
+라우트별/적응형 업스트림 타임아웃 및 마감 헤더 전달 테스트
+"""
+import time
+
+import httpx
+import pytest
+
+from app.domain.model.route_policy import RoutePolicy
+from app.domain.model.service_type import ServiceType
+from app.foundation.core import timeout_policy
+from app.foundation.core.bulkhead import Bulkhead, service_bulkheads
+from app.foundation.core.retry_policy import RetryPolicy, RetrySettings, service_retry_policies
+from app.foundation.core.timeout_policy import TimeoutSettings, UpstreamTimeouts, client_budget
+
+
+@pytest.fixture
+def timeouts(monkeypatch):
+    policy = UpstreamTimeouts(TimeoutSettings(min_samples=5, min_timeout=0.1))
+    monkeypatch.setattr(timeout_policy, "upstream_timeouts", policy)
+    from app.domain.model import service_proxy_factory
+    monkeypatch.setattr(service_proxy_factory, "upstream_timeouts", policy)
+    return policy
+
+
+def test_adaptive_timeout_uses_quantile_with_headroom_and_stays_under_ceiling(timeouts):
+    route = RoutePolicy(route="titanic/passengers", timeout=5, adaptive_timeout=True)
+    assert timeouts.timeout_for(route, default=30) == 5  # 표본 부족
+    for _ in range(10):
+        timeouts.record(route.route, 0.2)
+    assert timeouts.timeout_for(route, default=30) == pytest.approx(0.4)
+    for _ in range(10):
+        timeouts.record_timeout(route.route, 4.0)
+    assert timeouts.timeout_for(route, default=30) == 5
+    assert timeouts.stats("titanic")["titanic/passengers"]["timeouts"] == 10
+
+
+def test_static_timeout_falls_back_to_service_default(timeouts):
+    for _ in range(10):
+        timeouts.record("crime/*", 0.01)
+    assert timeouts.timeout_for(RoutePolicy(route="crime/*"), default=30) == 30
+    assert timeouts.timeout_for(RoutePolicy(route="crime/preprocess", timeout=300), default=30) == 300
+
+
+def test_client_budget_parsing():
+    assert client_budget({"X-Request-Timeout-Ms": "1500"}) == 1.5
+    assert client_budget({"x-request-timeout-ms": "soon"}) is None
+    assert client_budget({}) is None
+
+
+@pytest.mark.asyncio
+async def test_route_timeout_and_client_budget_are_forwarded(upstream, gateway_client, timeouts):
+    await gateway_client.get("/ai/v1/titanic/passengers")
+    await gateway_client.get("/ai/v1/titanic/passengers", headers={"X-Request-Timeout-Ms": "800"})
+    route_budget, client_limited = (int(r.headers["x-request-timeout-ms"]) for r in upstream.requests)
+    assert 4000 < route_budget <= 5000
+    assert 0 < client_limited <= 800
+    assert timeouts.stats("titanic")["titanic/passengers"]["samples"] == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_budget_and_upstream_timeout_return_504(upstream, gateway_client, timeouts, monkeypatch):
+    monkeypatch.setitem(service_retry_policies, ServiceType.TITANIC, RetryPolicy(RetrySettings(max_retries=0)))
+
+    expired = await gateway_client.get("/ai/v1/titanic/passengers", headers={"X-Request-Timeout-Ms": "0"})
+    assert expired.status_code == 504
+    assert upstream.requests == []
+
+    def handler(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    upstream.handler = handler
+    response = await gateway_client.get("/ai/v1/titanic/passengers")
+    assert response.status_code == 504
+    assert timeouts.stats("titanic")["titanic/passengers"]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_wait_is_capped_by_client_budget(upstream, gateway_client, timeouts, monkeypatch):
+    bulkhead = Bulkhead("titanic", 1, 4, 10)
+    monkeypatch.setitem(service_bulkheads, ServiceType.TITANIC, bulkhead)
+    await bulkhead.acquire()
+    try:
+        started = time.monotonic()
+        response = await gateway_client.get("/ai/v1/titanic/passengers", headers={"X-Request-Timeout-Ms": "200"})
+        elapsed = time.monotonic() - started
+    finally:
+        bulkhead.release()
+
+    # queue_timeout(10초)까지 기다리지 않고 클라이언트 예산이 끝나면 504
+    assert response.status_code == 504
+    assert elapsed < 1
+    assert upstream.requests == []
+    assert bulkhead.stats()["queued"] == 0
@@ -0,0 +1,114 @@
+"""
+트레이스 전파 및 Server-Timing 테스트
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.foundation.core.tracing import DeadlineMiddleware, JsonFileExporter, OtlpHttpExporter, SpanContext, Tracer, TracingMiddleware
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+def test_traceparent_parse_and_format():
+    context = SpanContext.parse(f"00-{TRACE_ID}-00f067aa0ba902b7-01")
+    assert context == SpanContext(TRACE_ID, "00f067aa0ba902b7", True)
+    assert context.to_traceparent() == f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+    assert SpanContext.parse("00-" + "0" * 32 + "-00f067aa0ba902b7-01") is None
+    assert SpanContext.parse("garbage") is None
+
+
+@pytest.mark.asyncio
+async def test_trace_is_propagated_and_server_timing_merged(upstream, gateway_client):
+    upstream.handler = lambda request: httpx.Response(
+        200, json={"ok": True}, headers={"server-timing": "total;dur=40.0, build_merged_dataset_and_indicators;dur=31.5"}
+    )
+
+    response = await gateway_client.get(
+        "/ai/v1/nlp/report", headers={"traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"}
+    )
+
+    forwarded = SpanContext.parse(upstream.requests[0].headers["traceparent"])
+    assert forwarded.trace_id == TRACE_ID
+    assert forwarded.span_id != "00f067aa0ba902b7"
+    assert SpanContext.parse(response.headers["traceparent"]).trace_id == TRACE_ID
+
+    timing = response.headers["server-timing"]
+    assert timing.startswith("total;dur=")
+    assert "upstream.nlp;dur=" in timing
+    assert "nlp.build_merged_dataset_and_indicators;dur=31.5" in timing
+    assert len(response.headers.get_list("server-timing")) == 1
+
+
+def test_traced_spans_are_exported_with_parent_links(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer = Tracer("crime-service", JsonFileExporter(str(path)))
+
+    @tracer.traced()
+    def build_merged_dataset_and_indicators():
+        return "merged"
+
+    with tracer.span("draw_circle_marker_map") as parent:
+        assert build_merged_dataset_and_indicators() == "merged"
+
+    with pytest.raises(ValueError):
+        with tracer.span("broken"):
+            raise ValueError("빈 데이터")
+
+    # 파일 쓰기는 출력 스레드가 담당하므로 종료(남은 스팬 기록) 후 확인
+    tracer.shutdown()
+    spans = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    child, root, broken = spans
+    assert child["name"] == "build_merged_dataset_and_indicators"
+    assert child["parent_id"] == parent.context.span_id
+    assert child["trace_id"] == root["trace_id"]
+    assert broken["error"] == "ValueError: 빈 데이터"
+
+
+def test_otlp_exporter_encodes_spans():
+    tracer = Tracer("nlp-service")
+    with tracer.span("read_report", lines=3) as span:
+        pass
+    exporter = OtlpHttpExporter("http://collector:4318", "nlp-service", flush_interval=0.01)
+    try:
+        payload = exporter.encode([span])
+    finally:
+        exporter.shutdown()
+
+    resource_spans = payload["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "nlp-service"}
+    encoded = resource_spans["scopeSpans"][0]["spans"][0]
+    assert encoded["traceId"] == span.context.trace_id
+    assert encoded["attributes"] == [{"key": "lines", "value": {"intValue": "3"}}]
+    assert exporter.url == "http://collector:4318/v1/traces"
+
+
+@pytest.mark.asyncio
+async def test_service_drops_requests_past_gateway_deadline():
+    app = FastAPI()
+    finished = []
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.5)
+        finished.append("slow")
+        return {"ok": True}
+
+    # configure_tracing 과 같은 순서 (전역 트레이서는 건드리지 않음)
+    app.add_middleware(DeadlineMiddleware)
+    app.add_middleware(TracingMiddleware, tracer=Tracer("test-service"))
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        timed_out = await client.get("/slow", headers={"x-request-timeout-ms": "50"})
+        expired = await client.get("/slow", headers={"x-request-timeout-ms": "0"})
+        ok = await client.get("/slow", headers={"x-request-timeout-ms": "2000"})
+        no_deadline = await client.get("/slow")
+
+    assert timed_out.status_code == 504
+    assert "traceparent" in timed_out.headers
+    assert expired.status_code == 504
+    assert (ok.status_code, no_deadline.status_code) == (200, 200)
+    # 마감이 지난 요청의 핸들러는 취소되어 끝나지 않음
+    assert finished == ["slow", "slow"]
@@ -0,0 +1,73 @@
+"""
+업스트림 전송 계층 테스트 (유닉스 소켓, h2c)
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.foundation.core.load_balancer import Replica
+from app.foundation.infrastructure.upstream_transport import (
+    UpstreamRoute, UpstreamTransport, resolve_upstream_url, route_for
+)
+
+
+def test_resolve_upstream_url_registers_routes():
+    assert resolve_upstream_url("http://nlp:9004/") == "http://nlp:9004"
+    assert route_for(httpx.URL("http://nlp:9004/report")) == UpstreamRoute("http1")
+
+    assert resolve_upstream_url("h2c://chat:9006") == "http://chat:9006"
+    assert route_for(httpx.URL("http://chat:9006/chat")).protocol == "h2c"
+
+    base = resolve_upstream_url("unix:///run/ai/nlp.sock")
+    other = resolve_upstream_url("unix:///tmp/nlp.sock")
+    assert base.startswith("http://nlp-sock-") and base != other
+    assert route_for(httpx.URL(f"{base}/nlp/report")) == UpstreamRoute("uds", "/run/ai/nlp.sock")
+
+
+def test_replica_keeps_configured_url():
+    replica = Replica("unix:///run/ai/tf.sock")
+    assert replica.url == "unix:///run/ai/tf.sock"
+    assert replica.base_url.startswith("http://tf-sock-")
+
+
+@pytest.mark.asyncio
+async def test_requests_reach_unix_socket_server(tmp_path):
+    received = []
+
+    async def handle(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        received.append(head.split(b"\r\n")[0])
+        body = b'{"ok": true}'
+        writer.write(b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\ncontent-length: "
+                     + str(len(body)).encode() + b"\r\n\r\n" + body)
+        await writer.drain()
+        writer.close()
+
+    socket_path = str(tmp_path / "titanic.sock")
+    server = await asyncio.start_unix_server(handle, path=socket_path)
+    transport = UpstreamTransport(httpx.Limits())
+    try:
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get(f"{resolve_upstream_url('unix://' + socket_path)}/titanic/passengers")
+            pools = len(transport.transports)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert response.json() == {"ok": True}
+    assert received == [b"GET /titanic/passengers HTTP/1.1"]
+    assert pools == 1
+
+
+@pytest.mark.asyncio
+async def test_h2c_route_uses_http2_pool():
+    transport = UpstreamTransport(httpx.Limits())
+    h2c = transport._transport_for(UpstreamRoute("h2c"))
+    plain = transport._transport_for(UpstreamRoute("http1"))
+
+    assert h2c._pool._http2 and not h2c._pool._http1
+    assert plain._pool._http1 and not plain._pool._http2
+    assert transport._transport_for(UpstreamRoute("h2c")) is h2c
+    await transport.aclose()
+    assert transport.transports == []
@@ -0,0 +1,3 @@
+"""
+게이트웨이 부하/오버헤드 벤치마크
+"""
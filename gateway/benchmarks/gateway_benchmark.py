@@ -0,0 +1,300 @@
+"""
+게이트웨이 오버헤드 벤치마크
+
+게이트웨이 app 을 프로세스 안에서 띄우고(ASGITransport), 업스트림은 고정 응답과 지연을 갖는
+스텁(MockTransport)으로 대체해 GET / JSON POST / 파일 업로드 트래픽을 동시성 단계별로 보낸다.
+요청마다 (클라이언트 측 전체 지연 - 스텁 안에서 보낸 시간) 을 게이트웨이 오버헤드로 기록한다.
+
+사용 예 (gateway 디렉터리에서):
+    python -m benchmarks.gateway_benchmark --concurrency 1,16,64 --requests 500 --output bench.json
+    python -m benchmarks.gateway_benchmark --baseline bench.json --tolerance 0.15
+
+기준 결과(--baseline)보다 p95 오버헤드가 늘거나 처리량이 줄어 허용 비율을 넘으면 종료 코드 1 로 끝난다.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import math
+import os
+import platform
+import sys
+import time
+
+# 서비스 URL 은 service_type 모듈 임포트 전에 있어야 함 (스텁이므로 실제 접속하지 않음)
+for _name, _url in {
+    "TITANIC_SERVICE_URL": "http://titanic:9001",
+    "CRIME_SERVICE_URL": "http://crime:9002",
+    "MATZIP_SERVICE_URL": "http://matzip:9003",
+    "NLP_SERVICE_URL": "http://nlp:9004",
+    "TF_SERVICE_URL": "http://tf:9005",
+    "CHAT_SERVICE_URL": "http://chat:9006",
+}.items():
+    os.environ.setdefault(_name, _url)
+
+import httpx
+
+BENCH_ID_HEADER = "x-bench-id"
+
+# 시나리오별 요청 (서비스 경로 + 요청 인자)
+SCENARIOS = {
+    "get": {"method": "GET", "url": "/ai/v1/titanic/passengers"},
+    "post_json": {"method": "POST", "url": "/ai/v1/chat/chat"},
+    "upload": {"method": "POST", "url": "/ai/v1/nlp/upload"},
+}
+
+# 기준 결과와 비교할 지표 (값이 클수록 나쁜지 여부)
+COMPARED_METRICS = {
+    "overhead_ms.p50": True,
+    "overhead_ms.p95": True,
+    "overhead_ms.p99": True,
+    "throughput_rps": False,
+}
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """nearest-rank 백분위수 (q 는 0~1)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """초 단위 값 목록을 밀리초 백분위수로 요약"""
+    return {
+        "p50": round(percentile(values, 0.50) * 1000, 3),
+        "p95": round(percentile(values, 0.95) * 1000, 3),
+        "p99": round(percentile(values, 0.99) * 1000, 3),
+        "max": round(max(values) * 1000, 3) if values else 0.0,
+    }
+
+
+class StubUpstream:
+    """고정 페이로드를 지연 후 반환하는 가짜 업스트림 - 요청 ID 별로 스텁 안에서 보낸 시간을 기록"""
+
+    def __init__(self, latency: float, payload_size: int):
+        self.latency = latency
+        filler = "x" * max(0, payload_size - 32)
+        self.payload = json.dumps({"ok": True, "data": filler}).encode("utf-8")
+        self.upstream_seconds: Dict[str, float] = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        await request.aread()
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        response = httpx.Response(200, content=self.payload, headers={"content-type": "application/json"})
+        bench_id = request.headers.get(BENCH_ID_HEADER)
+        if bench_id is not None:
+            self.upstream_seconds[bench_id] = time.perf_counter() - started
+        return response
+
+
+def _request_kwargs(scenario: str, payload_size: int, upload: bytes) -> Dict[str, Any]:
+    if scenario == "post_json":
+        return {"json": {"message": "x" * payload_size}}
+    if scenario == "upload":
+        return {"files": {"file": ("bench.bin", upload, "application/octet-stream")}}
+    return {}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    stub: StubUpstream,
+    scenario: str,
+    concurrency: int,
+    total: int,
+    payload_size: int,
+    upload_size: int,
+) -> Dict[str, Any]:
+    """한 시나리오를 지정한 동시성으로 total 건 실행하고 결과 요약"""
+    spec = SCENARIOS[scenario]
+    upload = os.urandom(upload_size)
+    counter = itertools.count()
+    overheads: List[float] = []
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+
+    async def worker():
+        while True:
+            index = next(counter)
+            if index >= total:
+                return
+            bench_id = f"{scenario}-{concurrency}-{index}"
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    spec["method"], spec["url"], headers={BENCH_ID_HEADER: bench_id},
+                    **_request_kwargs(scenario, payload_size, upload)
+                )
+                await response.aread()
+                status = response.status_code
+            except Exception as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                continue
+            elapsed = time.perf_counter() - started
+            if status >= 400:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+                continue
+            latencies.append(elapsed)
+            overheads.append(max(0.0, elapsed - stub.upstream_seconds.pop(bench_id, 0.0)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - started
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": total,
+        "succeeded": len(latencies),
+        "errors": errors,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(latencies) / duration, 1) if duration > 0 else 0.0,
+        "latency_ms": summarize(latencies),
+        "overhead_ms": summarize(overheads),
+    }
+
+
+async def run_benchmark(
+    scenarios: Sequence[str],
+    concurrency_levels: Sequence[int],
+    total: int,
+    latency: float = 0.0,
+    payload_size: int = 1024,
+    upload_size: int = 64 * 1024,
+    warmup: int = 20,
+) -> Dict[str, Any]:
+    """게이트웨이를 스텁 업스트림에 연결해 시나리오 x 동시성 조합을 모두 실행"""
+    from app.main import app
+    from app.foundation.infrastructure.http_client_pool import upstream_pool
+
+    stub = StubUpstream(latency, payload_size)
+    await upstream_pool.startup(transport=httpx.MockTransport(stub))
+    results = []
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway", timeout=60) as client:
+            for scenario in scenarios:
+                if warmup > 0:
+                    await run_scenario(client, stub, scenario, 1, warmup, payload_size, upload_size)
+                for concurrency in concurrency_levels:
+                    result = await run_scenario(client, stub, scenario, concurrency, total, payload_size, upload_size)
+                    results.append(result)
+                    print(
+                        f"{scenario:<10} c={concurrency:<4} {result['throughput_rps']:>9.1f} req/s  "
+                        f"overhead p50={result['overhead_ms']['p50']:.2f}ms "
+                        f"p95={result['overhead_ms']['p95']:.2f}ms p99={result['overhead_ms']['p99']:.2f}ms  "
+                        f"errors={sum(result['errors'].values())}",
+                        file=sys.stderr,
+                    )
+    finally:
+        await upstream_pool.shutdown()
+    return {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "upstream_latency_ms": latency * 1000,
+            "payload_size": payload_size,
+            "upload_size": upload_size,
+            "requests_per_run": total,
+        },
+        "results": results,
+    }
+
+
+def _metric(result: Dict[str, Any], name: str) -> Optional[float]:
+    value: Any = result
+    for part in name.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return float(value)
+
+
+def compare_with_baseline(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.10
+) -> List[Dict[str, Any]]:
+    """기준 결과와 같은 (시나리오, 동시성) 항목끼리 비교해 허용 비율을 넘어 나빠진 지표 목록 반환"""
+    baseline_results = {(r["scenario"], r["concurrency"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current.get("results", []):
+        previous = baseline_results.get((result["scenario"], result["concurrency"]))
+        if previous is None:
+            continue
+        for name, higher_is_worse in COMPARED_METRICS.items():
+            now, before = _metric(result, name), _metric(previous, name)
+            if now is None or not before:
+                continue
+            change = (now - before) / before
+            if (change if higher_is_worse else -change) > tolerance:
+                regressions.append({
+                    "scenario": result["scenario"],
+                    "concurrency": result["concurrency"],
+                    "metric": name,
+                    "baseline": before,
+                    "current": now,
+                    "change": round(change, 3),
+                })
+    return regressions
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="게이트웨이 오버헤드 벤치마크")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="get,post_json,upload 중 선택 (쉼표 구분)")
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 16, 64], help="동시성 단계 (예: 1,16,64)")
+    parser.add_argument("--requests", type=int, default=500, help="단계마다 보낼 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="스텁 업스트림 응답 지연(ms)")
+    parser.add_argument("--payload-size", type=int, default=1024, help="응답/JSON 요청 본문 크기(바이트)")
+    parser.add_argument("--upload-size", type=int, default=64 * 1024, help="업로드 파일 크기(바이트)")
+    parser.add_argument("--warmup", type=int, default=20, help="시나리오마다 먼저 보내는 워밍업 요청 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="허용 악화 비율 (0.10 = 10%%)")
+    parser.add_argument("--log-level", default="WARNING", help="게이트웨이 로그 레벨")
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    from app import main as gateway_main  # noqa: F401 - 로깅 설정 후 레벨을 덮어쓰기 위해 먼저 임포트
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    report = asyncio.run(run_benchmark(
+        scenarios, args.concurrency, args.requests,
+        latency=args.latency_ms / 1000, payload_size=args.payload_size,
+        upload_size=args.upload_size, warmup=args.warmup,
+    ))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(report, baseline, args.tolerance)
+        for item in regressions:
+            print(
+                f"회귀: {item['scenario']} c={item['concurrency']} {item['metric']} "
+                f"{item['baseline']} -> {item['current']} ({item['change']:+.1%})",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+        print(f"기준 결과 대비 회귀 없음 (허용 {args.tolerance:.0%})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,8 +3,6 @@ import logging
 import traceback
 from app.domain.controller.wordcloud_controller import WordCloudController
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("nlp_api")
 
 # 라우터 생성
@@ -34,21 +32,17 @@ async def generate_wordcloud(request: Request):
     Returns:
         dict: 워드클라우드 생성 결과와 저장 경로를 포함한 JSON 응답
     """
-    logger.info(f"📥 요청 수신: {request.method} {request.url.path}")
-    logger.info(f"📍 클라이언트: {request.client.host}:{request.client.port}")
-    logger.info(f"🔍 헤더: {dict(request.headers)}")
+    logger.debug("워드클라우드 생성 요청", extra={"client": request.client.host if request.client else None})
     
     try:
-        logger.info("🔄 WordCloudController 생성 및 워드클라우드 생성 요청")
         controller = WordCloudController()
         result = await controller.generate_wordcloud()
         
-        logger.info(f"📤 응답 반환: {result}")
+        logger.debug("워드클라우드 생성 완료", extra={"result": result})
         return result
     except Exception as e:
         error_msg = f"❌ 워드클라우드 생성 중 오류: {str(e)}"
-        logger.error(error_msg)
-        logger.error(f"🔥 예외 발생: {traceback.format_exc()}")
+        logger.exception(error_msg)
         
         raise HTTPException(
             status_code=500, 
@@ -3,8 +3,6 @@ import logging
 import traceback
 from app.domain.service.samsung_report import SamsungReport
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("wordcloud_controller")
 
 class WordCloudController:
@@ -8,9 +8,8 @@ import os
 import shutil
 import traceback
 import logging
+from app.foundation.core.tracing import traced
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("samsung_report")
 
 class SamsungReport:
@@ -61,6 +60,7 @@ class SamsungReport:
                 logger.error(f"⚠️ 로컬 출력 디렉토리 생성 실패: {e}")
                 logger.error(traceback.format_exc())
 
+    @traced()
     def read_report(self):
         """삼성 보고서 파일을 읽어옵니다."""
         try:
@@ -75,6 +75,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"보고서 파일 읽기 실패: {e}")
 
+    @traced()
     def extract_hangeul(self):
         """한글만 추출합니다."""
         try:
@@ -91,6 +92,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"한글 추출 실패: {e}")
 
+    @traced()
     def change_token(self):
         """텍스트를 토큰화합니다."""
         try:
@@ -105,6 +107,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"토큰화 실패: {e}")
 
+    @traced()
     def extract_noun(self):
         """명사를 추출합니다."""
         try:
@@ -135,6 +138,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"명사 추출 실패: {e}")
 
+    @traced()
     def read_stopword(self):
         """불용어 리스트를 읽어옵니다."""
         try:
@@ -153,6 +157,7 @@ class SamsungReport:
             self.stopwords = ['이', '그', '저', '것', '수', '등', '들', '및', '에서', '그리고']
             return self.stopwords
 
+    @traced()
     def remove_stopword(self):
         """불용어를 제거합니다."""
         try:
@@ -169,6 +174,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"불용어 제거 실패: {e}")
 
+    @traced()
     def find_frequency(self):
         """단어 빈도수를 분석합니다."""
         try:
@@ -188,6 +194,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"빈도 분석 실패: {e}")
 
+    @traced()
     def draw_wordcloud(self):
         """워드클라우드를 생성하고 저장합니다. 컨테이너 내부와 로컬에 모두 저장합니다."""
         try:
@@ -260,6 +267,7 @@ class SamsungReport:
             logger.error(traceback.format_exc())
             raise Exception(f"워드클라우드 생성 실패: {e}")
 
+    @traced()
     def process_all(self):
         """모든 처리 과정을 순차적으로 실행합니다."""
         try:
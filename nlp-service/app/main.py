@@ -4,16 +4,14 @@ NLP 서비스 메인 애플리케이션 진입점
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.router import router
+from app.foundation.core.structured_logging import configure_logging
+from app.foundation.core.tracing import configure_tracing
 import uvicorn
 import logging
-import traceback
 import os
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# 로깅 설정 (JSON, 큐 핸들러 + 백그라운드 출력 스레드)
+configure_logging("nlp-service")
 logger = logging.getLogger("nlp_main")
 
 # 현재 환경 정보 출력
@@ -42,16 +40,18 @@ app.add_middleware(
 # 예외 처리 미들웨어 추가
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    logger.info(f"📥 요청: {request.method} {request.url.path} (클라이언트: {request.client.host})")
+    logger.debug("요청 수신", extra={"method": request.method, "path": request.url.path})
     try:
         response = await call_next(request)
-        logger.info(f"📤 응답: {response.status_code}")
+        logger.debug("응답 반환", extra={"status_code": response.status_code})
         return response
     except Exception as e:
-        logger.error(f"❌ 요청 처리 중 오류: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"요청 처리 중 오류: {str(e)}")
         raise
 
+# 트레이스 전파, Server-Timing, 게이트웨이 요청 마감(X-Request-Timeout-Ms) 적용 (요청 로깅 미들웨어보다 바깥)
+configure_tracing(app, "nlp-service")
+
 # 라우터 등록 - prefix를 /nlp로 설정
 # 최종 URL 경로: /nlp/generate-wordcloud
 logger.info("🔄 라우터 등록 (prefix='/nlp')")
@@ -14,8 +14,7 @@ logger = logging.getLogger("tf_main")
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 UPLOAD_DIR = os.path.join(BASE_DIR, "uploads")
 OUTPUT_DIR = os.path.join(BASE_DIR, "output")
-print(f"🟠UPLOAD_DIR: {UPLOAD_DIR}")
-print(f"🟠OUTPUT_DIR: {OUTPUT_DIR}")
+logger.info(f"UPLOAD_DIR: {UPLOAD_DIR}, OUTPUT_DIR: {OUTPUT_DIR}")
 
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 logger.info(f"파일 업로드 디렉토리: {UPLOAD_DIR}")
@@ -1,5 +1,9 @@
+import logging
+
 import tensorflow as tf
 
+logger = logging.getLogger("tf_main")
+
 
 class Calculator:
     def __init__(self):
@@ -20,16 +24,16 @@ class Calculator:
 
     def sample(self):
         mnist = tf.keras.datasets.mnist
-        print(f"❗😃🎃mnist: {mnist}")
+        logger.debug("mnist: %s", mnist)
 
         (x_train, y_train),(x_test, y_test) = mnist.load_data()
-        print(f"❗😃🎃x_train: {x_train}")
-        print(f"❗😃🎃y_train: {y_train}") 
-        print(f"❗😃🎃x_test: {x_test}")
-        print(f"❗😃🎃y_test: {y_test}")
+        logger.debug("x_train: %s", x_train)
+        logger.debug("y_train: %s", y_train) 
+        logger.debug("x_test: %s", x_test)
+        logger.debug("y_test: %s", y_test)
         x_train, x_test = x_train / 255.0, x_test / 255.0
-        print(f"❗😃🎃x_train.shape: {x_train.shape}")
-        print(f"❗😃🎃x_test.shape: {x_test.shape}")
+        logger.debug("x_train.shape: %s", x_train.shape)
+        logger.debug("x_test.shape: %s", x_test.shape)
 
         model = tf.keras.models.Sequential([
         tf.keras.layers.Flatten(input_shape=(28, 28)),
@@ -37,14 +41,14 @@ class Calculator:
         tf.keras.layers.Dropout(0.2),
         tf.keras.layers.Dense(10, activation='softmax')
         ])
-        print(f"❗😃🎃model: {model}")
+        logger.debug("model: %s", model)
 
         model.compile(optimizer='adam',
         loss='sparse_categorical_crossentropy',
         metrics=['accuracy'])
-        print(f"❗😃🎃model: {model}")
+        logger.debug("model: %s", model)
 
         model.fit(x_train, y_train, epochs=5)
-        print(f"❗😃🎃model: {model}")
+        logger.debug("model: %s", model)
         model.evaluate(x_test, y_test)
-        print(f"❗😃🎃model: {model}")
\ No newline at end of file
+        logger.debug("model: %s", model)
\ No newline at end of file
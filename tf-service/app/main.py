@@ -4,17 +4,15 @@ TF 서비스 메인 애플리케이션 진입점
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.file_router import router as file_router
+from app.foundation.core.structured_logging import configure_logging
+from app.foundation.core.tracing import configure_tracing
 import uvicorn
 import logging
-import traceback
 import os
 import cv2
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# 로깅 설정 (JSON, 큐 핸들러 + 백그라운드 출력 스레드)
+configure_logging("tf-service")
 logger = logging.getLogger("tf_main")
 
 # 현재 환경 정보 출력
@@ -54,16 +52,18 @@ app.add_middleware(
 # 예외 처리 미들웨어 추가
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    logger.info(f"📥 요청: {request.method} {request.url.path} (클라이언트: {request.client.host})")
+    logger.debug("요청 수신", extra={"method": request.method, "path": request.url.path})
     try:
         response = await call_next(request)
-        logger.info(f"📤 응답: {response.status_code}")
+        logger.debug("응답 반환", extra={"status_code": response.status_code})
         return response
     except Exception as e:
-        logger.error(f"❌ 요청 처리 중 오류: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"요청 처리 중 오류: {str(e)}")
         raise
 
+# 트레이스 전파, Server-Timing, 게이트웨이 요청 마감(X-Request-Timeout-Ms) 적용 (요청 로깅 미들웨어보다 바깥)
+configure_tracing(app, "tf-service")
+
 # 파일 업로드 라우터 등록
 logger.info("🔄 파일 업로드 라우터 등록 (prefix='/tf')")
 app.include_router(file_router, prefix="/tf", tags=["파일 업로드"])
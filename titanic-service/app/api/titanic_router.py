@@ -7,7 +7,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 # 로거 설정
 logger = logging.getLogger("titanic_router")
-logger.setLevel(logging.INFO)
 router = APIRouter()
 
 # GET
@@ -16,8 +15,7 @@ async def get_all_passengers():
     """
     등록된 모든 타이타닉 승객의 목록을 조회합니다.
     """
-    print("📋 모든 타이타닉 승객 목록 조회")
-    logger.info("📋 모든 타이타닉 승객 목록 조회")
+    logger.debug("모든 타이타닉 승객 목록 조회")
     
     # 샘플 데이터
     passengers = [
@@ -33,16 +31,14 @@ async def predict_survival(
     
     
 ):
-    print(f"🕞🕞🕞🕞🕞🕞predict_survival 호출 - 승객: ")
-    logger.info(f"🕞🕞🕞🕞🕞🕞predict_survival 호출 - 승객: ")
+    logger.debug("predict_survival 호출")
     controller = TitanicController()
     return await controller.predict_survival()
 
 # PUT
 @router.put("/passengers", summary="승객 정보 전체 수정")
 async def update_passenger(request: Request):
-    print("📝 승객 정보 전체 수정")
-    logger.info("📝 승객 정보 전체 수정")
+    logger.debug("승객 정보 전체 수정")
     
     # 샘플 응답
     return {
@@ -60,8 +56,7 @@ async def delete_passenger():
     """
     승객 정보를 삭제합니다.
     """
-    print("🗑️ 승객 정보 삭제")
-    logger.info("🗑️ 승객 정보 삭제")
+    logger.debug("승객 정보 삭제")
     
     # 샘플 응답
     return {
@@ -74,8 +69,7 @@ async def patch_passenger(request: Request):
     """
     승객 정보를 부분적으로 수정합니다.
     """
-    print("✏️ 승객 정보 부분 수정")
-    logger.info("✏️ 승객 정보 부분 수정")
+    logger.debug("승객 정보 부분 수정")
     
     # 샘플 응답
     return {
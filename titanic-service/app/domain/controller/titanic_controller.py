@@ -1,13 +1,11 @@
+import logging
+
 from sklearn.svm import SVC
 import pandas as pd
 from app.domain.service.titanic_service import TitanicService
-'''
-print(f'결정트리 활용한 검증 정확도 {None}')
-print(f'랜덤포레스트 활용한 검증 정확도 {None}')
-print(f'나이브베이즈 활용한 검증 정확도 {None}')
-print(f'KNN 활용한 검증 정확도 {None}')
-print(f'SVM 활용한 검증 정확도 {None}')
-'''
+
+logger = logging.getLogger("titanic_controller")
+
 class TitanicController:
 
     service = TitanicService()
@@ -28,11 +26,11 @@ class TitanicController:
         this = self.preprocess(train, test)
         this.label = service.create_label(this)
         this.train = service.crate_train(this)
-        print(f'결정트리 활용한 검증 정확도 {service.accuracy_by_dtree(this)}')
-        print(f'랜덤포레스트 활용한 검증 정확도 {service.accuracy_by_rforest(this)}')
-        print(f'나이브베이즈 활용한 검증 정확도 {service.accuracy_by_nb(this)}')
-        print(f'KNN 활용한 검증 정확도 {service.accuracy_by_knn(this)}')
-        print(f'SVM 활용한 검증 정확도 {service.accuracy_by_svm(this)}')
+        logger.debug(f'결정트리 활용한 검증 정확도 {service.accuracy_by_dtree(this)}')
+        logger.debug(f'랜덤포레스트 활용한 검증 정확도 {service.accuracy_by_rforest(this)}')
+        logger.debug(f'나이브베이즈 활용한 검증 정확도 {service.accuracy_by_nb(this)}')
+        logger.debug(f'KNN 활용한 검증 정확도 {service.accuracy_by_knn(this)}')
+        logger.debug(f'SVM 활용한 검증 정확도 {service.accuracy_by_svm(this)}')
         
 
     def submit(self, train, test):
@@ -9,6 +9,9 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.naive_bayes import GaussianNB
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.svm import SVC
+import logging
+
+logger = logging.getLogger("titanic_service")
 """
 PassengerId  고객ID,
 Survived 생존여부,
@@ -22,12 +25,6 @@ Ticket 티켓번호,
 Fare 요금,
 Cabin 객실번호,
 Embarked 승선한 항구명 C = 쉐브루, Q = 퀸즈타운, S = 사우스햄튼
-
-print(f'결정트리 활용한 검증 정확도 {None}')
-print(f'랜덤포레스트 활용한 검증 정확도 {None}')
-print(f'나이브베이즈 활용한 검증 정확도 {None}')
-print(f'KNN 활용한 검증 정확도 {None}')
-print(f'SVM 활용한 검증 정확도 {None}')
 """
 class TitanicService:
     def __init__(self):
@@ -38,7 +35,7 @@ class TitanicService:
         return pd.read_csv(self.context + fname)
     
     def preprocess(self, train_fname: str, test_fname: str) -> dict:
-        print("-------- 모델 전처리 시작 --------")
+        logger.debug("-------- 모델 전처리 시작 --------")
         # Load data
         train_df = self.load_data(train_fname)
         test_df = self.load_data(test_fname)
@@ -205,16 +202,15 @@ class TitanicService:
     
     
     def _print_data_info(self, train_df: pd.DataFrame, test_df: pd.DataFrame) -> None:
-        print('*' * 100)
-        print(f'1. Train type: {type(train_df)}')
-        print(f'2. Train columns: {train_df.columns}')
-        print(f'3. Train head:\n{train_df.head()}')
-        print(f'4. Train null counts:\n{train_df.isnull().sum()}')
-        print(f'5. Test type: {type(test_df)}')
-        print(f'6. Test columns: {test_df.columns}')
-        print(f'7. Test head:\n{test_df.head()}')
-        print(f'8. Test null counts:\n{test_df.isnull().sum()}')
-        print('*' * 100)
+        # DataFrame 을 문자열로 만드는 비용이 커서 DEBUG 가 꺼져 있으면 건너뜀
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(
+            "1. Train type: %s\n2. Train columns: %s\n3. Train head:\n%s\n4. Train null counts:\n%s\n"
+            "5. Test type: %s\n6. Test columns: %s\n7. Test head:\n%s\n8. Test null counts:\n%s",
+            type(train_df), train_df.columns, train_df.head(), train_df.isnull().sum(),
+            type(test_df), test_df.columns, test_df.head(), test_df.isnull().sum(),
+        )
 
 
 
@@ -0,0 +1,156 @@
+"""
+구조화(JSON) 로깅과 비동기 출력
+
+게이트웨이와 각 서비스가 같은 파일을 복사해서 사용한다. (서비스마다 빌드 컨텍스트가 분리되어 있음)
+요청을 처리하는 스레드는 QueueHandler 로 레코드를 큐에 넣기만 하고,
+포맷팅과 stdout 출력은 백그라운드 QueueListener 스레드가 담당한다.
+
+- LOG_LEVEL: 루트 로그 레벨 (기본값 INFO)
+- LOG_LEVELS: 로거별 레벨 (예: "service_proxy=DEBUG,httpx=WARNING")
+- LOG_FORMAT: json | text (기본값 json)
+- LOG_DEBUG_SAMPLE_RATE: 요청 처리 중 DEBUG 로그를 남길 요청 비율 0~1 (기본값 0.01)
+  트레이스 ID 로 결정하므로 같은 요청은 게이트웨이와 하위 서비스에서 함께 샘플링된다.
+"""
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+import time
+
+from app.foundation.core.tracing import current_span
+
+# LogRecord 기본 속성 (나머지는 extra 로 넘긴 필드로 보고 JSON 에 포함)
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# uvicorn 이 직접 stdout 에 쓰는 로거도 큐를 거치도록 루트로 전달
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드를 한 줄 JSON 으로 변환 (서비스, 트레이스 ID, extra 필드 포함)"""
+
+    def __init__(self, service: str):
+        super().__init__()
+        self.service = service
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "service": self.service,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry.setdefault(key, value)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ContextQueueHandler(QueueHandler):
+    """호출 스레드에서만 알 수 있는 값(메시지, 트레이스 ID, 예외 스택)만 채워서 큐에 넣는 핸들러"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        span = current_span()
+        if span is not None and not hasattr(record, "trace_id"):
+            record.trace_id = span.context.trace_id
+            record.span_id = span.context.span_id
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # 트레이스백 객체는 다른 스레드로 넘기지 않고 문자열로 변환
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class DebugSamplingFilter(logging.Filter):
+    """요청 처리 중 DEBUG 레코드는 샘플링된 요청(트레이스 ID 기준)의 것만 통과"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = min(1.0, max(0.0, rate))
+        self.threshold = int(self.rate * 0xFFFFFFFF)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.INFO or self.rate >= 1.0:
+            return True
+        span = current_span()
+        if span is None:
+            # 요청 밖(시작/종료, 백그라운드 작업)의 DEBUG 는 핫패스가 아니므로 그대로 남김
+            return True
+        return int(span.context.trace_id[:8], 16) < self.threshold
+
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    """"name=LEVEL,..." 형식의 로거별 레벨 파싱"""
+    levels = {}
+    for item in spec.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(service: str, stream=None) -> QueueHandler:
+    """루트 로거를 큐 핸들러로 교체하고 출력 리스너 스레드를 시작 (다시 호출하면 설정을 교체)
+
+    Args:
+        service (str): 로그에 기록할 서비스 이름
+        stream (optional): 출력 대상. 기본값은 sys.stdout.
+
+    Returns:
+        QueueHandler: 루트 로거에 등록된 핸들러
+    """
+    global _listener
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    if os.getenv("LOG_FORMAT", "json").lower() == "text":
+        output.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    else:
+        output.setFormatter(JsonFormatter(service))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = ContextQueueHandler(log_queue)
+    handler.addFilter(DebugSamplingFilter(float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.01"))))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        # 이전 설정의 큐 핸들러와 basicConfig 가 붙인 stdout 핸들러만 교체
+        if isinstance(existing, ContextQueueHandler) or type(existing) is logging.StreamHandler:
+            root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+    for name, level in parse_levels(os.getenv("LOG_LEVELS", "")).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return handler
+
+
+def shutdown_logging():
+    """큐에 남은 레코드를 모두 출력하고 리스너 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)